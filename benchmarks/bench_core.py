@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111,W0212,W0613,W0621
+import os
+
+import pytest
+
+import envitro
+from envitro import core
+
+
+@pytest.fixture(scope='module', autouse=True)
+def variables(environment):
+    os.environ['BENCH_STR'] = '  hello world  '
+    os.environ['BENCH_BOOL'] = ' True '
+    os.environ['BENCH_INT'] = ' 12345 '
+    os.environ['BENCH_FLOAT'] = ' 123.45 '
+    os.environ['BENCH_LIST'] = 'item1, item2, item3, item4'
+    os.environ['BENCH_FALLBACK_3'] = 'fallback'
+    yield
+    for name in ('BENCH_STR', 'BENCH_BOOL', 'BENCH_INT', 'BENCH_FLOAT', 'BENCH_LIST', 'BENCH_FALLBACK_3'):
+        del os.environ[name]
+
+
+FALLBACK = ['BENCH_FALLBACK_1', 'BENCH_FALLBACK_2', 'BENCH_FALLBACK_3']
+
+
+def test_baseline_environ_get(benchmark):
+    assert benchmark(os.environ.get, 'BENCH_STR') == '  hello world  '
+
+
+def test_baseline_environ_get_fallback(benchmark):
+    def lookup():
+        for name in ['BENCH_MISSING'] + FALLBACK:
+            value = os.environ.get(name)
+            if value is not None:
+                return value
+    assert benchmark(lookup) == 'fallback'
+
+
+def test_read(benchmark):
+    assert benchmark(envitro.read, 'BENCH_STR') == '  hello world  '
+
+
+def test_read_fallback(benchmark):
+    assert benchmark(envitro.read, 'BENCH_MISSING', fallback=FALLBACK) == 'fallback'
+
+
+def test_read_default(benchmark):
+    assert benchmark(envitro.read, 'BENCH_MISSING', 'default') == 'default'
+
+
+def test_plan_fallback(benchmark):
+    plan = envitro.plan('BENCH_MISSING', FALLBACK)
+    assert benchmark(plan.read) == 'fallback'
+
+
+@pytest.mark.parametrize('getter, name, expected', [
+    (envitro.str, 'BENCH_STR', 'hello world'),
+    (envitro.bool, 'BENCH_BOOL', True),
+    (envitro.int, 'BENCH_INT', 12345),
+    (envitro.float, 'BENCH_FLOAT', 123.45),
+    (envitro.list, 'BENCH_LIST', ['item1', 'item2', 'item3', 'item4']),
+    (envitro.tuple, 'BENCH_LIST', ('item1', 'item2', 'item3', 'item4')),
+], ids=lambda value: getattr(value, '__name__', None))
+def test_getter(benchmark, getter, name, expected):
+    assert benchmark(getter, name) == expected
+
+
+def test_snapshot_int(benchmark):
+    snapshot = envitro.Snapshot()
+    assert benchmark(snapshot.int, 'BENCH_INT') == 12345
+
+
+@pytest.mark.parametrize('size', [10, 1000, 10000])
+def test_str_to_list(benchmark, size):
+    value = ', '.join('item{0}'.format(index) for index in range(size))
+    assert len(benchmark(core._str_to_list, value, ',')) == size
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111,W0613,W0621
+import os
+
+import pytest
+
+import envitro
+
+
+@pytest.fixture(scope='module', autouse=True)
+def variables(environment):
+    os.environ['BENCH_FLAG'] = 'true'
+    yield
+    del os.environ['BENCH_FLAG']
+
+
+def _func():
+    return 1
+
+
+def test_baseline_call(benchmark):
+    assert benchmark(_func) == 1
+
+
+def test_isset(benchmark):
+    assert benchmark(envitro.decorators.isset('BENCH_FLAG')(_func)) == 1
+
+
+def test_bool(benchmark):
+    assert benchmark(envitro.decorators.bool('BENCH_FLAG')(_func)) == 1
+
+
+def test_write(benchmark):
+    assert benchmark(envitro.decorators.write('BENCH_WRITE', 'value')(_func)) == 1
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111,W0212,W0613,W0621
+import pytest
+
+import envitro
+from envitro import docker
+
+
+@pytest.fixture(scope='module', autouse=True)
+def variables(environment):
+    envitro.write('BENCH_DB_PORT', 'tcp://172.17.0.82:5432')
+    yield
+    envitro.write('BENCH_DB_PORT', None)
+
+
+def test_split_docker_link(benchmark):
+    assert benchmark(docker._split_docker_link, 'BENCH_DB') == ['tcp', '172.17.0.82', '5432']
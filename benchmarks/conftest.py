@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111,W0621
+import os
+
+import pytest
+
+# number of synthetic variables in the environment, override with ENVITRO_BENCH_SIZES=10,1000
+ENVIRONMENT_SIZES = [int(size) for size in os.environ.get('ENVITRO_BENCH_SIZES', '10,1000,100000').split(',')]
+
+
+@pytest.fixture(scope='session', params=ENVIRONMENT_SIZES, ids=lambda size: 'env{0}'.format(size))
+def environment(request):
+    """Pad os.environ with synthetic variables."""
+    names = ['BENCH_SYNTHETIC_{0}'.format(index) for index in range(request.param)]
+    for name in names:
+        os.environ[name] = 'synthetic'
+    yield request.param
+    for name in names:
+        del os.environ[name]
@@ -1,8 +1,49 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=C0111,W0401,W0622
-from __future__ import absolute_import
+import sys as _sys
 
-from . import decorators
+from . import core as _core
 from .core import *
+from .core import builtins as _builtins
+
+# imported by the star import above, not part of the API
+del builtins
 
 __version__ = '0.5.0'
+
+# submodules are imported on first access, ``import envitro`` only loads the core getters
+_SUBMODULES = _builtins.frozenset([
+    'casters', 'decorators', 'docker', 'dotenv', 'lazy', 'metrics', 'prefix', 'recorder', 'schema', 'secrets',
+    'snapshot', 'sources', 'validators',
+])
+_ATTRIBUTES = {
+    'prefixed': 'prefix',
+    'Snapshot': 'snapshot',
+}
+
+
+def __getattr__(name):
+    import importlib
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module('.' + _ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(_builtins.set(globals()) | _SUBMODULES | _builtins.set(_ATTRIBUTES))
+
+
+# interpreters without module level __getattr__ (PEP 562) import everything up front
+if _sys.version_info < (3, 7):
+    for _name in sorted(_SUBMODULES) + sorted(_ATTRIBUTES):
+        globals()[_name] = __getattr__(_name)
+
+# ENVITRO_RECORD is 'json' or a boolean (see envitro.recorder), '0' and 'false' don't record
+_record_json = _core.environ.get('ENVITRO_RECORD', '').strip().lower() == 'json'
+if _record_json or _core.bool('ENVITRO_RECORD', allow_none=True):
+    __getattr__('recorder').record_startup('json' if _record_json else None, _core.environ.get('ENVITRO_RECORD_FILE'),
+                                           _core.int('ENVITRO_RECORD_LIMIT', allow_none=True))
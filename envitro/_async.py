@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""Coroutine support for the decorators (python 3.5+ syntax)."""
+from __future__ import absolute_import
+
+import functools
+
+
+def wrap(func, context):
+    """Wrap a coroutine function so the whole coroutine runs inside the context."""
+    @functools.wraps(func)
+    async def _decorator(*args, **kwargs):
+        with context():
+            return await func(*args, **kwargs)
+    return _decorator
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Custom value types for environment variables.
+
+A caster converts a raw environment value into a python object. Registering a
+caster returns a getter with the same ``default``/``allow_none``/``fallback``
+semantics as the core getters. Parsed values are memoized per raw value in a
+bounded cache, so the same raw value is never parsed twice.
+
+Registered casters can also be used by :class:`envitro.schema.Field`.
+
+Examples:
+    >>> import datetime
+    >>> seconds = envitro.casters.register('seconds', lambda raw: datetime.timedelta(seconds=float(raw)))
+    >>> seconds('TIMEOUT', '2.5')
+    datetime.timedelta(seconds=2, microseconds=500000)
+    >>> envitro.casters.bytesize('CACHE_SIZE', '512MiB')
+    536870912
+"""
+from __future__ import absolute_import
+
+import collections
+import decimal as _decimal
+import re
+import threading
+
+from . import core
+
+try:
+    string_types = (str, unicode)  # pylint: disable=E0602
+except NameError:
+    string_types = (str, )
+
+# the casters that ship with the core getters can't be replaced
+_BUILTIN = frozenset(core._CASTERS)
+
+
+class Caster(object):
+    """A value caster with a bounded memo cache.
+
+    Calling the caster has the same signature as the core casters: raw string
+    values are parsed (whitespace-stripped, and memoized), values that are
+    already typed (ex: defaults) are returned as-is.
+
+    Args:
+        name: The caster name
+        func: A callable converting a whitespace-stripped raw string
+        maxsize: The number of parsed values to remember
+    """
+    __slots__ = ('name', 'func', 'maxsize', '_cache', '_lock')
+
+    def __init__(self, name, func, maxsize=256):
+        self.name = name
+        self.func = func
+        self.maxsize = maxsize
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, raw_value):
+        """Parse a raw string value, using the memo cache.
+
+        Args:
+            raw_value: The raw environment value
+        """
+        cache = self._cache
+        with self._lock:
+            if raw_value in cache:
+                value = cache.pop(raw_value)
+                cache[raw_value] = value
+                return value
+
+        value = self.func(raw_value.strip())
+        if self.maxsize > 0:
+            with self._lock:
+                cache[raw_value] = value
+                while len(cache) > self.maxsize:
+                    cache.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop every memoized value."""
+        with self._lock:
+            self._cache.clear()
+
+    def __call__(self, value, allow_none):
+        if value is None and allow_none:
+            return None
+        elif isinstance(value, string_types):
+            return self.parse(value)
+        else:
+            return value
+
+    def __repr__(self):
+        return 'Caster({0!r})'.format(self.name)
+
+
+def _make_getter(caster):
+    def getter(name, default=None, allow_none=False, fallback=None):
+        if core._observers:
+            return core._observe(caster.name, caster, name, default, allow_none, fallback)
+        return caster(core.read(name, default, allow_none, fallback=fallback), allow_none)
+
+    getter.__name__ = caster.name
+    getter.__doc__ = """Get a ``{0}`` environment value or the default.
+
+    Args:
+        name: The environment variable name
+        default: The default value to use if no environment variable is found
+        allow_none: If the return value can be `None` (i.e. optional)
+        fallback: A list of fallback env variables to try and read if the primary environment
+                  variable is unavailable.
+    """.format(caster.name)
+    getter.caster = caster
+    return getter
+
+
+_getters = {}
+
+
+def register(name, func, maxsize=256):
+    """Register a caster and return its getter.
+
+    Registering a name again replaces the previous caster.
+
+    Args:
+        name: The caster name (ex: ``'decimal'``)
+        func: A callable converting a whitespace-stripped raw string
+        maxsize: The number of parsed values to remember (0 disables the memo cache)
+
+    Returns:
+        A getter function: ``getter(name, default=None, allow_none=False, fallback=None)``
+    """
+    if name in _BUILTIN:
+        raise ValueError('The "{0}" caster is built in and can\'t be replaced'.format(name))
+
+    caster = Caster(name, func, maxsize)
+    core._CASTERS[name] = caster
+    _getters[name] = _make_getter(caster)
+    return _getters[name]
+
+
+def unregister(name):
+    """Remove a registered caster.
+
+    Args:
+        name: The caster name
+    """
+    if name in _BUILTIN:
+        raise ValueError('The "{0}" caster is built in and can\'t be removed'.format(name))
+    del _getters[name]
+    del core._CASTERS[name]
+
+
+def getter(name):
+    """Return the getter of a registered caster.
+
+    Args:
+        name: The caster name
+    """
+    return _getters[name]
+
+
+_BYTESIZE_PATTERN = re.compile(r'^(?P<number>\d+(?:\.\d+)?)\s*(?P<unit>[kmgtpe]?)(?P<binary>i?)b?$', re.IGNORECASE)
+
+
+def _to_bytesize(raw_value):
+    match = _BYTESIZE_PATTERN.match(raw_value)
+    if match is None:
+        raise ValueError('Invalid byte size: {0}'.format(raw_value))
+    base = 1024 if match.group('binary') else 1000
+    exponent = ' kmgtpe'.index(match.group('unit').lower() or ' ')
+    return int(_decimal.Decimal(match.group('number')) * base ** exponent)
+
+
+def _to_decimal(raw_value):
+    try:
+        return _decimal.Decimal(raw_value)
+    except _decimal.InvalidOperation:
+        raise ValueError('Invalid decimal: {0}'.format(raw_value))
+
+
+decimal = register('decimal', _to_decimal)
+bytesize = register('bytesize', _to_bytesize)
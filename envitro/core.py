@@ -11,9 +11,106 @@ try:
 except ImportError:
     import __builtin__ as builtins
 
-import warnings
+# text values can be ``unicode`` on python 2 (ex: read from a file)
+try:
+    _string_types = (builtins.str, builtins.unicode)
+except AttributeError:
+    _string_types = (builtins.str, )
+
+# ``array``, ``collections``, ``threading``, ``time`` and ``warnings`` are imported where they are
+# used, ``import envitro`` only pays for what every getter needs
 from os import environ
 
+try:
+    import contextvars as _contextvars
+except ImportError:
+    _contextvars = None
+
+# ``types.MappingProxyType`` without importing ``types``, python 2 can't create dictproxy instances
+_MappingProxyType = type(type.__dict__)
+try:
+    _MappingProxyType({})
+except TypeError:
+    _MappingProxyType = None
+
+# parsed ``dict`` values keyed by raw value and parsing options
+_DICT_CACHE_SIZE = 128
+_dicts = {}
+
+# decoded ``json`` values keyed by raw value, and the decoder set with ``use_json_loads``
+_JSON_CACHE_SIZE = 64
+_jsons = {}
+_json_loads = None
+_NOT_CACHED = object()
+
+# a provider chain replacing ``os.environ`` and the sources, see ``use_chain``
+_chain = None
+
+# callables invoked with the variable name whenever ``write`` changes a value
+_write_hooks = []
+
+# plans, keyed by variable name and fallback chain
+_plans = {}
+
+# additional mappings consulted, in order, for variables missing from ``os.environ``
+_sources = []
+
+# callables invoked with an ``_Access`` record after every getter call, see ``_observe``
+_observers = []
+
+# how a getter call was resolved: the getter and variable names, the alias that was found
+# (or `None`), the source ('env', 'fallback', 'default' or 'missing'), the total and parsing
+# durations in seconds and the raised exception (or `None`), a namedtuple created by ``_report``
+_Access = None
+
+
+def _timer():
+    """Return the time in seconds, for durations (replaced by the ``time`` function on first use)."""
+    global _timer  # pylint: disable=W0603,C0103
+    import time
+    _timer = getattr(time, 'perf_counter', time.time)
+    return _timer()
+
+
+class _ReadOnlyDict(builtins.dict):
+    """A minimal ``types.MappingProxyType`` stand-in for interpreters without it."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('{0!r} object does not support item assignment'.format(type(self).__name__))
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+# read-only mappings handed out by the ``dict`` and ``json`` getters, they are cached and shared
+if _MappingProxyType is None:
+    _MappingProxyType = _ReadOnlyDict
+
+# per-context overrides consulted before ``os.environ``, a ``None`` value hides the variable
+if _contextvars is not None:
+    _overlay = _contextvars.ContextVar('envitro_overlay', default=None)
+else:
+    import threading as _threading
+
+    class _ThreadLocalVar(_threading.local):
+        """A minimal ``contextvars.ContextVar`` stand-in for interpreters without it."""
+
+        value = None
+
+        def get(self):
+            return self.value
+
+        def set(self, value):
+            token = self.value
+            self.value = value
+            return token
+
+        def reset(self, token):
+            self.value = token
+
+    _overlay = _ThreadLocalVar()
+
 
 def _strtobool(val):
     """Convert a string representation of truth to true (1) or false (0).
@@ -31,23 +128,198 @@ def _strtobool(val):
         raise ValueError('Invalid truth value: {0}'.format(val))
 
 
+def _split(value, separator):
+    """Split a string on a separator string or a compiled regular expression."""
+    if isinstance(separator, _string_types):
+        return value.split(separator)
+    return separator.split(value)
+
+
 def _str_to_list(value, separator):
     """Convert a string to a list with sanitization."""
-    value_list = [item.strip() for item in value.split(separator)]
-    value_list_sanitized = builtins.list(filter(None, value_list))
+    value_list_sanitized = [item for item in [part.strip() for part in _split(value, separator) if part] if item]
     if len(value_list_sanitized) > 0:
         return value_list_sanitized
     else:
         raise ValueError('Invalid list variable.')
 
 
+def _iter_str_list(value, separator):
+    """Yield the sanitized items of a string one at a time, without building the list."""
+    found = False
+    if isinstance(separator, _string_types):
+        if not separator:
+            raise ValueError('empty separator')
+        start = 0
+        while start >= 0:
+            end = value.find(separator, start)
+            item = (value[start:end] if end >= 0 else value[start:]).strip()
+            start = end if end < 0 else end + len(separator)
+            if item:
+                found = True
+                yield item
+    else:
+        for item in separator.split(value):
+            item = item.strip() if item else item
+            if item:
+                found = True
+                yield item
+
+    if not found:
+        raise ValueError('Invalid list variable.')
+
+
+def _fallback_names(fallback):
+    """Normalize a fallback argument into a tuple of variable names."""
+    if fallback is None:
+        return ()
+    elif isinstance(fallback, (builtins.list, builtins.tuple)):
+        return builtins.tuple(fallback)
+    else:
+        return (fallback, )
+
+
+def _get(name):
+    """Get the raw value from the overlay, ``os.environ`` or the first source that has it."""
+    overlay = _overlay.get()
+    if overlay is not None and name in overlay:
+        return overlay[name]
+
+    if _chain is not None:
+        return _chain.get(name)
+
+    raw_value = environ.get(name)
+    if raw_value is None and _sources:
+        for source in _sources:
+            raw_value = source.get(name)
+            if raw_value is not None:
+                break
+    return raw_value
+
+
+def _prefetch(names):
+    """Let the sources that support it load several variables at once."""
+    for source in (_chain, ) if _chain is not None else _sources:
+        prefetch = getattr(source, 'prefetch', None)
+        if prefetch is not None:
+            prefetch(names)
+
+
+def _changed(names):
+    """Notify the write hooks that the given variables have changed.
+
+    Every hook runs even if one fails, the first error is raised afterwards.
+    """
+    error = None
+    for name in names:
+        for hook in _write_hooks:
+            try:
+                hook(name)
+            except Exception as err:  # pylint: disable=W0703
+                error = error or err
+    if error is not None:
+        raise error
+
+
+def add_source(source):
+    """Add a source of variables that are missing from ``os.environ``.
+
+    Sources are consulted in the order they were added, after ``os.environ``.
+
+    Args:
+        source: A mapping (or any object with a ``get`` method) of variable names to raw values
+    """
+    _sources.append(source)
+    _changed(source.keys() if hasattr(source, 'keys') else ())
+
+
+def remove_source(source):
+    """Remove a source previously added with :func:`add_source`.
+
+    Args:
+        source: The source to remove
+    """
+    _sources.remove(source)
+    _changed(source.keys() if hasattr(source, 'keys') else ())
+
+
+def use_chain(chain):
+    """Resolve every variable through a provider chain instead of ``os.environ``.
+
+    The chain decides the precedence of the process environment and of the
+    other providers (see :class:`envitro.sources.Chain`); the sources added
+    with :func:`add_source` are not consulted while a chain is in use.
+    Context overrides still take precedence.
+
+    Args:
+        chain: The chain (any object with a ``get`` method), or `None` to read ``os.environ`` again
+    """
+    global _chain  # pylint: disable=W0603
+    _chain = chain
+    _changed(())
+
+
+def use_json_loads(loads):
+    """Decode the :func:`json` values with another function, ex: ``orjson.loads``.
+
+    The standard library decodes them by default. Faster decoders don't always
+    accept the same documents: orjson rejects ``NaN`` and ``Infinity`` and
+    decodes integers above 64 bits as floats.
+
+    Args:
+        loads: The function decoding a JSON string, or `None` to use the standard library again
+    """
+    global _json_loads  # pylint: disable=W0603
+    _json_loads = loads
+    _jsons.clear()
+
+
+class _Override(object):
+    """The context manager returned by :func:`override`."""
+    __slots__ = ('overlay', 'token')
+
+    def __init__(self, overlay):
+        self.overlay = overlay
+        self.token = None
+
+    def __enter__(self):
+        self.token = _overlay.set(self.overlay)
+
+    def __exit__(self, *exc_info):
+        _overlay.reset(self.token)
+
+
+def override(values=None, **kwargs):
+    """Override environment variables for the current context only.
+
+    The overrides are only visible to the envitro getters running in the
+    current thread or asyncio task (or the current thread on interpreters
+    without ``contextvars``), ``os.environ`` isn't modified. Overrides can be
+    nested. A ``None`` value hides the variable.
+
+    Args:
+        values: A mapping of environment variable names to values
+        kwargs: Environment variable names and values
+
+    Examples:
+        >>> with envitro.override(FEATURE_X='true'):
+        ...     envitro.bool('FEATURE_X')
+        True
+    """
+    overlay = builtins.dict(_overlay.get() or {})
+    for mapping in (values or {}, kwargs):
+        for name, value in mapping.items():
+            overlay[name] = None if value is None else builtins.str(value)
+    return _Override(overlay)
+
+
 def isset(name):
     """Return a boolean if the environment variable is set or not.
 
     Args:
         name: The environment variable name
     """
-    return True if environ.get(name) else False
+    return True if _get(name) else False
 
 
 def write(name, value):
@@ -63,9 +335,14 @@ def write(name, value):
         environ[name] = builtins.str(value)
     elif environ.get(name):
         del environ[name]
+    else:
+        return
+
+    _changed((name, ))
 
 
 def set(name, value):
+    import warnings
     warnings.warn('Will be removed in v1.0', DeprecationWarning, stacklevel=2)
     write(name, value)
 
@@ -83,16 +360,24 @@ def read(name, default=None, allow_none=False, fallback=None):
         fallback: A list of fallback env variables to try and read if the primary environment
                   variable is unavailable.
     """
-    raw_value = environ.get(name)
+    if _observers:
+        return _observe('read', None, name, default, allow_none, fallback)
+
+    raw_value = _get(name)
     if raw_value is None and fallback is not None:
         if not isinstance(fallback, builtins.list) and not isinstance(fallback, builtins.tuple):
             fallback = [fallback]
 
         for fall in fallback:
-            raw_value = environ.get(fall)
+            raw_value = _get(fall)
             if raw_value is not None:
                 break
 
+    return _or_default(raw_value, name, default, allow_none)
+
+
+def _or_default(raw_value, name, default, allow_none):
+    """Return the raw value if it was found, otherwise the default."""
     if raw_value or raw_value == '':
         return raw_value
     elif default is not None or allow_none:
@@ -101,11 +386,354 @@ def read(name, default=None, allow_none=False, fallback=None):
         raise KeyError('Set the "{0}" environment variable'.format(name))
 
 
+def _missing_error(names):
+    """Build a single error listing every missing environment variable."""
+    return KeyError('Set the {0} environment variable(s)'.format(
+        ', '.join('"{0}"'.format(name) for name in names)))
+
+
+def _read_many(getter, caster, names, allow_none, fallback, **options):
+    """Resolve several variables in one pass, collecting every missing one."""
+    if not hasattr(names, 'items'):
+        names = builtins.dict.fromkeys(names)
+    fallback = fallback or {}
+    get = _get
+    if _sources or _chain is not None:
+        _prefetch(builtins.list(names) + [fall for chain in fallback.values() for fall in _fallback_names(chain)])
+
+    values = {}
+    missing = []
+    observed = builtins.bool(_observers)
+    for name, default in names.items():
+        if observed:
+            try:
+                values[name] = _observe(getter, caster, name, default, allow_none, fallback.get(name), **options)
+            except KeyError:
+                missing.append(name)
+            continue
+
+        raw_value = get(name)
+        if raw_value is None:
+            for fall in _fallback_names(fallback.get(name)):
+                raw_value = get(fall)
+                if raw_value is not None:
+                    break
+
+        try:
+            value = _or_default(raw_value, name, default, allow_none)
+        except KeyError:
+            missing.append(name)
+            continue
+        values[name] = value if caster is None else caster(value, allow_none, **options)
+
+    if missing:
+        raise _missing_error(sorted(missing))
+    return values
+
+
+def read_many(names, allow_none=False, fallback=None):
+    """Read several raw env values at once.
+
+    Every variable is resolved before any error is raised, so a single
+    ``KeyError`` lists all the missing variables.
+
+    Args:
+        names: A mapping of environment variable names to their default, or a list of
+               names that are all required.
+        allow_none: If the returned values can be `None` (i.e. optional)
+        fallback: A mapping of environment variable names to their fallback env variables.
+
+    Returns:
+        A dict of environment variable names to raw values.
+    """
+    return _read_many('read_many', None, names, allow_none, fallback)
+
+
 def get(name, default=None, allow_none=False):
+    import warnings
     warnings.warn('Will be removed in v1.0', DeprecationWarning, stacklevel=2)
     return read(name, default, allow_none)
 
 
+def _observe(getter, caster, name, default, allow_none, fallback, **options):
+    """Resolve a getter call like ``read`` and a caster would, reporting it to the observers."""
+    start = _timer()
+    alias = None
+    raw_value = None
+    for candidate in (name, ) + _fallback_names(fallback):
+        raw_value = _get(candidate)
+        if raw_value is not None:
+            alias = candidate
+            break
+    return _observe_value(getter, caster, name, alias, raw_value, default, allow_none, start, **options)
+
+
+def _observe_value(getter, caster, name, alias, raw_value, default, allow_none, start, **options):
+    """Apply the default and the caster to a resolved raw value, reporting it to the observers."""
+    parse_start = None
+    error = None
+    try:
+        value = _or_default(raw_value, name, default, allow_none)
+        if caster is not None:
+            parse_start = _timer()
+            value = caster(value, allow_none, **options)
+        return value
+    except Exception as err:
+        error = err
+        raise
+    finally:
+        _report(getter, name, alias, default, allow_none, start, parse_start, error)
+
+
+def _define_access():
+    global _Access  # pylint: disable=W0603
+    from collections import namedtuple
+    _Access = namedtuple('_Access', 'getter name alias source elapsed parse_time error')
+
+
+def _report(getter, name, alias, default, allow_none, start, parse_start, error):
+    """Call the observers with the ``_Access`` record of a resolved variable."""
+    end = _timer()
+    if alias is not None:
+        source = 'env' if alias == name else 'fallback'
+    else:
+        source = 'default' if default is not None or allow_none else 'missing'
+    parse_time = end - parse_start if parse_start is not None else 0.0
+    if _Access is None:
+        _define_access()
+    access = _Access(getter, name, alias, source, end - start, parse_time, error)
+    # observers can remove themselves (ex: a recorder reaching its limit)
+    for observer in _observers[:]:
+        observer(access)
+
+
+def _to_str(value, allow_none):
+    if value is None and allow_none:
+        return None
+    elif isinstance(value, _string_types):
+        return value.strip()
+    else:
+        return builtins.str(value).strip()
+
+
+def _to_bool(value, allow_none):
+    if isinstance(value, builtins.bool):
+        return value
+    elif isinstance(value, builtins.int):
+        return True if value > 0 else False
+    elif value is None and allow_none:
+        return None
+    else:
+        value_str = value if isinstance(value, _string_types) else builtins.str(value)
+        return _strtobool(value_str.lower().strip())
+
+
+def _to_int(value, allow_none):
+    if isinstance(value, _string_types):
+        value = value.strip()
+
+    if value is None and allow_none:
+        return None
+    else:
+        return builtins.int(value)
+
+
+def _to_float(value, allow_none):
+    if isinstance(value, _string_types):
+        value = value.strip()
+
+    if value is None and allow_none:
+        return None
+    else:
+        return builtins.float(value)
+
+
+def _to_list(value, allow_none, separator=','):
+    if isinstance(value, builtins.list):
+        return value
+    elif isinstance(value, _string_types):
+        return _str_to_list(value, separator)
+    elif value is None and allow_none:
+        return None
+    else:
+        return [builtins.str(value)]
+
+
+def _to_tuple(value, allow_none, separator=','):
+    try:
+        if isinstance(value, builtins.tuple):
+            return value
+        elif isinstance(value, _string_types):
+            return builtins.tuple(_str_to_list(value, separator))
+        elif value is None and allow_none:
+            return None
+        else:
+            return (builtins.str(value), )
+    except ValueError:
+        raise ValueError('Invalid tuple varible.')
+
+
+def _to_iter_list(value, allow_none, separator=','):
+    if isinstance(value, _string_types):
+        return _iter_str_list(value, separator)
+    elif value is None and allow_none:
+        return None
+    elif isinstance(value, (builtins.list, builtins.tuple, builtins.set, builtins.frozenset)):
+        return iter(value)
+    else:
+        return iter((builtins.str(value), ))
+
+
+def _to_frozenset(value, allow_none, separator=','):
+    try:
+        if isinstance(value, builtins.frozenset):
+            return value
+        elif isinstance(value, _string_types):
+            # strip every item once, the empty ones collapse into a single item dropped afterwards
+            items = builtins.frozenset([item.strip() for item in _split(value, separator) if item])
+            if '' in items:
+                items = items.difference(('', ))
+            if not items:
+                raise ValueError('Invalid set variable.')
+            return items
+        elif value is None and allow_none:
+            return None
+        elif isinstance(value, (builtins.list, builtins.tuple, builtins.set)):
+            return builtins.frozenset(value)
+        else:
+            return builtins.frozenset((builtins.str(value), ))
+    except ValueError:
+        raise ValueError('Invalid set variable.')
+
+
+def _to_array(value, allow_none, typecode='l', separator=','):
+    import array as _array
+    if isinstance(value, _array.array):
+        return value
+    elif isinstance(value, _string_types):
+        number = builtins.float if typecode in 'fd' else builtins.int
+        items = [item for item in _split(value, separator) if item.strip()]
+        try:
+            value_array = _array.array(typecode, builtins.map(number, items))
+        except OverflowError:
+            raise ValueError('Invalid array variable, out of range for typecode "{0}".'.format(typecode))
+        if len(value_array) > 0:
+            return value_array
+        else:
+            raise ValueError('Invalid array variable.')
+    elif value is None and allow_none:
+        return None
+    elif isinstance(value, (builtins.list, builtins.tuple)):
+        return _array.array(typecode, value)
+    else:
+        return _array.array(typecode, (value, ))
+
+
+def _to_ndarray(value, allow_none, dtype='int64', separator=','):
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('The ndarray getter requires NumPy (pip install envitro[numpy])')
+
+    if isinstance(value, numpy.ndarray):
+        return value
+    elif isinstance(value, _string_types):
+        # numpy parses the items itself, surrounding whitespace included
+        items = value.split(separator) if isinstance(separator, _string_types) else _str_to_list(value, separator)
+        try:
+            try:
+                return numpy.array(items, dtype=dtype)
+            except ValueError:
+                # skip the empty items (ex: a trailing separator) like lists do
+                items = [item for item in items if item.strip()]
+                if not items:
+                    raise ValueError('Invalid array variable.')
+                return numpy.array(items, dtype=dtype)
+        except OverflowError:
+            raise ValueError('Invalid array variable, out of range for dtype "{0}".'.format(dtype))
+    elif value is None and allow_none:
+        return None
+    else:
+        return numpy.array(value if isinstance(value, (builtins.list, builtins.tuple)) else [value], dtype=dtype)
+
+
+def _value_caster(value_cast):
+    """Return a callable converting a single raw string, accepting envitro getters as well."""
+    caster = _caster_for(value_cast)
+    if caster is not None:
+        return lambda raw_value: caster(raw_value, False)
+    return value_cast
+
+
+def _str_to_dict(value, item_separator, kv_separator, value_cast):
+    """Convert a string to a read-only mapping, memoized per raw value."""
+    key = (value, item_separator, kv_separator, value_cast)
+    mapping = _dicts.get(key)
+    if mapping is not None:
+        return mapping
+
+    cast = _value_caster(value_cast)
+    items = {}
+    for item in _str_to_list(value, item_separator):
+        item_key, found, item_value = item.partition(kv_separator)
+        item_key = item_key.strip()
+        if not found or not item_key:
+            raise ValueError('Invalid dict item: {0}'.format(item))
+        item_value = item_value.strip()
+        items[item_key] = item_value if cast is None else cast(item_value)
+
+    if len(_dicts) >= _DICT_CACHE_SIZE:
+        _dicts.clear()
+    mapping = _dicts[key] = _MappingProxyType(items)
+    return mapping
+
+
+def _to_dict(value, allow_none, item_separator=',', kv_separator='=', value_cast=None):
+    if isinstance(value, _MappingProxyType):
+        return value
+    elif isinstance(value, _string_types):
+        return _str_to_dict(value, item_separator, kv_separator, value_cast)
+    elif value is None and allow_none:
+        return None
+    else:
+        return _MappingProxyType(builtins.dict(value))
+
+
+def _freeze(value):
+    """Return a deeply immutable copy of a decoded JSON value."""
+    if isinstance(value, _MappingProxyType):
+        return value
+    elif isinstance(value, builtins.dict):
+        return _MappingProxyType(builtins.dict((key, _freeze(item)) for key, item in value.items()))
+    elif isinstance(value, (builtins.list, builtins.tuple)):
+        return builtins.tuple(_freeze(item) for item in value)
+    else:
+        return value
+
+
+def _loads(value):
+    """Decode JSON with the decoder set with :func:`use_json_loads`, the standard library otherwise."""
+    loads = _json_loads
+    if loads is None:
+        from json import loads
+    return loads(value)
+
+
+def _to_json(value, allow_none):
+    if isinstance(value, _string_types):
+        frozen = _jsons.get(value, _NOT_CACHED)
+        if frozen is _NOT_CACHED:
+            frozen = _freeze(_loads(value))
+            if len(_jsons) >= _JSON_CACHE_SIZE:
+                _jsons.clear()
+            _jsons[value] = frozen
+        return frozen
+    elif value is None and allow_none:
+        return None
+    else:
+        return _freeze(value)
+
+
 def str(name, default=None, allow_none=False, fallback=None):
     """Get a string based environment value or the default.
 
@@ -114,11 +742,9 @@ def str(name, default=None, allow_none=False, fallback=None):
         default: The default value to use if no environment variable is found
         allow_none: If the return value can be `None` (i.e. optional)
     """
-    value = read(name, default, allow_none, fallback=fallback)
-    if value is None and allow_none:
-        return None
-    else:
-        return builtins.str(value).strip()
+    if _observers:
+        return _observe('str', _to_str, name, default, allow_none, fallback)
+    return _to_str(read(name, default, allow_none, fallback=fallback), allow_none)
 
 
 def bool(name, default=None, allow_none=False, fallback=None):
@@ -129,16 +755,9 @@ def bool(name, default=None, allow_none=False, fallback=None):
         default: The default value to use if no environment variable is found
         allow_none: If the return value can be `None` (i.e. optional)
     """
-    value = read(name, default, allow_none, fallback=fallback)
-    if isinstance(value, builtins.bool):
-        return value
-    elif isinstance(value, builtins.int):
-        return True if value > 0 else False
-    elif value is None and allow_none:
-        return None
-    else:
-        value_str = builtins.str(value).lower().strip()
-        return _strtobool(value_str)
+    if _observers:
+        return _observe('bool', _to_bool, name, default, allow_none, fallback)
+    return _to_bool(read(name, default, allow_none, fallback=fallback), allow_none)
 
 
 def int(name, default=None, allow_none=False, fallback=None):
@@ -149,14 +768,9 @@ def int(name, default=None, allow_none=False, fallback=None):
         default: The default value to use if no environment variable is found
         allow_none: If the return value can be `None` (i.e. optional)
     """
-    value = read(name, default, allow_none, fallback=fallback)
-    if isinstance(value, builtins.str):
-        value = value.strip()
-
-    if value is None and allow_none:
-        return None
-    else:
-        return builtins.int(value)
+    if _observers:
+        return _observe('int', _to_int, name, default, allow_none, fallback)
+    return _to_int(read(name, default, allow_none, fallback=fallback), allow_none)
 
 
 def float(name, default=None, allow_none=False, fallback=None):
@@ -167,14 +781,9 @@ def float(name, default=None, allow_none=False, fallback=None):
         default: The default value to use if no environment variable is found
         allow_none: If the return value can be `None` (i.e. optional)
     """
-    value = read(name, default, allow_none, fallback=fallback)
-    if isinstance(value, builtins.str):
-        value = value.strip()
-
-    if value is None and allow_none:
-        return None
-    else:
-        return builtins.float(value)
+    if _observers:
+        return _observe('float', _to_float, name, default, allow_none, fallback)
+    return _to_float(read(name, default, allow_none, fallback=fallback), allow_none)
 
 
 def list(name, default=None, allow_none=False, fallback=None, separator=','):
@@ -186,17 +795,11 @@ def list(name, default=None, allow_none=False, fallback=None, separator=','):
         name: The environment variable name
         default: The default value to use if no environment variable is found
         allow_none: If the return value can be `None` (i.e. optional)
-        separator: The list item separator character or pattern
+        separator: The list item separator string or compiled regular expression
     """
-    value = read(name, default, allow_none, fallback=fallback)
-    if isinstance(value, builtins.list):
-        return value
-    elif isinstance(value, builtins.str):
-        return _str_to_list(value, separator)
-    elif value is None and allow_none:
-        return None
-    else:
-        return [builtins.str(value)]
+    if _observers:
+        return _observe('list', _to_list, name, default, allow_none, fallback, separator=separator)
+    return _to_list(read(name, default, allow_none, fallback=fallback), allow_none, separator)
 
 
 def tuple(name, default=None, allow_none=False, fallback=None, separator=','):
@@ -208,17 +811,280 @@ def tuple(name, default=None, allow_none=False, fallback=None, separator=','):
         name: The environment variable name
         default: The default value to use if no environment variable is found
         allow_none: If the return value can be `None` (i.e. optional)
-        separator: The list item separator character or pattern
+        separator: The list item separator string or compiled regular expression
     """
-    try:
-        value = read(name, default, allow_none, fallback=fallback)
-        if isinstance(value, builtins.tuple):
-            return value
-        elif isinstance(value, builtins.str):
-            return builtins.tuple(_str_to_list(value, separator))
-        elif value is None and allow_none:
-            return None
-        else:
-            return (builtins.str(value), )
-    except ValueError:
-        raise ValueError('Invalid tuple varible.')
+    if _observers:
+        return _observe('tuple', _to_tuple, name, default, allow_none, fallback, separator=separator)
+    return _to_tuple(read(name, default, allow_none, fallback=fallback), allow_none, separator)
+
+
+def iter_list(name, default=None, allow_none=False, fallback=None, separator=','):
+    """Iterate over the items of a list environment value or the default.
+
+    The items are split and whitespace-stripped one at a time, which avoids
+    building large lists that are only scanned once. An empty value raises a
+    ``ValueError`` once the iterator is exhausted.
+
+    Args:
+        name: The environment variable name
+        default: The default value to use if no environment variable is found
+        allow_none: If the return value can be `None` (i.e. optional)
+        separator: The list item separator string or compiled regular expression
+    """
+    if _observers:
+        return _observe('iter_list', _to_iter_list, name, default, allow_none, fallback, separator=separator)
+    return _to_iter_list(read(name, default, allow_none, fallback=fallback), allow_none, separator)
+
+
+def frozenset(name, default=None, allow_none=False, fallback=None, separator=','):
+    """Get a frozenset of strings or the default, for fast membership tests.
+
+    The individual set elements are whitespace-stripped.
+
+    Args:
+        name: The environment variable name
+        default: The default value to use if no environment variable is found
+        allow_none: If the return value can be `None` (i.e. optional)
+        separator: The set item separator string or compiled regular expression
+    """
+    if _observers:
+        return _observe('frozenset', _to_frozenset, name, default, allow_none, fallback, separator=separator)
+    return _to_frozenset(read(name, default, allow_none, fallback=fallback), allow_none, separator)
+
+
+def array(name, default=None, allow_none=False, fallback=None, typecode='l', separator=','):
+    """Get an ``array.array`` of numbers or the default.
+
+    The items are converted straight into a compact typed array, ``float`` for
+    the ``'f'`` and ``'d'`` typecodes and ``int`` for the others. Values out of
+    range for the typecode raise a ``ValueError``.
+
+    Args:
+        name: The environment variable name
+        default: The default value to use if no environment variable is found
+        allow_none: If the return value can be `None` (i.e. optional)
+        typecode: The ``array`` typecode (ex: ``'l'``, ``'H'``, ``'d'``)
+        separator: The item separator string or compiled regular expression
+    """
+    if _observers:
+        return _observe('array', _to_array, name, default, allow_none, fallback, typecode=typecode,
+                        separator=separator)
+    return _to_array(read(name, default, allow_none, fallback=fallback), allow_none, typecode, separator)
+
+
+def ndarray(name, default=None, allow_none=False, fallback=None, dtype='int64', separator=','):
+    """Get a NumPy array of numbers or the default.
+
+    The items are converted and validated by NumPy in a single vectorized
+    step. Requires NumPy, which is only imported when this getter is used.
+
+    Args:
+        name: The environment variable name
+        default: The default value to use if no environment variable is found
+        allow_none: If the return value can be `None` (i.e. optional)
+        dtype: The NumPy data type of the array
+        separator: The item separator string or compiled regular expression
+    """
+    if _observers:
+        return _observe('ndarray', _to_ndarray, name, default, allow_none, fallback, dtype=dtype,
+                        separator=separator)
+    return _to_ndarray(read(name, default, allow_none, fallback=fallback), allow_none, dtype, separator)
+
+
+def dict(name, default=None, allow_none=False, fallback=None, item_separator=',', kv_separator='=',
+         value_cast=None):
+    """Get a read-only mapping of ``key=value`` items or the default.
+
+    Keys and values are whitespace-stripped and empty items are skipped. The
+    parsed mapping is memoized per raw value, so reading an unchanged variable
+    again doesn't parse it again.
+
+    Args:
+        name: The environment variable name
+        default: The default value to use if no environment variable is found
+        allow_none: If the return value can be `None` (i.e. optional)
+        fallback: A list of fallback env variables to try and read if the primary environment
+                  variable is unavailable.
+        item_separator: The item separator string or compiled regular expression
+        kv_separator: The separator between a key and its value
+        value_cast: A callable converting each value (ex: ``int`` or ``envitro.bool``),
+                    values are strings by default
+
+    Examples:
+        >>> envitro.dict('TENANT_LIMITS', value_cast=int)  # TENANT_LIMITS="acme=100,globex=250"
+        mappingproxy({'acme': 100, 'globex': 250})
+    """
+    if _observers:
+        return _observe('dict', _to_dict, name, default, allow_none, fallback, item_separator=item_separator,
+                        kv_separator=kv_separator, value_cast=value_cast)
+    return _to_dict(read(name, default, allow_none, fallback=fallback), allow_none, item_separator, kv_separator,
+                    value_cast)
+
+
+def json(name, default=None, allow_none=False, fallback=None):
+    """Get a JSON environment value or the default.
+
+    Objects are returned as read-only mappings and arrays as tuples, all the
+    way down, so the decoded value can be shared. Decoded values are memoized
+    per raw value and decoded with the standard library, or the function set
+    with :func:`use_json_loads`.
+
+    Args:
+        name: The environment variable name
+        default: The default value to use if no environment variable is found
+        allow_none: If the return value can be `None` (i.e. optional)
+        fallback: A list of fallback env variables to try and read if the primary environment
+                  variable is unavailable.
+    """
+    if _observers:
+        return _observe('json', _to_json, name, default, allow_none, fallback)
+    return _to_json(read(name, default, allow_none, fallback=fallback), allow_none)
+
+
+def strs(names, allow_none=False, fallback=None):
+    """Get several string based environment values at once (see :func:`read_many`)."""
+    return _read_many('strs', _to_str, names, allow_none, fallback)
+
+
+def bools(names, allow_none=False, fallback=None):
+    """Get several boolean based environment values at once (see :func:`read_many`)."""
+    return _read_many('bools', _to_bool, names, allow_none, fallback)
+
+
+def ints(names, allow_none=False, fallback=None):
+    """Get several integer environment values at once (see :func:`read_many`)."""
+    return _read_many('ints', _to_int, names, allow_none, fallback)
+
+
+def floats(names, allow_none=False, fallback=None):
+    """Get several float environment values at once (see :func:`read_many`)."""
+    return _read_many('floats', _to_float, names, allow_none, fallback)
+
+
+def lists(names, allow_none=False, fallback=None, separator=','):
+    """Get several lists of strings at once (see :func:`read_many`)."""
+    return _read_many('lists', _to_list, names, allow_none, fallback, separator=separator)
+
+
+def tuples(names, allow_none=False, fallback=None, separator=','):
+    """Get several tuples of strings at once (see :func:`read_many`)."""
+    return _read_many('tuples', _to_tuple, names, allow_none, fallback, separator=separator)
+
+
+class Plan(object):
+    """A precompiled resolution plan for a variable and its fallback chain.
+
+    The fallback chain is normalized once, and the plan remembers which
+    alias was found on the last lookup (see :attr:`alias`). Every lookup
+    checks the aliases in order, so changes made directly to ``os.environ``,
+    context overrides and provider chains are always seen.
+
+    Args:
+        name: The environment variable name
+        fallback: A list of fallback env variables to try and read if the primary environment
+                  variable is unavailable.
+
+    Examples:
+        >>> database = envitro.plan('DATABASE_URL', ['DB_URL', 'POSTGRES_URL'])
+        >>> database.str()
+        'postgres://localhost/app'
+        >>> database.alias
+        'POSTGRES_URL'
+    """
+    __slots__ = ('name', 'names', '_index')
+
+    def __init__(self, name, fallback=None):
+        self.name = name
+        self.names = (name, ) + _fallback_names(fallback)
+        self._index = -1
+
+    @property
+    def alias(self):
+        """The name of the variable that was found on the last lookup, or `None`."""
+        return self.names[self._index] if self._index >= 0 else None
+
+    def resolve(self):
+        """Return the raw value of the first alias that is set, or `None`."""
+        get = _get
+        for index, name in enumerate(self.names):
+            raw_value = get(name)
+            if raw_value is not None:
+                self._index = index
+                return raw_value
+        self._index = -1
+        return None
+
+    def _value(self, getter, caster, default, allow_none, **options):
+        if _observers:
+            start = _timer()
+            raw_value = self.resolve()
+            return _observe_value(getter, caster, self.name, self.alias, raw_value, default, allow_none, start,
+                                  **options)
+        value = _or_default(self.resolve(), self.name, default, allow_none)
+        return value if caster is None else caster(value, allow_none, **options)
+
+    def read(self, default=None, allow_none=False):
+        """Read the raw env value (see :func:`envitro.core.read`)."""
+        return self._value('read', None, default, allow_none)
+
+    def str(self, default=None, allow_none=False):
+        """Get a string based environment value or the default."""
+        return self._value('str', _to_str, default, allow_none)
+
+    def bool(self, default=None, allow_none=False):
+        """Get a boolean based environment value or the default."""
+        return self._value('bool', _to_bool, default, allow_none)
+
+    def int(self, default=None, allow_none=False):
+        """Get an integer environment value or the default."""
+        return self._value('int', _to_int, default, allow_none)
+
+    def float(self, default=None, allow_none=False):
+        """Get a float environment value or the default."""
+        return self._value('float', _to_float, default, allow_none)
+
+    def list(self, default=None, allow_none=False, separator=','):
+        """Get a list of strings or the default."""
+        return self._value('list', _to_list, default, allow_none, separator=separator)
+
+    def tuple(self, default=None, allow_none=False, separator=','):
+        """Get a tuple of strings or the default."""
+        return self._value('tuple', _to_tuple, default, allow_none, separator=separator)
+
+
+def plan(name, fallback=None):
+    """Get the compiled resolution :class:`Plan` for a variable and its fallback chain.
+
+    Plans are shared, calling this again with the same chain returns the same plan.
+
+    Args:
+        name: The environment variable name
+        fallback: A list of fallback env variables to try and read if the primary environment
+                  variable is unavailable.
+    """
+    key = (name, _fallback_names(fallback))
+    compiled = _plans.get(key)
+    if compiled is None:
+        compiled = _plans[key] = Plan(name, fallback)
+    return compiled
+
+
+# value casters used by the typed getters, keyed by getter name
+_CASTERS = {
+    'str': _to_str,
+    'bool': _to_bool,
+    'int': _to_int,
+    'float': _to_float,
+    'list': _to_list,
+    'tuple': _to_tuple,
+    'frozenset': _to_frozenset,
+    'json': _to_json,
+}
+
+
+def _caster_for(getter):
+    """Return the value caster of a typed getter, or `None` for any other callable."""
+    name = getattr(getter, '__name__', None)
+    if name in _CASTERS and globals().get(name) is getter:
+        return _CASTERS[name]
+    return getattr(getter, 'caster', None)
@@ -8,15 +8,141 @@ as a syntactically nice way of enabling/disabling automated tests based on
 environment variables.
 """
 from __future__ import absolute_import
+import contextlib
 import functools
+import inspect
 import warnings
+import weakref
 
 from . import core
 
+try:
+    from . import _async
+except (ImportError, SyntaxError):
+    _async = None
+
+# functions decorated with ``once=True``, keyed by environment variable name
+_gates = {}
+
+
+def _skip(*args, **kwargs):  # pylint: disable=W0613
+    return None
+
+
+def _raise(error, *args, **kwargs):  # pylint: disable=W0613
+    raise error
+
+
+def _gate(func, name, condition):
+    """Wrap the function with a condition that is only evaluated on refresh."""
+    target = [_skip]
+
+    @functools.wraps(func)
+    def _decorator(*args, **kwargs):
+        return target[0](*args, **kwargs)
+
+    def _refresh():
+        try:
+            target[0] = func if condition() else _skip
+        except ValueError as err:
+            # an invalid value is reported by the decorated calls, not by the write refreshing them
+            target[0] = functools.partial(_raise, err)
+
+    _decorator.refresh = _refresh
+    _refresh()
+    _gates.setdefault(name, weakref.WeakSet()).add(_decorator)
+    return _decorator
+
+
+def refresh(name=None):
+    """Evaluate the conditions of functions decorated with ``once=True`` again.
+
+    Writes through :func:`envitro.core.write` refresh the affected functions
+    automatically; call this after changing ``os.environ`` directly.
+
+    Args:
+        name: Only refresh the functions depending on this environment variable
+    """
+    names = [name] if name is not None else list(_gates)
+    for gate_name in names:
+        for gated in list(_gates.get(gate_name, ())):
+            gated.refresh()
+
+
+def _refresh_written(name):
+    if name in _gates:
+        refresh(name)
+
+
+core._write_hooks.append(_refresh_written)
+
+
+class _SteppedGenerator(object):
+    """Run every step of a generator inside a context."""
+
+    def __init__(self, generator, context):
+        self._generator = generator
+        self._context = context
+
+    def __iter__(self):
+        return self
+
+    def send(self, value):
+        with self._context():
+            return self._generator.send(value)
+
+    def __next__(self):
+        return self.send(None)
+    next = __next__
+
+    def throw(self, *args):
+        with self._context():
+            return self._generator.throw(*args)
+
+    def close(self):
+        with self._context():
+            return self._generator.close()
+
+
+def _within(func, context):
+    """Wrap a function, generator function or coroutine function to run inside a context.
+
+    Generators enter and exit the context on every step, so the context isn't
+    active while they are suspended. Coroutines run entirely inside the context.
+    """
+    if _async is not None and inspect.iscoroutinefunction(func):
+        return _async.wrap(func, context)
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def _generator(*args, **kwargs):
+            return _SteppedGenerator(func(*args, **kwargs), context)
+        return _generator
+
+    @functools.wraps(func)
+    def _decorator(*args, **kwargs):
+        with context():
+            return func(*args, **kwargs)
+    return _decorator
+
+
+@contextlib.contextmanager
+def _written(name, value):
+    existing_env = core.environ.get(name)
+    core.write(name, value)
+    try:
+        yield
+    finally:
+        core.write(name, existing_env)
+
 
 def write(name, value):
     """Temporarily change or set the environment variable during the execution of a function.
 
+    The previous value is restored even if the function raises. Coroutine functions
+    keep the value until the coroutine completes, and generator functions only while
+    they are running (not while suspended).
+
     Args:
         name: The name of the environment variable
         value: A value to set for the environment variable
@@ -25,14 +151,35 @@ def write(name, value):
         The function return value.
     """
     def wrapped(func):
-        @functools.wraps(func)
-        def _decorator(*args, **kwargs):
-            existing_env = core.read(name, allow_none=True)
-            core.write(name, value)
-            func_val = func(*args, **kwargs)
-            core.write(name, existing_env)
-            return func_val
-        return _decorator
+        return _within(func, lambda: _written(name, value))
+    return wrapped
+
+
+def override(name, value):
+    """Override the environment variable for the execution of a function, in the current context only.
+
+    Unlike :func:`write`, ``os.environ`` isn't modified: the value is only visible to the
+    envitro getters in the current thread or asyncio task (see :func:`envitro.core.override`).
+    Coroutine and generator functions are supported like with :func:`write`, coroutine
+    functions only with ``contextvars`` (python 3.7+): without it, concurrent tasks
+    would share the thread's overrides.
+
+    Args:
+        name: The name of the environment variable
+        value: A value for the environment variable, `None` hides it
+
+    Returns:
+        The function return value.
+
+    Raises:
+        TypeError: The function is a coroutine function and ``contextvars`` isn't available.
+    """
+    def wrapped(func):
+        # pylint: disable=W0212
+        if _async is not None and core._contextvars is None and inspect.iscoroutinefunction(func):
+            raise TypeError('envitro.decorators.override() needs contextvars (python 3.7+) '
+                            'to wrap the coroutine function {0!r}'.format(func.__name__))
+        return _within(func, lambda: core.override({name: value}))
     return wrapped
 
 
@@ -41,16 +188,22 @@ def set(name, value):
     return write(name, value)
 
 
-def isset(name):
+def isset(name, once=False):
     """Only execute the function if the variable is set.
 
     Args:
         name: The name of the environment variable
+        once: Check the variable when decorating instead of on every call. The check
+              is repeated when the variable is changed with :func:`envitro.core.write`
+              or by calling :func:`refresh` (or the ``refresh`` attribute of the function).
 
     Returns:
         The function return value or `None` if the function was skipped.
     """
     def wrapped(func):
+        if once:
+            return _gate(func, name, lambda: core.isset(name))
+
         @functools.wraps(func)
         def _decorator(*args, **kwargs):
             if core.isset(name):
@@ -59,18 +212,23 @@ def isset(name):
     return wrapped
 
 
-def bool(name, execute_bool=True, default=None):
+def bool(name, execute_bool=True, default=None, once=False):
     """Only execute the function if the boolean variable is set.
 
     Args:
         name: The name of the environment variable
         execute_bool: The boolean value to execute the function on
         default: The default value if the environment variable is not set (respects `execute_bool`)
+        once: Check the variable when decorating instead of on every call (see :func:`isset`)
 
     Returns:
         The function return value or `None` if the function was skipped.
     """
     def wrapped(func):
+        if once:
+            return _gate(func, name, lambda: (core.isset(name) and core.bool(name) == execute_bool) or
+                         (default is not None and default == execute_bool))
+
         @functools.wraps(func)
         def _decorator(*args, **kwargs):
             if core.isset(name) and core.bool(name) == execute_bool:
@@ -11,18 +11,203 @@ import warnings
 
 from . import core
 
+# matches ``tcp://172.17.0.82:5432`` and bracketed IPv6 hosts like ``tcp://[fd00::2]:5432``
+_LINK_PATTERN = re.compile(
+    r'^\s*(?P<protocol>[^:/\s]+)://(?:\[(?P<ipv6>[^\]]+)\]|(?P<host>[^:/\[\]\s]+)):(?P<port>\d+)/?\s*$')
+
+# matches the variables docker injects for every exposed port of a link, ex:
+# ``DB_PORT``, ``DB_PORT_5432_TCP``, ``DB_PORT_5432_TCP_ADDR``, ``DB_PORT_5432_TCP_PORT``
+_LINK_VARIABLE_PATTERN = re.compile(
+    r'^(?P<alias>.+?)_PORT(?:_(?P<number>\d+)_(?P<protocol>[A-Z]+)(?:_(?P<field>ADDR|PORT|PROTO))?)?$')
+
+# parsed links keyed by alias name: (variable name, raw value, DockerLink)
+_links = {}
+
+
+class DockerPort(object):
+    """A port exposed through a docker link.
+
+    Attributes:
+        number: The port number
+        protocol: The port protocol (ex: ``tcp``)
+        host: The host address
+    """
+    __slots__ = ('number', 'protocol', 'host')
+
+    def __init__(self, number, protocol, host):
+        self.number = number
+        self.protocol = protocol
+        self.host = host
+
+    def _key(self):
+        return (self.number, self.protocol, self.host)
+
+    def __eq__(self, other):
+        return isinstance(other, DockerPort) and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return 'DockerPort({0!r}, {1!r}, {2!r})'.format(self.number, self.protocol, self.host)
+
+
+class DockerLink(object):
+    """A parsed docker link value.
+
+    Attributes:
+        protocol: The link protocol (ex: ``tcp``)
+        host: The host address, IPv6 addresses are returned without brackets
+        port: The port number
+        ports: Every :class:`DockerPort` exposed by the link, only filled in by :func:`links`
+    """
+    __slots__ = ('protocol', 'host', 'port', 'ports')
+
+    def __init__(self, protocol, host, port, ports=()):
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.ports = ports
+
+    def _key(self):
+        return (self.protocol, self.host, self.port, self.ports)
+
+    def __eq__(self, other):
+        return isinstance(other, DockerLink) and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return 'DockerLink({0!r}, {1!r}, {2!r})'.format(self.protocol, self.host, self.port)
+
+
+def _parse_link(raw_value):
+    """Parse a raw docker link value, or return `None` if it doesn't look like one."""
+    match = _LINK_PATTERN.match(raw_value)
+    if match is None:
+        return None
+    return DockerLink(match.group('protocol'), match.group('ipv6') or match.group('host'), int(match.group('port')))
+
+
+def _forget_link(name):
+    if name.endswith('_PORT'):
+        for alias_name, cached in list(_links.items()):
+            if cached[0] == name:
+                del _links[alias_name]
+
+
+core._write_hooks.append(_forget_link)
+
+
+def link(alias_name, default=None, allow_none=False):
+    """Get the parsed docker link or return the default.
+
+    The parsed link is cached per alias until the variable changes.
+
+    Args:
+        alias_name: The docker link alias
+        default: The default value if the link isn't available
+        allow_none: If the return value can be `None` (i.e. optional)
+
+    Raises:
+        KeyError: The link isn't set and there is no default.
+        ValueError: The variable doesn't look like a docker link.
+
+    Examples:
+        Assuming a Docker link was created with ``docker --link postgres:db``
+        and the resulting environment variable is ``DB_PORT=tcp://172.17.0.82:5432``.
+
+        >>> db = envitro.docker.link('DB')
+        >>> db.host, db.port
+        ('172.17.0.82', 5432)
+    """
+    cached = _links.get(alias_name)
+    if cached is None:
+        cached = (alias_name.strip().upper() + '_PORT', None, None)
+
+    raw_value = core._get(cached[0])
+    if raw_value is None:
+        if default is not None or allow_none:
+            return default
+        raise KeyError('Set the "{0}" environment variable'.format(cached[0]))
+
+    if raw_value != cached[1]:
+        parsed = _parse_link(raw_value)
+        if parsed is None:
+            raise ValueError('"{0}={1}" does not look like a docker link.'.format(cached[0], raw_value))
+        _links[alias_name] = cached = (cached[0], raw_value, parsed)
+    return cached[2]
+
+
+def links():
+    """Discover every docker link in the environment.
+
+    The environment is scanned once. Each link includes every exposed port
+    found in the ``<ALIAS>_PORT_<number>_<PROTOCOL>`` variables (and their
+    ``_ADDR``, ``_PORT`` and ``_PROTO`` variants). Links without a valid
+    ``<ALIAS>_PORT`` variable use their lowest exposed port.
+
+    Returns:
+        A dict of upper-case alias names to :class:`DockerLink` objects.
+
+    Examples:
+        Assuming a Docker link was created with ``docker --link postgres:db``.
+
+        >>> envitro.docker.links()
+        {'DB': DockerLink('tcp', '172.17.0.82', 5432)}
+        >>> envitro.docker.links()['DB'].ports
+        (DockerPort(5432, 'tcp', '172.17.0.82'),)
+    """
+    main = {}
+    exposed = {}
+    for name, raw_value in core.environ.items():
+        if '_PORT' not in name:
+            continue
+        match = _LINK_VARIABLE_PATTERN.match(name)
+        if match is None:
+            continue
+
+        alias_name, number, protocol, field = match.group('alias', 'number', 'protocol', 'field')
+        if number is None:
+            main[alias_name] = raw_value
+        else:
+            port_key = (int(number), protocol.lower())
+            exposed.setdefault(alias_name, {}).setdefault(port_key, {})[field] = raw_value
+
+    result = {}
+    for alias_name in set(main) | set(exposed):
+        ports = []
+        for (number, protocol), fields in sorted(exposed.get(alias_name, {}).items()):
+            host = fields.get('ADDR')
+            if host is None and fields.get(None):
+                parsed = _parse_link(fields[None])
+                host = parsed.host if parsed is not None else None
+            if host is not None:
+                ports.append(DockerPort(number, protocol, host))
+
+        parsed = _parse_link(main[alias_name]) if alias_name in main else None
+        if parsed is not None:
+            result[alias_name] = DockerLink(parsed.protocol, parsed.host, parsed.port, tuple(ports))
+        elif ports:
+            result[alias_name] = DockerLink(ports[0].protocol, ports[0].host, ports[0].number, tuple(ports))
+    return result
+
+
 def _split_docker_link(alias_name):
     """
     Splits a docker link string into a list of 3 items (protocol, host, port).
-    - Assumes IPv4 Docker links
 
     ex: _split_docker_link('DB') -> ['tcp', '172.17.0.82', '8080']
     """
-    sanitized_name = alias_name.strip().upper()
-    split_list = re.split(r':|//', core.str('{0}_PORT'.format(sanitized_name)))
-    # filter out empty '' vals from the list with filter and
-    # cast to list (required for python3)
-    return list(filter(None, split_list))
+    parsed = link(alias_name)
+    return [parsed.protocol, parsed.host, str(parsed.port)]
 
 
 def read(alias_name, allow_none=False):
@@ -53,7 +238,7 @@ def isset(alias_name):
     warnings.warn('Will be removed in v1.0', DeprecationWarning, stacklevel=2)
     raw_value = read(alias_name, allow_none=True)
     if raw_value:
-        if re.compile(r'.+://.+:\d+').match(raw_value):
+        if _parse_link(raw_value) is not None:
             return True
         else:
             warnings.warn('"{0}_PORT={1}" does not look like a docker link.'.format(alias_name, raw_value), stacklevel=2)
@@ -78,7 +263,7 @@ def protocol(alias_name, default=None, allow_none=False):
     """
     warnings.warn('Will be removed in v1.0', DeprecationWarning, stacklevel=2)
     try:
-        return _split_docker_link(alias_name)[0]
+        return link(alias_name).protocol
     except KeyError as err:
         if default or allow_none:
             return default
@@ -103,7 +288,7 @@ def host(alias_name, default=None, allow_none=False):
     """
     warnings.warn('Will be removed in v1.0', DeprecationWarning, stacklevel=2)
     try:
-        return _split_docker_link(alias_name)[1]
+        return link(alias_name).host
     except KeyError as err:
         if default or allow_none:
             return default
@@ -128,7 +313,7 @@ def port(alias_name, default=None, allow_none=False):
     """
     warnings.warn('Will be removed in v1.0', DeprecationWarning, stacklevel=2)
     try:
-        return int(_split_docker_link(alias_name)[2])
+        return link(alias_name).port
     except KeyError as err:
         if default or allow_none:
             return default
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=W0622
+"""Load variables from dotenv (``.env``) files.
+
+The parser understands the common dotenv syntax: comments, an optional
+``export`` prefix, unquoted, single-quoted (literal) and double-quoted
+(with escapes) values, and quoted values spanning multiple lines. Files are
+parsed line by line, so memory use does not grow with the size of the file.
+
+Examples:
+    >>> envitro.dotenv.load('.env')  # write the values into os.environ
+    >>> envitro.dotenv.load('batch.env', apply=False)  # only visible to the envitro getters
+"""
+from __future__ import absolute_import
+
+import io
+import mmap
+import os
+import re
+
+from . import core
+
+# files larger than this are memory mapped instead of read through a buffer
+MMAP_THRESHOLD = 1024 * 1024
+
+_INLINE_COMMENT = re.compile(r'\s#')
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', '"': '"', '\\': '\\', '$': '$'}
+
+
+def _unescape(match):
+    char = match.group(1)
+    return _ESCAPES.get(char, match.group(0))
+
+
+def _closing_quote(value, quote):
+    """Return the index of the unescaped closing quote, or -1."""
+    index = value.find(quote)
+    while index > 0 and quote == '"':
+        backslashes = 0
+        while index - backslashes > 0 and value[index - backslashes - 1] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            break
+        index = value.find(quote, index + 1)
+    return index
+
+
+def parse(lines):
+    """Parse dotenv formatted lines.
+
+    Args:
+        lines: An iterable of text lines (ex: an open file)
+
+    Returns:
+        A generator of ``(name, value)`` tuples, in file order.
+
+    Raises:
+        ValueError: A line isn't a valid assignment or a quoted value is never closed.
+    """
+    lines = iter(lines)
+    line_number = 0
+    for line in lines:
+        line_number += 1
+        content = line.rstrip('\r\n').lstrip()
+        if not content.strip() or content.startswith('#'):
+            continue
+        if content.startswith('export ') or content.startswith('export\t'):
+            content = content[7:].lstrip()
+
+        name, separator, value = content.partition('=')
+        name = name.strip()
+        if not separator or not name:
+            raise ValueError('Invalid dotenv line {0}: {1!r}'.format(line_number, line.rstrip('\r\n')))
+
+        value = value.lstrip()
+        quote = value[:1]
+        if quote in ('"', "'"):
+            start_line = line_number
+            value = value[1:]
+            parts = []
+            while True:
+                end = _closing_quote(value, quote)
+                if end >= 0:
+                    parts.append(value[:end])
+                    break
+                parts.append(value)
+                parts.append('\n')
+                try:
+                    value = next(lines).rstrip('\r\n')
+                except StopIteration:
+                    raise ValueError('Unterminated quoted value on dotenv line {0}'.format(start_line))
+                line_number += 1
+
+            value = ''.join(parts)
+            if quote == '"':
+                value = _ESCAPE.sub(_unescape, value)
+        else:
+            comment = _INLINE_COMMENT.search(value)
+            if comment is not None:
+                value = value[:comment.start()]
+            value = value.rstrip()
+
+        yield name, value
+
+
+def _mapped_lines(mapped):
+    for line in iter(mapped.readline, b''):
+        yield line.decode('utf-8')
+
+
+def read(path):
+    """Parse a dotenv file.
+
+    Large files (see ``MMAP_THRESHOLD``) are memory mapped.
+
+    Args:
+        path: The dotenv file path
+
+    Returns:
+        A generator of ``(name, value)`` tuples, in file order.
+    """
+    with io.open(path, 'rb') as env_file:
+        size = os.fstat(env_file.fileno()).st_size
+        if size and size >= MMAP_THRESHOLD:
+            mapped = mmap.mmap(env_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for item in parse(_mapped_lines(mapped)):
+                    yield item
+            finally:
+                mapped.close()
+        else:
+            for item in parse(io.TextIOWrapper(env_file, encoding='utf-8')):
+                yield item
+
+
+def load(path, apply=True, override=False):
+    """Load a dotenv file.
+
+    Args:
+        path: The dotenv file path
+        apply: Write the values into ``os.environ``. Otherwise the values are added as an
+               in-memory source (see :func:`envitro.core.add_source`), visible to the
+               envitro getters but not to the process environment.
+        override: Replace variables that are already set in ``os.environ``
+
+    Returns:
+        A dict of the variables in the file.
+    """
+    values = dict(read(path))
+    if apply:
+        environ = core.environ
+        changed = values
+        if not override:
+            changed = dict((name, value) for name, value in values.items() if name not in environ)
+        environ.update(changed)
+        core._changed(changed)
+    else:
+        core.add_source(values)
+    return values
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=W0622
+"""Lazily resolved environment variables.
+
+The getters in this module have the same signature and semantics as the ones
+in :mod:`envitro.core`, but return a :class:`LazyValue` instead of reading the
+environment right away. The variable is read and parsed on first use and the
+result is cached, so module level configuration costs nothing at import time.
+
+Examples:
+    >>> TIMEOUT = envitro.lazy.int('TIMEOUT', 30)  # nothing is read yet
+    >>> TIMEOUT + 1  # read, parsed and cached
+    31
+
+    >>> class Settings(object):
+    ...     debug = envitro.lazy.bool('DEBUG', False)
+    >>> Settings.debug
+    False
+"""
+from __future__ import absolute_import
+
+import operator
+
+from . import core
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+_UNRESOLVED = object()
+
+
+class LazyValue(object):
+    """A proxy resolving an environment variable on first access.
+
+    The proxy forwards attribute access, operators, comparisons and
+    conversions to the resolved value. Used as a class attribute it behaves
+    like a descriptor and returns the resolved value directly. Use
+    :meth:`get` to obtain the underlying value (ex: for ``is`` checks or
+    ``isinstance``).
+
+    Args:
+        getter: The getter used to resolve the value (ex: ``envitro.int``)
+        args: Positional arguments for the getter
+        kwargs: Keyword arguments for the getter
+    """
+    __slots__ = ('_getter', '_args', '_kwargs', '_value')
+
+    def __init__(self, getter, *args, **kwargs):
+        self._getter = getter
+        self._args = args
+        self._kwargs = kwargs
+        self._value = _UNRESOLVED
+
+    def get(self):
+        """Resolve the value, or return it if it was already resolved."""
+        value = self._value
+        if value is _UNRESOLVED:
+            value = self._value = self._getter(*self._args, **self._kwargs)
+        return value
+
+    def reset(self):
+        """Forget the resolved value, it will be read again on next access."""
+        self._value = _UNRESOLVED
+
+    @property
+    def resolved(self):
+        """If the value was already resolved."""
+        return self._value is not _UNRESOLVED
+
+    def __get__(self, instance, owner):
+        return self.get()
+
+    def __getattr__(self, attr):
+        return getattr(self.get(), attr)
+
+    def __repr__(self):
+        return repr(self.get())
+
+    def __str__(self):
+        return builtins.str(self.get())
+
+    def __format__(self, format_spec):
+        return format(self.get(), format_spec)
+
+    def __bool__(self):
+        return builtins.bool(self.get())
+    __nonzero__ = __bool__
+
+    def __hash__(self):
+        return hash(self.get())
+
+    def __int__(self):
+        return builtins.int(self.get())
+
+    def __float__(self):
+        return builtins.float(self.get())
+
+    def __index__(self):
+        return operator.index(self.get())
+
+    def __len__(self):
+        return len(self.get())
+
+    def __iter__(self):
+        return iter(self.get())
+
+    def __contains__(self, item):
+        return item in self.get()
+
+    def __getitem__(self, key):
+        return self.get()[key]
+
+
+def _binary(func):
+    return lambda self, other: func(self.get(), other)
+
+
+def _reflected(func):
+    return lambda self, other: func(other, self.get())
+
+
+def _unary(func):
+    return lambda self: func(self.get())
+
+
+for _name in ('eq', 'ne', 'lt', 'le', 'gt', 'ge'):
+    setattr(LazyValue, '__{0}__'.format(_name), _binary(getattr(operator, _name)))
+
+for _name in ('add', 'sub', 'mul', 'truediv', 'floordiv', 'mod', 'pow', 'and', 'or', 'xor', 'lshift', 'rshift',
+              'div'):
+    _func = getattr(operator, _name, None) or getattr(operator, _name + '_', None)
+    if _func is not None:
+        setattr(LazyValue, '__{0}__'.format(_name), _binary(_func))
+        setattr(LazyValue, '__r{0}__'.format(_name), _reflected(_func))
+
+for _name in ('neg', 'pos', 'abs', 'invert'):
+    setattr(LazyValue, '__{0}__'.format(_name), _unary(getattr(operator, _name)))
+
+del _name, _func
+
+
+def read(name, default=None, allow_none=False, fallback=None):
+    """Lazily read the raw env value (see :func:`envitro.core.read`)."""
+    return LazyValue(core.read, name, default, allow_none, fallback=fallback)
+
+
+def str(name, default=None, allow_none=False, fallback=None):
+    """Lazily get a string based environment value (see :func:`envitro.core.str`)."""
+    return LazyValue(core.str, name, default, allow_none, fallback=fallback)
+
+
+def bool(name, default=None, allow_none=False, fallback=None):
+    """Lazily get a boolean based environment value (see :func:`envitro.core.bool`)."""
+    return LazyValue(core.bool, name, default, allow_none, fallback=fallback)
+
+
+def int(name, default=None, allow_none=False, fallback=None):
+    """Lazily get an integer environment value (see :func:`envitro.core.int`)."""
+    return LazyValue(core.int, name, default, allow_none, fallback=fallback)
+
+
+def float(name, default=None, allow_none=False, fallback=None):
+    """Lazily get a float environment value (see :func:`envitro.core.float`)."""
+    return LazyValue(core.float, name, default, allow_none, fallback=fallback)
+
+
+def list(name, default=None, allow_none=False, fallback=None, separator=','):
+    """Lazily get a list of strings (see :func:`envitro.core.list`)."""
+    return LazyValue(core.list, name, default, allow_none, fallback=fallback, separator=separator)
+
+
+def tuple(name, default=None, allow_none=False, fallback=None, separator=','):
+    """Lazily get a tuple of strings (see :func:`envitro.core.tuple`)."""
+    return LazyValue(core.tuple, name, default, allow_none, fallback=fallback, separator=separator)
+
+
+def frozenset(name, default=None, allow_none=False, fallback=None, separator=','):
+    """Lazily get a frozenset of strings (see :func:`envitro.core.frozenset`)."""
+    return LazyValue(core.frozenset, name, default, allow_none, fallback=fallback, separator=separator)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Access metrics for environment variables.
+
+Once enabled, every variable resolved by :func:`envitro.core.read`, the typed
+and batch getters, the registered casters, plans and schemas is counted per
+variable: how often it was read, found, resolved through a fallback alias or
+a default, missing, failed to parse, and the cumulative parsing time. Nothing is recorded (and nothing is slowed
+down) while metrics are disabled.
+
+Examples:
+    >>> envitro.metrics.enable()
+    >>> envitro.int('WORKERS', 4)
+    4
+    >>> envitro.metrics.as_dict()['WORKERS']['default_hits']
+    1
+    >>> print(envitro.metrics.prometheus())
+"""
+from __future__ import absolute_import
+
+import threading
+
+from . import core
+
+# counter name, prometheus metric name and help text
+COUNTERS = (
+    ('reads', 'envitro_reads_total', 'Environment variable reads.'),
+    ('hits', 'envitro_hits_total', 'Reads found under the primary variable name.'),
+    ('fallback_hits', 'envitro_fallback_hits_total', 'Reads found under a fallback alias.'),
+    ('default_hits', 'envitro_default_hits_total', 'Reads resolved to the default value.'),
+    ('misses', 'envitro_misses_total', 'Reads of missing variables without a default.'),
+    ('parse_errors', 'envitro_parse_errors_total', 'Values that failed to parse.'),
+    ('parse_seconds', 'envitro_parse_seconds_total', 'Cumulative time spent parsing values.'),
+)
+
+_SOURCE_COUNTERS = {'env': 1, 'fallback': 2, 'default': 3, 'missing': 4}
+
+
+class Metrics(object):
+    """Per variable access counters, fed by the core getters."""
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, access):
+        with self._lock:
+            counters = self._counters.get(access.name)
+            if counters is None:
+                counters = self._counters[access.name] = [0, 0, 0, 0, 0, 0, 0.0]
+            counters[0] += 1
+            counters[_SOURCE_COUNTERS[access.source]] += 1
+            if access.error is not None and access.source != 'missing':
+                counters[5] += 1
+            counters[6] += access.parse_time
+
+    def reset(self):
+        """Reset every counter."""
+        with self._lock:
+            self._counters.clear()
+
+    def as_dict(self):
+        """Return the counters as a dict of variable names to dicts of counter names to values."""
+        with self._lock:
+            return dict((name, dict(zip((counter[0] for counter in COUNTERS), values)))
+                        for name, values in self._counters.items())
+
+    def most_read(self, count=10):
+        """Return the most read variables as a list of ``(name, reads)`` tuples.
+
+        Args:
+            count: The number of variables to return
+        """
+        with self._lock:
+            reads = [(name, values[0]) for name, values in self._counters.items()]
+        return sorted(reads, key=lambda item: (-item[1], item[0]))[:count]
+
+    def prometheus(self):
+        """Return the counters in the Prometheus text exposition format."""
+        metrics = self.as_dict()
+        lines = []
+        for counter, metric, description in COUNTERS:
+            lines.append('# HELP {0} {1}'.format(metric, description))
+            lines.append('# TYPE {0} counter'.format(metric))
+            for name in sorted(metrics):
+                lines.append('{0}{{variable="{1}"}} {2}'.format(
+                    metric, name.replace('\\', '\\\\').replace('"', '\\"'), metrics[name][counter]))
+        return '\n'.join(lines) + '\n'
+
+
+_metrics = Metrics()
+
+
+def enable():
+    """Start recording access metrics.
+
+    Returns:
+        The :class:`Metrics` being recorded.
+    """
+    if _metrics not in core._observers:
+        core._observers.append(_metrics)
+    return _metrics
+
+
+def disable():
+    """Stop recording access metrics, the counters are kept."""
+    if _metrics in core._observers:
+        core._observers.remove(_metrics)
+
+
+def reset():
+    """Reset every counter."""
+    _metrics.reset()
+
+
+def as_dict():
+    """Return the counters (see :meth:`Metrics.as_dict`)."""
+    return _metrics.as_dict()
+
+
+def most_read(count=10):
+    """Return the most read variables (see :meth:`Metrics.most_read`)."""
+    return _metrics.most_read(count)
+
+
+def prometheus():
+    """Return the counters in the Prometheus text exposition format."""
+    return _metrics.prometheus()
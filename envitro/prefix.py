@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Query environment variables by name prefix.
+
+The variable names are kept in a sorted index, reused while the set of names in
+``os.environ`` is unchanged, so a prefix query costs a comparison of the names
+and a binary search instead of a sort and a scan of the whole environment.
+
+Queries cover ``os.environ``, the context overrides (see
+:func:`envitro.core.override`) and the added sources that list their variable
+names with a ``keys`` method. The values are read like the getters read them,
+so the usual precedence applies. A provider chain (see
+:func:`envitro.core.use_chain`) can't list its variables: only the names found
+in the places above are looked up through it.
+"""
+from __future__ import absolute_import
+
+import bisect
+
+from . import core
+
+
+class KeyIndex(object):
+    """A sorted index of the ``os.environ`` variable names.
+
+    The index is rebuilt whenever the set of names changed, through
+    :func:`envitro.core.write` or directly in ``os.environ``.
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._names = frozenset()
+
+    def keys(self):
+        """Return the sorted variable names."""
+        names = frozenset(core.environ)
+        if names != self._names:
+            self._keys = sorted(names)
+            self._names = names
+        return self._keys
+
+    def startswith(self, prefix):
+        """Return the variable names starting with the prefix, in sorted order.
+
+        Args:
+            prefix: The variable name prefix
+        """
+        keys = self.keys()
+        names = []
+        for index in range(bisect.bisect_left(keys, prefix), len(keys)):
+            name = keys[index]
+            if not name.startswith(prefix):
+                break
+            names.append(name)
+        return names
+
+
+_index = KeyIndex()
+
+
+def prefixed(prefix, strip=True, cast=core.str):
+    """Get every environment variable starting with a prefix.
+
+    Args:
+        prefix: The variable name prefix (ex: ``'APP_CACHE_'``)
+        strip: Remove the prefix from the returned names
+        cast: A typed getter (ex: ``envitro.int``) or any callable taking the raw value
+
+    Returns:
+        A dict of variable names to values.
+
+    Examples:
+        Assuming ``APP_CACHE_TTL=60`` and ``APP_CACHE_SIZE=512`` are set.
+
+        >>> envitro.prefixed('APP_CACHE_', cast=envitro.int)
+        {'SIZE': 512, 'TTL': 60}
+    """
+    caster = core._caster_for(cast)
+    if caster is None:
+        def caster(value, _allow_none):
+            return cast(value)
+    start = len(prefix) if strip else 0
+
+    names = _index.startswith(prefix)
+    extra = [core._overlay.get() or {}] + [source for source in core._sources if hasattr(source, 'keys')]
+    if any(extra):
+        names = sorted(set(names).union(
+            name for mapping in extra for name in mapping.keys() if name.startswith(prefix)))
+
+    values = {}
+    observed = bool(core._observers)
+    for name in names:
+        started = core._timer() if observed else None
+        raw_value = core._get(name)
+        if raw_value is None:
+            continue
+        if observed:
+            values[name[start:]] = core._observe_value('prefixed', caster, name, name, raw_value, None, False, started)
+        else:
+            values[name[start:]] = caster(raw_value, False)
+    return values
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Record how configuration is resolved, typically during startup.
+
+A recorder captures every variable resolved by :func:`envitro.core.read`, the
+typed and batch getters, the registered casters, plans, schemas, snapshots and
+prefix queries: the variable, the getter, where the value came from (``env``,
+``fallback``, ``default`` or ``missing``), the time it took and the calling
+code. The report lists the call sites doing the most (or the most expensive)
+reads, so slow imports can be tracked down.
+
+Set ``ENVITRO_RECORD=1`` (or ``ENVITRO_RECORD=json``) to record everything from
+``import envitro`` and print the report to stderr, or to the file named by
+``ENVITRO_RECORD_FILE``. Any value :func:`envitro.core.bool` accepts works
+(``true``, ``yes``, ``0``, ``false``...), other values make the import fail.
+The report is written when the application calls :func:`stop_startup` at the
+end of its startup, or at exit otherwise. ``ENVITRO_RECORD_LIMIT`` stops
+recording after that many reads.
+
+Examples:
+    >>> with envitro.recorder.Recorder() as recorder:
+    ...     import myapp.settings
+    >>> print(recorder.report())
+"""
+from __future__ import absolute_import
+
+import atexit
+import collections
+import json
+import os
+import sys
+
+from . import core
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+Record = collections.namedtuple('Record', 'getter name source alias elapsed site')
+
+
+def _call_site():
+    """Return ``file:line (function)`` of the first caller outside of envitro."""
+    frame = sys._getframe(2)  # pylint: disable=W0212
+    while frame is not None and os.path.dirname(os.path.abspath(frame.f_code.co_filename)) == _PACKAGE_DIR:
+        frame = frame.f_back
+    if frame is None:
+        return '<unknown>'
+    return '{0}:{1} ({2})'.format(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+
+
+class Recorder(object):
+    """Record every envitro getter call while active.
+
+    Use it as a context manager, or call :meth:`start` and :meth:`stop`.
+
+    Args:
+        limit: The number of reads after which recording stops, `None` for no limit
+
+    Attributes:
+        records: The recorded :class:`Record` tuples, in call order
+    """
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.records = []
+
+    def __call__(self, access):
+        self.records.append(Record(access.getter, access.name, access.source, access.alias,
+                                   access.elapsed, _call_site()))
+        if self.limit is not None and len(self.records) >= self.limit:
+            self.stop()
+
+    def start(self):
+        """Start recording."""
+        if self not in core._observers:
+            core._observers.append(self)
+        return self
+
+    def stop(self):
+        """Stop recording, the records are kept."""
+        if self in core._observers:
+            core._observers.remove(self)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def sites(self):
+        """Summarize the records per call site, most expensive first.
+
+        Returns:
+            A list of ``(site, calls, total seconds)`` tuples.
+        """
+        summary = collections.OrderedDict()
+        for record in self.records:
+            calls, elapsed = summary.get(record.site, (0, 0.0))
+            summary[record.site] = (calls + 1, elapsed + record.elapsed)
+        return sorted(((site, calls, elapsed) for site, (calls, elapsed) in summary.items()),
+                      key=lambda item: -item[2])
+
+    def report(self, limit=20):
+        """Return a plain text report.
+
+        Args:
+            limit: The number of call sites and of slowest calls to list
+        """
+        total = sum(record.elapsed for record in self.records)
+        lines = ['envitro: {0} reads of {1} variables in {2:.3f} ms'.format(
+            len(self.records), len(set(record.name for record in self.records)), total * 1000)]
+
+        lines.append('')
+        lines.append('{0:>10} {1:>6}  {2}'.format('total ms', 'calls', 'call site'))
+        for site, calls, elapsed in self.sites()[:limit]:
+            lines.append('{0:>10.3f} {1:>6}  {2}'.format(elapsed * 1000, calls, site))
+
+        lines.append('')
+        lines.append('{0:>10} {1:<8} {2:<8} {3:<30} {4}'.format('ms', 'getter', 'source', 'variable', 'call site'))
+        for record in sorted(self.records, key=lambda record: -record.elapsed)[:limit]:
+            variable = record.name if record.alias in (None, record.name) else '{0} ({1})'.format(
+                record.name, record.alias)
+            lines.append('{0:>10.3f} {1:<8} {2:<8} {3:<30} {4}'.format(
+                record.elapsed * 1000, record.getter, record.source, variable, record.site))
+        return '\n'.join(lines) + '\n'
+
+    def as_json(self):
+        """Return the records and the per call site summary as a JSON document."""
+        return json.dumps({
+            'records': [record._asdict() for record in self.records],
+            'sites': [{'site': site, 'calls': calls, 'elapsed': elapsed} for site, calls, elapsed in self.sites()],
+        }, indent=2)
+
+
+# the recorder, report format and report path of the startup recording
+_startup = None
+
+
+def record_startup(output_format=None, path=None, limit=None):
+    """Record every call until :func:`stop_startup` is called or the process exits, then write the report.
+
+    Args:
+        output_format: ``'json'`` for a JSON report, anything else for plain text
+        path: The report file path, defaults to stderr
+        limit: The number of reads after which recording stops, `None` for no limit
+
+    Returns:
+        The started :class:`Recorder`.
+    """
+    global _startup  # pylint: disable=W0603
+    stop_startup()
+    recorder = Recorder(limit).start()
+    _startup = (recorder, output_format, path)
+    atexit.register(stop_startup)
+    return recorder
+
+
+def stop_startup():
+    """Stop the startup recording and write its report now.
+
+    Call it once the application is done starting, so the report only covers
+    the startup. Does nothing if no startup recording is running.
+
+    Returns:
+        The stopped :class:`Recorder`, or `None`.
+    """
+    global _startup  # pylint: disable=W0603
+    if _startup is None:
+        return None
+    recorder, output_format, path = _startup
+    _startup = None
+    recorder.stop()
+    report = recorder.as_json() if output_format == 'json' else recorder.report()
+    if path:
+        with open(path, 'w') as report_file:
+            report_file.write(report)
+    else:
+        sys.stderr.write(report)
+    return recorder
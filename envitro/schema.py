@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111,W0622
+"""Declarative environment schemas.
+
+A schema declares every environment variable a program needs in one place and
+resolves all of them in a single pass into an immutable object.
+
+Examples:
+    >>> class Config(envitro.schema.Schema):
+    ...     debug = envitro.schema.Field(envitro.bool, default=False)
+    ...     timeout = envitro.schema.Field(envitro.int, 'HTTP_TIMEOUT', default=30)
+    ...     hosts = envitro.schema.Field(envitro.list, fallback='ALLOWED_HOSTS')
+    >>> config = Config()
+    >>> config.timeout
+    30
+
+Fields can carry validation rules (see :mod:`envitro.validators`), every
+invalid field is reported in a single :class:`envitro.validators.ValidationError`.
+"""
+from __future__ import absolute_import
+
+import itertools
+
+from . import core
+from .validators import ValidationError, compile_rules
+
+_counter = itertools.count()
+
+
+class Field(object):
+    """A single environment variable of a schema.
+
+    Args:
+        getter: The typed getter used to parse the value (ex: ``envitro.int``)
+        name: The environment variable name, defaults to the upper-cased attribute name
+        default: The default value to use if no environment variable is found
+        allow_none: If the value can be `None` (i.e. optional)
+        fallback: A list of fallback env variables to try and read if the primary environment
+                  variable is unavailable.
+        separator: The list item separator for ``list`` and ``tuple`` fields
+        rules: The validation rules the parsed value must satisfy (see :mod:`envitro.validators`)
+    """
+    __slots__ = ('kind', 'name', 'default', 'allow_none', 'fallback', 'options', 'check', 'attr', 'order')
+
+    def __init__(self, getter, name=None, default=None, allow_none=False, fallback=None, separator=None,
+                 rules=()):
+        self.kind = getattr(getter, '__name__', getter)
+        if self.kind not in core._CASTERS:
+            raise TypeError('Unsupported field type: {0!r}'.format(getter))
+        self.name = name
+        self.default = default
+        self.allow_none = allow_none
+        self.fallback = core._fallback_names(fallback)
+        self.options = {} if separator is None else {'separator': separator}
+        self.check = compile_rules(rules) if rules else None
+        self.attr = None
+        self.order = next(_counter)
+
+    def __repr__(self):
+        return 'Field({0}, {1!r})'.format(self.kind, self.name)
+
+
+class SchemaMeta(type):
+    """Collect the declared fields and store their values in ``__slots__``."""
+
+    def __new__(mcs, name, bases, namespace):
+        fields = {}
+        for base in reversed(bases):
+            for field in getattr(base, '_fields', ()):
+                fields[field.attr] = field
+        inherited = frozenset(fields)
+
+        for attr, field in list(namespace.items()):
+            if isinstance(field, Field):
+                del namespace[attr]
+                field.attr = attr
+                if field.name is None:
+                    field.name = attr.upper()
+                fields[attr] = field
+
+        namespace['_fields'] = tuple(sorted(fields.values(), key=lambda field: field.order))
+        namespace['__slots__'] = tuple(attr for attr in fields if attr not in inherited)
+        return super(SchemaMeta, mcs).__new__(mcs, name, bases, namespace)
+
+
+class _SchemaBase(object):
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, environ=None):
+        """Resolve every field of the schema.
+
+        Args:
+            environ: The mapping to read from, defaults to ``os.environ``
+
+        Raises:
+            KeyError: One or more required variables are missing, all of them are listed.
+            ValidationError: One or more values failed to parse or broke a rule, all the
+                             invalid and missing variables are listed.
+        """
+        values, missing, errors = self._resolve(environ)
+        if errors:
+            for name in missing:
+                errors[name] = ['is not set']
+            raise ValidationError(errors)
+        if missing:
+            raise core._missing_error(missing)
+        for attr, value in values:
+            object.__setattr__(self, attr, value)
+
+    @classmethod
+    def _resolve(cls, environ):
+        """Resolve every field, returning the values, the missing names and the invalid values."""
+        get = core._get if environ is None else environ.get
+        if environ is None and (core._sources or core._chain is not None):
+            core._prefetch([name for field in cls._fields for name in (field.name, ) + field.fallback])
+        values = []
+        missing = []
+        errors = {}
+        observed = bool(core._observers)
+        for field in cls._fields:
+            start = core._timer() if observed else None
+            alias = field.name
+            raw_value = get(field.name)
+            if raw_value is None:
+                alias = None
+                for fall in field.fallback:
+                    raw_value = get(fall)
+                    if raw_value is not None:
+                        alias = fall
+                        break
+
+            parse_start = None
+            error = None
+            try:
+                value = core._or_default(raw_value, field.name, field.default, field.allow_none)
+                parse_start = core._timer() if observed else None
+                value = core._CASTERS[field.kind](value, field.allow_none, **field.options)
+            except KeyError as err:
+                error = err
+                missing.append(field.name)
+            except ValueError as err:
+                error = err
+                errors[field.name] = [str(err)]
+            else:
+                messages = field.check(value) if field.check is not None else None
+                if messages:
+                    errors[field.name] = messages
+                else:
+                    values.append((field.attr, value))
+            if observed:
+                core._report(field.kind, field.name, alias, field.default, field.allow_none, start, parse_start,
+                             error)
+        return values, missing, errors
+
+    @classmethod
+    def validate(cls, environ=None):
+        """Check every field without raising, ex: in a readiness probe.
+
+        Args:
+            environ: The mapping to read from, defaults to ``os.environ``
+
+        Returns:
+            A dict of invalid or missing variable names to their error messages, empty when all are valid.
+        """
+        _values, missing, errors = cls._resolve(environ)
+        for name in missing:
+            errors[name] = ['is not set']
+        return errors
+
+    def __setattr__(self, attr, value):
+        raise AttributeError('{0} is immutable'.format(type(self).__name__))
+
+    def __delattr__(self, attr):
+        raise AttributeError('{0} is immutable'.format(type(self).__name__))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.as_dict() == other.as_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(field.attr, getattr(self, field.attr)) for field in self._fields))
+
+    def as_dict(self):
+        """Return the resolved values as a dict keyed by attribute name."""
+        return dict((field.attr, getattr(self, field.attr)) for field in self._fields)
+
+
+Schema = SchemaMeta('Schema', (_SchemaBase, ), {
+    '__slots__': (),
+    '__doc__': """Base class for declarative environment schemas.
+
+    Declare :class:`Field` attributes on a subclass; instantiating it resolves
+    every field in one pass and returns an immutable object.
+    """,
+})
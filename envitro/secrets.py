@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Read secrets from files named by ``<NAME>_FILE`` variables.
+
+Docker and Kubernetes commonly pass secrets as files, with the environment
+only holding the path: ``DB_PASSWORD_FILE=/run/secrets/db_password``. Once
+enabled, a variable missing from the environment is read from the file named
+by its ``_FILE`` variable. File contents are cached until the file's mtime or
+size changes, and batch reads (:func:`envitro.core.read_many`, the batch
+getters and schemas) read all the needed files concurrently.
+
+Examples:
+    >>> envitro.secrets.enable()
+    >>> envitro.str('DB_PASSWORD')  # reads $DB_PASSWORD_FILE if DB_PASSWORD isn't set
+"""
+from __future__ import absolute_import
+
+import io
+import os
+import threading
+
+from . import core
+
+
+class SecretFileSource(object):
+    """A source reading ``NAME`` from the file named by ``NAME<suffix>``.
+
+    Args:
+        suffix: The suffix of the variables holding the file paths
+        max_workers: The number of threads used to read files in :meth:`prefetch`
+    """
+
+    def __init__(self, suffix='_FILE', max_workers=8):
+        self.suffix = suffix
+        self.max_workers = max_workers
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def path(self, name):
+        """Return the secret file path for a variable, or `None`."""
+        if name.endswith(self.suffix):
+            return None
+        return core.environ.get(name + self.suffix)
+
+    def keys(self):
+        """Return the names of the variables with a secret file path set."""
+        return [name[:-len(self.suffix)] for name in list(core.environ) if name.endswith(self.suffix)]
+
+    def read_file(self, path):
+        """Read a secret file, reusing the cached contents while its mtime and size are unchanged.
+
+        Args:
+            path: The file path
+        """
+        stat = os.stat(path)
+        key = (getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with io.open(path, encoding='utf-8') as secret_file:
+            value = secret_file.read()
+        with self._lock:
+            self._cache[path] = (key, value)
+        return value
+
+    def _read_or_none(self, path):
+        try:
+            return self.read_file(path)
+        except (IOError, OSError):
+            return None
+
+    def get(self, name, default=None):
+        """Return the contents of the secret file for a variable, or the default.
+
+        A missing or unreadable secret file is treated like a missing variable.
+        """
+        path = self.path(name)
+        if not path:
+            return default
+        value = self._read_or_none(path)
+        return default if value is None else value
+
+    def prefetch(self, names):
+        """Read the secret files of several variables concurrently.
+
+        Variables that are set or have no secret file are skipped, unreadable files are ignored.
+
+        Args:
+            names: The environment variable names
+        """
+        paths = set()
+        for name in names:
+            path = self.path(name) if name not in core.environ else None
+            if path:
+                paths.add(path)
+
+        if len(paths) < 2 or self.max_workers < 2:
+            for path in paths:
+                self._read_or_none(path)
+            return
+
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+        except ImportError:
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(min(self.max_workers, len(paths)))
+            try:
+                pool.map(self._read_or_none, paths)
+            finally:
+                pool.close()
+        else:
+            with ThreadPoolExecutor(min(self.max_workers, len(paths))) as executor:
+                list(executor.map(self._read_or_none, paths))
+
+    def clear(self):
+        """Drop every cached file."""
+        with self._lock:
+            self._cache.clear()
+
+
+_source = None
+
+
+def enable(suffix='_FILE', max_workers=8):
+    """Read missing variables from their ``_FILE`` secret files.
+
+    Args:
+        suffix: The suffix of the variables holding the file paths
+        max_workers: The number of threads used to read files for batch reads
+
+    Returns:
+        The registered :class:`SecretFileSource`.
+    """
+    global _source  # pylint: disable=W0603
+    disable()
+    _source = SecretFileSource(suffix, max_workers)
+    core.add_source(_source)
+    return _source
+
+
+def disable():
+    """Stop reading missing variables from secret files."""
+    global _source  # pylint: disable=W0603
+    if _source is not None:
+        core.remove_source(_source)
+        _source = None
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=W0622
+"""Memoized, typed views of the environment.
+
+A snapshot captures the environment once and remembers every parsed value, so
+repeated lookups are a dictionary hit instead of a read and a parse. Values
+changed through :func:`envitro.core.write` (and therefore the
+:func:`envitro.decorators.write` decorator) are picked up automatically, and
+snapshots are reset in forked child processes.
+
+A snapshot's parsed values can be saved to a compact binary file and loaded
+by other processes (ex: short lived workers) without parsing anything. The
+file records a checksum of the raw values it was built from, a worker whose
+environment differs ignores the file and reads the environment as usual.
+"""
+from __future__ import absolute_import
+
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import weakref
+
+from . import core
+
+_MISSING = object()
+
+# every live snapshot, kept in sync with ``core.write``
+_SNAPSHOTS = weakref.WeakSet()
+
+# frozen file header: magic, format version, marshal version, checksum, size of the marshaled names
+_HEADER = struct.Struct('<4sHH32sI')
+_MAGIC = b'ENVF'
+_FORMAT_VERSION = 1
+
+
+class Snapshot(object):
+    """A memoized view of the environment.
+
+    The getters have the same signature and semantics as the ones in
+    :mod:`envitro.core`. Parsed values are cached by variable name, getter,
+    separator and fallback chain.
+
+    Changes made directly to ``os.environ`` are not seen until :meth:`reset`
+    is called; changes made with :func:`envitro.core.write` are. Nothing is
+    memoized while a provider chain is in use (see
+    :func:`envitro.core.use_chain`), its providers cache and expire their own
+    lookups, or while :func:`envitro.core.override` is active.
+
+    Examples:
+        >>> config = envitro.Snapshot()
+        >>> config.int('WORKERS', 4)
+        4
+    """
+
+    def __init__(self):
+        self._environ = {}
+        self._values = {}
+        self._keys = {}
+        self.frozen = False
+        self.reset()
+        _SNAPSHOTS.add(self)
+
+    def reset(self):
+        """Capture the environment again and drop every cached value."""
+        self._environ = dict(core.environ)
+        self._values.clear()
+        self._keys.clear()
+        self.frozen = False
+
+    def invalidate(self, name):
+        """Refresh a single variable and drop the cached values that depend on it.
+
+        Args:
+            name: The environment variable name
+        """
+        raw_value = core.environ.get(name)
+        if raw_value is None:
+            self._environ.pop(name, None)
+        else:
+            self._environ[name] = raw_value
+
+        for key in self._keys.pop(name, ()):
+            self._values.pop(key, None)
+
+    def _lookup(self, names):
+        overlay = core._overlay.get()
+        chain = core._chain
+        environ = self._environ
+        for name in names:
+            if overlay is not None and name in overlay:
+                raw_value = overlay[name]
+            elif chain is not None:
+                raw_value = chain.get(name)
+            else:
+                raw_value = environ.get(name)
+                if raw_value is None:
+                    for source in core._sources:
+                        raw_value = source.get(name)
+                        if raw_value is not None:
+                            break
+            if raw_value is not None:
+                return raw_value
+        return _MISSING
+
+    def _alias(self, names):
+        for name in names:
+            if self._lookup((name, )) is not _MISSING:
+                return name
+        return None
+
+    def _value(self, kind, name, default, allow_none, fallback, separator=None):
+        if not core._observers:
+            return self._memoized(kind, name, default, allow_none, fallback, separator)
+
+        start = core._timer()
+        error = None
+        try:
+            return self._memoized(kind, name, default, allow_none, fallback, separator)
+        except Exception as err:
+            error = err
+            raise
+        finally:
+            alias = self._alias((name, ) + core._fallback_names(fallback))
+            core._report(kind, name, alias, default, allow_none, start, None, error)
+
+    def _memoized(self, kind, name, default, allow_none, fallback, separator=None):
+        names = (name, ) + core._fallback_names(fallback)
+        key = (kind, names, separator)
+        caster = core._CASTERS[kind]
+        options = {} if separator is None else {'separator': separator}
+
+        if core._chain is not None or core._overlay.get() is not None:
+            raw_value = self._lookup(names)
+            raw_value = None if raw_value is _MISSING else raw_value
+            return caster(core._or_default(raw_value, name, default, allow_none), allow_none, **options)
+
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            raw_value = self._lookup(names)
+            value = None if raw_value is _MISSING else caster(raw_value, allow_none, **options)
+            self._values[key] = value
+            for dependency in names:
+                self._keys.setdefault(dependency, set()).add(key)
+
+        if value is None:
+            return caster(core._or_default(None, name, default, allow_none), allow_none, **options)
+        else:
+            return value
+
+    def isset(self, name):
+        """Return a boolean if the environment variable is set or not.
+
+        Args:
+            name: The environment variable name
+        """
+        return self._lookup((name, )) not in (_MISSING, '')
+
+    def read(self, name, default=None, allow_none=False, fallback=None):
+        """Read the raw env value.
+
+        Args:
+            name: The environment variable name
+            default: The default value to use if no environment variable is found
+            allow_none: If the return value can be `None` (i.e. optional)
+            fallback: A list of fallback env variables to try and read if the primary environment
+                      variable is unavailable.
+        """
+        names = (name, ) + core._fallback_names(fallback)
+        start = core._timer() if core._observers else None
+        raw_value = self._lookup(names)
+        raw_value = None if raw_value is _MISSING else raw_value
+        if start is not None:
+            return core._observe_value('read', None, name, self._alias(names), raw_value, default, allow_none, start)
+        return core._or_default(raw_value, name, default, allow_none)
+
+    def str(self, name, default=None, allow_none=False, fallback=None):
+        """Get a string based environment value or the default."""
+        return self._value('str', name, default, allow_none, fallback)
+
+    def bool(self, name, default=None, allow_none=False, fallback=None):
+        """Get a boolean based environment value or the default."""
+        return self._value('bool', name, default, allow_none, fallback)
+
+    def int(self, name, default=None, allow_none=False, fallback=None):
+        """Get an integer environment value or the default."""
+        return self._value('int', name, default, allow_none, fallback)
+
+    def float(self, name, default=None, allow_none=False, fallback=None):
+        """Get a float environment value or the default."""
+        return self._value('float', name, default, allow_none, fallback)
+
+    def list(self, name, default=None, allow_none=False, fallback=None, separator=','):
+        """Get a list of strings or the default.
+
+        A new list is returned on every call so the cached value can't be modified.
+        """
+        value = self._value('list', name, default, allow_none, fallback, separator)
+        return value if value is None else value[:]
+
+    def tuple(self, name, default=None, allow_none=False, fallback=None, separator=','):
+        """Get a tuple of strings or the default."""
+        return self._value('tuple', name, default, allow_none, fallback, separator)
+
+    def frozenset(self, name, default=None, allow_none=False, fallback=None, separator=','):
+        """Get a frozenset of strings or the default."""
+        return self._value('frozenset', name, default, allow_none, fallback, separator)
+
+    def prime(self, fields):
+        """Resolve and memoize every field of a schema.
+
+        Missing variables are memoized as missing, no error is raised.
+
+        Args:
+            fields: A :class:`envitro.schema.Schema` subclass or an iterable of fields
+        """
+        for field in getattr(fields, '_fields', fields):
+            self._memoized(field.kind, field.name, field.default, True, field.fallback,
+                           field.options.get('separator'))
+
+    def _checksum(self, names):
+        digest = hashlib.sha256()
+        for name in names:
+            raw_value = self._lookup((name, ))
+            if raw_value is _MISSING:
+                digest.update(b'\x00')
+            else:
+                # python 2 environment values are already bytes, only text is encoded
+                digest.update(b'\x01' + (raw_value if isinstance(raw_value, bytes) else raw_value.encode('utf-8')))
+            digest.update(b'\x00')
+        return digest.digest()
+
+    def save(self, path):
+        """Save the memoized values to a frozen snapshot file.
+
+        Values of custom types that can't be serialized with :mod:`marshal` are
+        left out, they are parsed again by the processes loading the file.
+
+        Args:
+            path: The file path, the file is replaced atomically
+        """
+        entries = []
+        for key, value in self._values.items():
+            try:
+                marshal.dumps((key, value))
+            except ValueError:
+                continue
+            entries.append((key, value))
+
+        names = tuple(sorted(set(name for (_kind, names, _separator), _value in entries for name in names)))
+        names_data = marshal.dumps(names)
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, marshal.version, self._checksum(names), len(names_data))
+
+        temporary = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(temporary, 'wb') as frozen_file:
+            frozen_file.write(header)
+            frozen_file.write(names_data)
+            frozen_file.write(marshal.dumps(tuple(entries)))
+        getattr(os, 'replace', os.rename)(temporary, path)
+
+    @classmethod
+    def load(cls, path):
+        """Create a snapshot from a frozen snapshot file.
+
+        The file is memory mapped and its values are used as-is when the
+        variables they were parsed from still have the same raw values.
+        Otherwise (or if the file is missing or was written by another version)
+        the snapshot reads the environment like any other snapshot. The
+        :attr:`frozen` attribute tells if the file was used.
+
+        Args:
+            path: The file path
+        """
+        snapshot = cls()
+        try:
+            with open(path, 'rb') as frozen_file:
+                data = mmap.mmap(frozen_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            return snapshot
+
+        try:
+            if len(data) < _HEADER.size:
+                return snapshot
+            magic, version, marshal_version, checksum, names_size = _HEADER.unpack_from(data)
+            if (magic, version, marshal_version) != (_MAGIC, _FORMAT_VERSION, marshal.version):
+                return snapshot
+
+            names_end = _HEADER.size + names_size
+            try:
+                names = marshal.loads(data[_HEADER.size:names_end])
+                if snapshot._checksum(names) != checksum:
+                    return snapshot
+                entries = marshal.loads(data[names_end:])
+            except (EOFError, ValueError, TypeError):
+                return snapshot
+
+            for key, value in entries:
+                snapshot._values[key] = value
+                for dependency in key[1]:
+                    snapshot._keys.setdefault(dependency, set()).add(key)
+            snapshot.frozen = True
+        finally:
+            data.close()
+        return snapshot
+
+
+def _invalidate_all(name):
+    for snapshot in _SNAPSHOTS:
+        snapshot.invalidate(name)
+
+
+def _reset_all():
+    for snapshot in _SNAPSHOTS:
+        snapshot.reset()
+
+
+core._write_hooks.append(_invalidate_all)
+
+# prefork servers copy the parent's snapshots, start the children from a clean slate
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_all)  # pylint: disable=E1101
@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+"""Additional sources of environment variables.
+
+Sources are consulted by the envitro getters for variables missing from
+``os.environ`` once they are registered with :func:`envitro.core.add_source`.
+
+Providers go further: a :class:`Chain` of providers, installed with
+:func:`envitro.core.use_chain`, replaces ``os.environ`` as the place every
+getter reads from, in the precedence order of the chain. Providers cache their
+lookups for a configurable time in a bounded LRU cache, and the chain records
+which provider served each variable.
+
+Examples:
+    >>> chain = envitro.sources.Chain([
+    ...     envitro.sources.EnvironProvider(),
+    ...     envitro.sources.DotenvProvider('.env'),
+    ...     envitro.sources.SqliteProvider('config.db', ttl=30),
+    ... ])
+    >>> envitro.use_chain(chain)
+    >>> envitro.int('WORKERS')
+    4
+    >>> chain.provider('WORKERS')
+    'dotenv:.env'
+"""
+from __future__ import absolute_import
+
+import abc
+import collections
+import io
+import os
+import re
+import threading
+import time
+
+from . import core
+
+try:
+    string_types = (str, unicode)  # pylint: disable=E0602
+except NameError:
+    string_types = (str, )
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+_UNLOADED = object()
+
+# base class of the abstract classes, the metaclass syntax differs between python 2 and 3
+_Abstract = abc.ABCMeta('_Abstract', (object, ), {})
+
+
+def _stat_key(stat):
+    return (stat.st_ino, getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size)
+
+
+class DirectorySource(object):
+    """Variables stored in a directory, one file per variable.
+
+    This is the layout of Kubernetes ConfigMap and Secret volumes: the file
+    name is the variable name and the file content is the raw value. Hidden
+    files (including the Kubernetes ``..data`` bookkeeping) are ignored.
+
+    The directory is listed on the first lookup (or when the source is added
+    with :func:`envitro.core.add_source`), and file contents are only read
+    when they are looked up. Files removed while the directory is being
+    checked are skipped. The directory is checked for changes at most
+    every ``poll_interval`` seconds: when Kubernetes atomically swaps the
+    ``..data`` symlink (or, for other directories, on every check) the files
+    are stat-ed again and only the ones whose inode, mtime or size changed are
+    reloaded. Subscribers are notified with the names that changed.
+
+    Args:
+        path: The directory path
+        poll_interval: The minimum number of seconds between checks for changes,
+                       ``None`` to only check when :meth:`refresh` is called
+
+    Examples:
+        >>> config = envitro.sources.DirectorySource('/etc/config')
+        >>> envitro.add_source(config)
+        >>> config.subscribe(lambda source, names: log.info('reloaded %s', names))
+    """
+
+    def __init__(self, path, poll_interval=1.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._entries = None
+        self._signature = None
+        self._checked = 0
+        self._subscribers = []
+        self._lock = threading.RLock()
+        self._watcher = None
+
+    def _signature_now(self):
+        try:
+            return os.readlink(os.path.join(self.path, '..data'))
+        except OSError:
+            return None
+
+    def _read_file(self, name):
+        with io.open(os.path.join(self.path, name), encoding='utf-8') as value_file:
+            return value_file.read()
+
+    def _scan(self):
+        """Stat the directory files, returning the names that changed."""
+        previous = self._entries or {}
+        entries = {}
+        changed = set()
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            names = []
+
+        for name in names:
+            if name.startswith('.'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except OSError:
+                continue
+            if not os.path.isfile(os.path.join(self.path, name)):
+                continue
+
+            key = _stat_key(stat)
+            entry = previous.get(name)
+            if entry is not None and entry[0] == key:
+                entries[name] = entry
+            elif entry is not None and entry[1] is not _UNLOADED:
+                try:
+                    value = self._read_file(name)
+                except (IOError, OSError):
+                    # removed since it was stat-ed, reported as removed
+                    continue
+                entries[name] = (key, value)
+                if value != entry[1]:
+                    changed.add(name)
+            else:
+                entries[name] = (key, _UNLOADED)
+                changed.add(name)
+
+        changed.update(name for name in previous if name not in entries)
+        self._entries = entries
+        return changed
+
+    def refresh(self):
+        """Check the directory for changes now and notify the subscribers.
+
+        Returns:
+            The set of variable names that changed.
+        """
+        with self._lock:
+            self._checked = _monotonic()
+            signature = self._signature_now()
+            if self._entries is not None and signature is not None and signature == self._signature:
+                return set()
+
+            first_scan = self._entries is None
+            self._signature = signature
+            changed = self._scan()
+            if first_scan:
+                return set()
+
+        if changed:
+            core._changed(changed)
+            for subscriber in list(self._subscribers):
+                subscriber(self, changed)
+        return changed
+
+    def _poll(self):
+        if self._entries is None or (
+                self.poll_interval is not None and _monotonic() - self._checked >= self.poll_interval):
+            self.refresh()
+
+    def get(self, name, default=None):
+        """Return the raw value of a variable, or the default."""
+        self._poll()
+        entry = self._entries.get(name)
+        if entry is None:
+            return default
+
+        value = entry[1]
+        if value is _UNLOADED:
+            with self._lock:
+                try:
+                    value = self._read_file(name)
+                except (IOError, OSError):
+                    return default
+                if self._entries.get(name) is entry:
+                    self._entries[name] = (entry[0], value)
+        return value
+
+    def names(self):
+        """Return the variable names in the directory."""
+        self._poll()
+        return sorted(self._entries)
+
+    # :func:`envitro.core.add_source` invalidates the snapshots and plans through ``keys()``
+    keys = names
+
+    def subscribe(self, callback):
+        """Call ``callback(source, names)`` with the set of changed names after every reload.
+
+        Args:
+            callback: The function to call
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop calling a subscribed callback.
+
+        Args:
+            callback: The function to remove
+        """
+        self._subscribers.remove(callback)
+
+    def watch(self, interval=None):
+        """Check for changes in a background daemon thread.
+
+        Args:
+            interval: The number of seconds between checks, defaults to ``poll_interval``
+        """
+        interval = interval or self.poll_interval or 1.0
+        stopped = threading.Event()
+
+        def _watch():
+            while not stopped.wait(interval):
+                self.refresh()
+
+        self.stop()
+        self._watcher = stopped
+        thread = threading.Thread(target=_watch, name='envitro-watch-{0}'.format(self.path))
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        """Stop the background thread started by :meth:`watch`."""
+        if self._watcher is not None:
+            self._watcher.set()
+            self._watcher = None
+
+
+class Provider(_Abstract):
+    """Base class of the providers, caching the lookups of :meth:`lookup`.
+
+    Lookups (including misses) are cached for ``ttl`` seconds, in a least
+    recently used cache of at most ``maxsize`` variables.
+
+    Args:
+        ttl: The number of seconds a lookup is cached, `None` to cache until :meth:`clear`,
+             0 to disable the cache
+        maxsize: The maximum number of cached variables
+    """
+    name = 'provider'
+
+    def __init__(self, ttl=None, maxsize=256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def lookup(self, name):
+        """Return the raw value of a variable, or `None`, bypassing the cache."""
+
+    def get(self, name, default=None):
+        """Return the raw value of a variable, or the default."""
+        if self.ttl == 0 or self.maxsize <= 0:
+            value = self.lookup(name)
+            return default if value is None else value
+
+        now = _monotonic()
+        with self._lock:
+            entry = self._cache.pop(name, None)
+            if entry is not None and (self.ttl is None or now - entry[1] < self.ttl):
+                self._cache[name] = entry
+                return default if entry[0] is None else entry[0]
+
+        value = self.lookup(name)
+        self._store(name, value, now)
+        return default if value is None else value
+
+    def _store(self, name, value, now):
+        with self._lock:
+            self._cache[name] = (value, now)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached lookup."""
+        with self._lock:
+            self._cache.clear()
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self.name)
+
+
+class EnvironProvider(Provider):
+    """The process environment, not cached by default."""
+    name = 'environ'
+
+    def __init__(self, ttl=0, maxsize=256):
+        super(EnvironProvider, self).__init__(ttl, maxsize)
+
+    def lookup(self, name):
+        return core.environ.get(name)
+
+
+class _FileProvider(Provider):
+    """A file parsed into a mapping, parsed again when its mtime or size changes."""
+
+    def __init__(self, path, ttl=1.0, maxsize=256):
+        super(_FileProvider, self).__init__(ttl, maxsize)
+        self.path = path
+        self.name = '{0}:{1}'.format(self.kind, path)
+        self._stat = None
+        self._mapping = {}
+
+    @abc.abstractmethod
+    def _parse(self):
+        """Return the file contents as a dict of variable names to raw values."""
+
+    def lookup(self, name):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        key = _stat_key(stat)
+        if key != self._stat:
+            self._mapping = self._parse()
+            self._stat = key
+        return self._mapping.get(name)
+
+
+class DotenvProvider(_FileProvider):
+    """Variables of a dotenv file (see :mod:`envitro.dotenv`).
+
+    Args:
+        path: The file path
+        ttl: The number of seconds a lookup is cached
+        maxsize: The maximum number of cached variables
+    """
+    kind = 'dotenv'
+
+    def _parse(self):
+        from . import dotenv
+        return dict(dotenv.read(self.path))
+
+
+def _to_raw(value):
+    """Convert a decoded JSON value to the raw string the getters expect."""
+    import json
+    if isinstance(value, string_types):
+        return value
+    elif value is None:
+        return None
+    return json.dumps(value)
+
+
+class JsonFileProvider(_FileProvider):
+    """Variables of the top level object of a JSON file.
+
+    Strings are used as-is, other values (numbers, booleans, objects) are
+    converted back to JSON so they can be parsed by the typed getters.
+
+    Args:
+        path: The file path
+        ttl: The number of seconds a lookup is cached
+        maxsize: The maximum number of cached variables
+    """
+    kind = 'json'
+
+    def _parse(self):
+        import json
+        with io.open(self.path, encoding='utf-8') as json_file:
+            return dict((key, _to_raw(value)) for key, value in json.load(json_file).items())
+
+
+class IniFileProvider(_FileProvider):
+    """Variables of a section of an INI file, variable names are case sensitive.
+
+    Args:
+        path: The file path
+        section: The section name, defaults to the ``DEFAULT`` section
+        ttl: The number of seconds a lookup is cached
+        maxsize: The maximum number of cached variables
+    """
+    kind = 'ini'
+
+    def __init__(self, path, section=None, ttl=1.0, maxsize=256):
+        super(IniFileProvider, self).__init__(path, ttl, maxsize)
+        self.section = section
+
+    def _parse(self):
+        try:
+            from configparser import RawConfigParser
+        except ImportError:
+            from ConfigParser import RawConfigParser
+
+        parser = RawConfigParser()
+        parser.optionxform = str
+        with io.open(self.path, encoding='utf-8') as ini_file:
+            getattr(parser, 'read_file', getattr(parser, 'readfp', None))(ini_file)
+        if self.section is None:
+            return dict(parser.defaults())
+        if not parser.has_section(self.section):
+            return {}
+        return dict(parser.items(self.section))
+
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class SqliteProvider(Provider):
+    """Variables stored in a table of a local SQLite database.
+
+    Args:
+        path: The database path
+        table: The table name
+        key_column: The column holding the variable names
+        value_column: The column holding the raw values
+        ttl: The number of seconds a lookup is cached
+        maxsize: The maximum number of cached variables
+    """
+
+    def __init__(self, path, table='environment', key_column='name', value_column='value', ttl=1.0, maxsize=256):
+        for identifier in (table, key_column, value_column):
+            if not _IDENTIFIER.match(identifier):
+                raise ValueError('Invalid SQL identifier: {0}'.format(identifier))
+        super(SqliteProvider, self).__init__(ttl, maxsize)
+        self.path = path
+        self.name = 'sqlite:{0}'.format(path)
+        self._select = 'SELECT {0}, {1} FROM {2} WHERE {0} IN ({{0}})'.format(key_column, value_column, table)
+        self._connection = None
+
+    def _query(self, names):
+        import sqlite3
+        with self._lock:
+            if self._connection is None:
+                self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            cursor = self._connection.execute(self._select.format(', '.join('?' * len(names))), names)
+            return dict(cursor.fetchall())
+
+    def lookup(self, name):
+        return self._query([name]).get(name)
+
+    def prefetch(self, names):
+        """Load several variables with a single query.
+
+        Args:
+            names: The variable names
+        """
+        names = sorted(set(names))
+        if not names or self.ttl == 0 or self.maxsize <= 0:
+            return
+        values = self._query(names)
+        now = _monotonic()
+        for name in names:
+            self._store(name, values.get(name), now)
+
+    def close(self):
+        """Close the database connection, it's opened again on the next lookup."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class Chain(object):
+    """Providers consulted in order, the first one with a value wins.
+
+    Any object with a ``get`` method can be part of the chain (ex: a
+    :class:`DirectorySource`). Install the chain with
+    :func:`envitro.core.use_chain`, or add it with
+    :func:`envitro.core.add_source` to only consult it for variables missing
+    from ``os.environ``.
+
+    Args:
+        providers: The providers, highest precedence first
+    """
+
+    def __init__(self, providers):
+        self.providers = list(providers)
+        self._served = {}
+
+    def get(self, name, default=None):
+        """Return the raw value from the first provider that has it, or the default."""
+        for provider in self.providers:
+            value = provider.get(name)
+            if value is not None:
+                self._served[name] = provider
+                return value
+        self._served.pop(name, None)
+        return default
+
+    def prefetch(self, names):
+        """Let the providers that support it load several variables at once."""
+        for provider in self.providers:
+            prefetch = getattr(provider, 'prefetch', None)
+            if prefetch is not None:
+                prefetch(names)
+
+    def provider(self, name):
+        """Return the name of the provider that served the last lookup of a variable, or `None`."""
+        provider = self._served.get(name)
+        if provider is None:
+            return None
+        return getattr(provider, 'name', type(provider).__name__)
+
+    def clear(self):
+        """Drop the cached lookups of every provider."""
+        for provider in self.providers:
+            clear = getattr(provider, 'clear', None)
+            if clear is not None:
+                clear()
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=W0622
+"""Validation rules for environment variables.
+
+Rules check parsed values (ranges, choices, patterns, lengths or any
+predicate). A list of rules is compiled once into a single checker, so
+checking a value is a few function calls. Rules can be attached to a getter
+with :func:`validated`, to a :class:`envitro.schema.Field`, or declared with
+:func:`declare`; :func:`validate_all` then checks every declared variable
+(and schema) in one pass and reports every problem at once.
+
+Examples:
+    >>> from envitro.validators import choices, maximum, minimum, regex
+    >>> port = envitro.validators.validated(envitro.int, minimum(1), maximum(65535))
+    >>> port('PORT', 8080)
+    8080
+    >>> envitro.validators.declare(envitro.str, 'LOG_LEVEL', [choices(['debug', 'info', 'error'])], default='info')
+    >>> envitro.validators.declare(envitro.str, 'REGION', [regex(r'[a-z]{2}-[a-z]+-\\d')])
+    >>> envitro.validators.validate_all(Config)  # raises a ValidationError listing every problem
+"""
+from __future__ import absolute_import
+
+import collections
+import functools
+import numbers
+import operator
+import re
+
+_NOT_SET = 'is not set'
+
+
+class ValidationError(ValueError):
+    """One or more environment variables are invalid.
+
+    Attributes:
+        errors: A dict of variable names to the list of their error messages
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super(ValidationError, self).__init__('Invalid environment variable(s): {0}'.format('; '.join(
+            '"{0}" {1}'.format(name, ', '.join(messages)) for name, messages in sorted(errors.items()))))
+
+
+class Rule(object):
+    """A compiled validation rule.
+
+    Calling the rule with a parsed value returns an error message, or `None`
+    if the value is valid.
+
+    Args:
+        check: The checker closure
+        description: What the rule requires (ex: ``'must be >= 1'``)
+    """
+    __slots__ = ('check', 'description')
+
+    def __init__(self, check, description):
+        self.check = check
+        self.description = description
+
+    def __call__(self, value):
+        return self.check(value)
+
+    def __repr__(self):
+        return 'Rule({0!r})'.format(self.description)
+
+
+def _bound(limit, message, outside):
+    """A rule comparing the value with ``limit``, numeric limits only accept numbers.
+
+    Python 2 orders values of any types (ex: a string is never < 1), the explicit
+    check makes the rule report the wrong type like on python 3.
+    """
+    numeric = isinstance(limit, numbers.Number)
+
+    def check(value):
+        if numeric and not isinstance(value, numbers.Number):
+            raise TypeError('not a number')
+        return message if outside(value, limit) else None
+
+    return Rule(check, message)
+
+
+def minimum(limit):
+    """The value must be greater than or equal to ``limit``."""
+    return _bound(limit, 'must be >= {0!r}'.format(limit), operator.lt)
+
+
+def maximum(limit):
+    """The value must be less than or equal to ``limit``."""
+    return _bound(limit, 'must be <= {0!r}'.format(limit), operator.gt)
+
+
+def choices(values):
+    """The value must be one of ``values``, every item must for lists, tuples and sets."""
+    allowed = frozenset(values)
+    message = 'must be one of {0}'.format(', '.join(repr(value) for value in sorted(allowed, key=repr)))
+
+    def check(value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return None if all(item in allowed for item in value) else message
+        return None if value in allowed else message
+
+    return Rule(check, message)
+
+
+def length(min=None, max=None):
+    """The value (a string or a collection) must have between ``min`` and ``max`` items.
+
+    Raises:
+        TypeError: Neither ``min`` nor ``max`` is given.
+    """
+    if min is None and max is None:
+        raise TypeError('length() requires min, max or both')
+    elif min is not None and max is not None:
+        message = 'must have a length between {0} and {1}'.format(min, max)
+    elif min is not None:
+        message = 'must have a length >= {0}'.format(min)
+    else:
+        message = 'must have a length <= {0}'.format(max)
+    low = 0 if min is None else min
+    high = float('inf') if max is None else max
+    return Rule(lambda value: None if low <= len(value) <= high else message, message)
+
+
+def regex(pattern, flags=0):
+    """The value must fully match ``pattern``, every item must for lists, tuples and sets.
+
+    Args:
+        pattern: A regular expression string or compiled pattern
+        flags: The ``re`` flags, when ``pattern`` is a string
+    """
+    compiled = pattern if hasattr(pattern, 'match') else re.compile(pattern, flags)
+    fullmatch = getattr(compiled, 'fullmatch', None)
+    if fullmatch is None:
+        fullmatch = re.compile('(?:{0})\\Z'.format(compiled.pattern), compiled.flags).match
+    message = 'must match {0!r}'.format(compiled.pattern)
+
+    def check(value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return None if all(fullmatch(item) for item in value) else message
+        return None if fullmatch(value) else message
+
+    return Rule(check, message)
+
+
+def predicate(func, message='is invalid'):
+    """The value must satisfy ``func(value)``.
+
+    Args:
+        func: A callable returning a truthy value for valid values
+        message: The error message
+    """
+    return Rule(lambda value: None if func(value) else message, message)
+
+
+def compile_rules(rules):
+    """Compile rules into a single checker.
+
+    Returns:
+        A function returning the list of error messages of a value (empty when
+        valid). `None` values are not checked, a rule that can't be applied to
+        the value's type (ex: ``minimum`` on a string) reports an error too.
+    """
+    checks = tuple((rule.check, rule.description) if isinstance(rule, Rule) else (rule, 'is invalid')
+                   for rule in rules)
+
+    def checker(value):
+        if value is None:
+            return []
+        messages = []
+        for check, description in checks:
+            try:
+                message = check(value)
+            except TypeError:
+                message = '{0}, not {1}'.format(description, type(value).__name__)
+            if message is not None:
+                messages.append(message)
+        return messages
+
+    return checker
+
+
+def _resolve(getter, check, name, kwargs):
+    """Read and check a variable, returning the value and its error messages."""
+    try:
+        value = getter(name, **kwargs)
+    except KeyError:
+        return None, [_NOT_SET]
+    except ValueError as err:
+        return None, [str(err)]
+    return value, check(value)
+
+
+def validated(getter, *rules):
+    """Attach rules to a getter.
+
+    Args:
+        getter: The getter (ex: ``envitro.int``)
+        rules: The rules the parsed value must satisfy
+
+    Returns:
+        A getter with the same signature, raising a :class:`ValidationError` for invalid values.
+    """
+    check = compile_rules(rules)
+
+    @functools.wraps(getter)
+    def wrapper(name, *args, **kwargs):
+        value = getter(name, *args, **kwargs)
+        errors = check(value)
+        if errors:
+            raise ValidationError({name: errors})
+        return value
+
+    return wrapper
+
+
+# declared variables: name -> (getter, getter keyword arguments, compiled checker)
+_declared = collections.OrderedDict()
+
+
+def declare(getter, name, rules=(), **kwargs):
+    """Declare a variable to check in :func:`validate_all`.
+
+    Args:
+        getter: The getter (ex: ``envitro.int``)
+        name: The environment variable name
+        rules: The rules the parsed value must satisfy
+        kwargs: The getter keyword arguments (ex: ``default``, ``fallback``, ``separator``)
+    """
+    _declared[name] = (getter, kwargs, compile_rules(rules))
+
+
+def undeclare(name=None):
+    """Forget a declared variable, or every declared variable when ``name`` is `None`."""
+    if name is None:
+        _declared.clear()
+    else:
+        _declared.pop(name, None)
+
+
+def check(*schemas):
+    """Check every declared variable and schema without raising.
+
+    Args:
+        schemas: :class:`envitro.schema.Schema` subclasses to check as well
+
+    Returns:
+        A dict of invalid variable names to their error messages, empty when all are valid.
+    """
+    errors = {}
+    for name, (getter, kwargs, checker) in list(_declared.items()):
+        messages = _resolve(getter, checker, name, kwargs)[1]
+        if messages:
+            errors[name] = messages
+    for schema in schemas:
+        for name, messages in schema.validate().items():
+            errors.setdefault(name, []).extend(messages)
+    return errors
+
+
+def validate_all(*schemas):
+    """Check every declared variable and schema, reporting all the problems at once.
+
+    Args:
+        schemas: :class:`envitro.schema.Schema` subclasses to check as well
+
+    Raises:
+        ValidationError: Listing every missing, unparsable or invalid variable.
+    """
+    errors = check(*schemas)
+    if errors:
+        raise ValidationError(errors)
@@ -42,6 +42,9 @@ setup(
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     setup_requires=['pytest-runner'],
     tests_require=['pytest', 'mock'],
     test_suite='tests',
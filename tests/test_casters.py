@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import decimal
+import os
+import unittest
+
+import mock
+
+import envitro
+from envitro.schema import Field, Schema
+
+
+class TestCasters(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['CASTER_VALUE'] = ' 3 '
+        if 'CASTER_MISSING' in os.environ:
+            del os.environ['CASTER_MISSING']
+
+    def tearDown(self):
+        if 'CASTER_VALUE' in os.environ:
+            del os.environ['CASTER_VALUE']
+        for name in ('triple', 'counted'):
+            try:
+                envitro.casters.unregister(name)
+            except KeyError:
+                pass
+
+    def test_register(self):
+        triple = envitro.casters.register('triple', lambda raw: int(raw) * 3)
+        self.assertIs(envitro.casters.getter('triple'), triple)
+        self.assertEqual(triple.__name__, 'triple')
+        self.assertEqual(triple('CASTER_VALUE'), 9)
+        self.assertEqual(triple('CASTER_MISSING', '2'), 6)
+        self.assertEqual(triple('CASTER_MISSING', 5), 5)
+        self.assertEqual(triple('CASTER_MISSING', allow_none=True), None)
+        self.assertEqual(triple('CASTER_MISSING', fallback='CASTER_VALUE'), 9)
+        with self.assertRaises(KeyError):
+            triple('CASTER_MISSING')
+
+    def test_memoized(self):
+        func = mock.Mock(side_effect=int)
+        counted = envitro.casters.register('counted', func, maxsize=1)
+        self.assertEqual(counted('CASTER_VALUE'), 3)
+        self.assertEqual(counted('CASTER_VALUE'), 3)
+        self.assertEqual(func.call_count, 1)
+        os.environ['CASTER_VALUE'] = '4'
+        self.assertEqual(counted('CASTER_VALUE'), 4)
+        os.environ['CASTER_VALUE'] = ' 3 '
+        self.assertEqual(counted('CASTER_VALUE'), 3)
+        self.assertEqual(func.call_count, 3)
+
+    def test_builtin(self):
+        with self.assertRaises(ValueError):
+            envitro.casters.register('int', int)
+        with self.assertRaises(ValueError):
+            envitro.casters.unregister('int')
+
+    def test_schema_and_prefixed(self):
+        triple = envitro.casters.register('triple', lambda raw: int(raw) * 3)
+
+        class Config(Schema):
+            value = Field(triple, 'CASTER_VALUE')
+
+        self.assertEqual(Config().value, 9)
+        self.assertEqual(envitro.prefixed('CASTER_VAL', cast=triple), {'UE': 9})
+
+    def test_decimal(self):
+        self.assertEqual(envitro.casters.decimal('CASTER_VALUE'), decimal.Decimal('3'))
+        os.environ['CASTER_VALUE'] = 'nope'
+        with self.assertRaises(ValueError):
+            envitro.casters.decimal('CASTER_VALUE')
+
+    def test_bytesize(self):
+        for raw_value, expected in (('512', 512), ('1kb', 1000), ('1 KiB', 1024), ('512MiB', 512 * 1024 ** 2),
+                                    ('1.5G', 1500000000), ('2TiB', 2 * 1024 ** 4)):
+            os.environ['CASTER_VALUE'] = raw_value
+            self.assertEqual(envitro.casters.bytesize('CASTER_VALUE'), expected)
+        os.environ['CASTER_VALUE'] = '12 parsecs'
+        with self.assertRaises(ValueError):
+            envitro.casters.bytesize('CASTER_VALUE')
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=C0111,C0301,R0904
+import array
+import math
 import unittest
 import os
+import re
 
 import envitro
 
@@ -37,6 +40,21 @@ class TestCore(unittest.TestCase):
         envitro.write('TEST_ALREADY_SET_MISSING', None)
         self.assertEqual(os.environ.get('TEST_ALREADY_SET_MISSING'), None)
 
+    def test_write_failing_hook(self):
+        def failing(name):
+            raise ValueError(name)
+        called = []
+        envitro.core._write_hooks[:0] = [failing]
+        envitro.core._write_hooks.append(called.append)
+        try:
+            with self.assertRaises(ValueError):
+                envitro.write('TEST_SET_HOOK', 'value')
+        finally:
+            envitro.core._write_hooks.remove(failing)
+            envitro.core._write_hooks.remove(called.append)
+            del os.environ['TEST_SET_HOOK']
+        self.assertEqual(called, ['TEST_SET_HOOK'])
+
     def test_read_default(self):
         if 'TEST_DEFAULT_GET' in os.environ:
             del os.environ['TEST_DEFAULT_GET']
@@ -319,3 +337,385 @@ class TestCoreTuple(unittest.TestCase):
 
         os.environ['FALLBACK'] = ' a,b,c'
         self.assertEqual(envitro.tuple('PRIMARY', fallback='FALLBACK'), ('a', 'b', 'c'))
+
+
+class TestCoreIterList(unittest.TestCase):
+
+    def test_iter_list(self):
+        os.environ['TEST_ITER_LIST'] = ' , item1 ,, item2 , item3 ,'
+        items = envitro.iter_list('TEST_ITER_LIST')
+        self.assertEqual(next(items), 'item1')
+        self.assertEqual(list(items), ['item2', 'item3'])
+        os.environ['TEST_ITER_LIST'] = 'item1::item2'
+        self.assertEqual(list(envitro.iter_list('TEST_ITER_LIST', separator='::')), ['item1', 'item2'])
+
+    def test_iter_list_required(self):
+        os.environ['TEST_ITER_LIST'] = ' , '
+        with self.assertRaises(ValueError):
+            list(envitro.iter_list('TEST_ITER_LIST'))
+
+    def test_default_iter_list(self):
+        if 'DOES_NOT_EXIST' in os.environ:
+            del os.environ['DOES_NOT_EXIST']
+        self.assertEqual(list(envitro.iter_list('DOES_NOT_EXIST', ['item1'])), ['item1'])
+        self.assertEqual(list(envitro.iter_list('DOES_NOT_EXIST', 'item1,item2')), ['item1', 'item2'])
+        self.assertEqual(envitro.iter_list('DOES_NOT_EXIST', allow_none=True), None)
+
+
+class TestCoreFrozenset(unittest.TestCase):
+
+    def test_frozenset(self):
+        os.environ['TEST_FROZENSET'] = 'item1, item2,item1,'
+        self.assertEqual(envitro.frozenset('TEST_FROZENSET'), frozenset(['item1', 'item2']))
+
+    def test_frozenset_required(self):
+        os.environ['TEST_FROZENSET'] = ''
+        with self.assertRaises(ValueError):
+            envitro.frozenset('TEST_FROZENSET')
+        os.environ['TEST_FROZENSET'] = ' , ,'
+        with self.assertRaises(ValueError):
+            envitro.frozenset('TEST_FROZENSET')
+
+    def test_default_frozenset(self):
+        if 'DOES_NOT_EXIST' in os.environ:
+            del os.environ['DOES_NOT_EXIST']
+        self.assertEqual(envitro.frozenset('DOES_NOT_EXIST', ['item1']), frozenset(['item1']))
+        self.assertEqual(envitro.frozenset('DOES_NOT_EXIST', 'item1;item2', separator=';'), frozenset(['item1', 'item2']))
+        self.assertEqual(envitro.frozenset('DOES_NOT_EXIST', allow_none=True), None)
+
+    def test_fallback(self):
+        if 'PRIMARY' in os.environ:
+            del os.environ['PRIMARY']
+
+        os.environ['FALLBACK'] = ' a,b,c'
+        self.assertEqual(envitro.frozenset('PRIMARY', fallback='FALLBACK'), frozenset('abc'))
+
+
+class TestCoreRegexSeparator(unittest.TestCase):
+
+    def test_regex_separator(self):
+        os.environ['TEST_REGEX_SEPARATOR'] = 'item1, item2;item3 \n item4'
+        separator = re.compile(r'[,;\s]+')
+        expected = ['item1', 'item2', 'item3', 'item4']
+        self.assertEqual(envitro.list('TEST_REGEX_SEPARATOR', separator=separator), expected)
+        self.assertEqual(envitro.tuple('TEST_REGEX_SEPARATOR', separator=separator), tuple(expected))
+        self.assertEqual(list(envitro.iter_list('TEST_REGEX_SEPARATOR', separator=separator)), expected)
+        self.assertEqual(envitro.frozenset('TEST_REGEX_SEPARATOR', separator=separator), frozenset(expected))
+
+    def test_string_separator_is_literal(self):
+        os.environ['TEST_REGEX_SEPARATOR'] = 'item1.item2|item3'
+        self.assertEqual(envitro.list('TEST_REGEX_SEPARATOR', separator='|'), ['item1.item2', 'item3'])
+
+
+class TestCoreArray(unittest.TestCase):
+
+    def test_array(self):
+        os.environ['TEST_ARRAY'] = ' 1, 2 ,3,'
+        self.assertEqual(envitro.array('TEST_ARRAY'), array.array('l', [1, 2, 3]))
+        self.assertEqual(envitro.array('TEST_ARRAY', typecode='H').typecode, 'H')
+        os.environ['TEST_ARRAY'] = '0.5;1.5'
+        self.assertEqual(envitro.array('TEST_ARRAY', typecode='d', separator=';'), array.array('d', [0.5, 1.5]))
+
+    def test_array_invalid(self):
+        os.environ['TEST_ARRAY'] = '1,a'
+        with self.assertRaises(ValueError):
+            envitro.array('TEST_ARRAY')
+        os.environ['TEST_ARRAY'] = '1,70000'
+        with self.assertRaises(ValueError):
+            envitro.array('TEST_ARRAY', typecode='H')
+        os.environ['TEST_ARRAY'] = ' , '
+        with self.assertRaises(ValueError):
+            envitro.array('TEST_ARRAY')
+
+    def test_default_array(self):
+        if 'DOES_NOT_EXIST' in os.environ:
+            del os.environ['DOES_NOT_EXIST']
+        self.assertEqual(envitro.array('DOES_NOT_EXIST', [1, 2]), array.array('l', [1, 2]))
+        self.assertEqual(envitro.array('DOES_NOT_EXIST', '4,5'), array.array('l', [4, 5]))
+        self.assertEqual(envitro.array('DOES_NOT_EXIST', allow_none=True), None)
+
+
+class TestCoreNdarray(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('NumPy is not installed')
+        self.numpy = numpy
+
+    def test_ndarray(self):
+        os.environ['TEST_NDARRAY'] = ' 1, 2 ,3,'
+        value = envitro.ndarray('TEST_NDARRAY')
+        self.assertEqual(value.dtype, self.numpy.dtype('int64'))
+        self.assertEqual(value.tolist(), [1, 2, 3])
+        self.assertEqual(envitro.ndarray('TEST_NDARRAY', dtype='float32').tolist(), [1.0, 2.0, 3.0])
+
+    def test_ndarray_separator(self):
+        os.environ['TEST_NDARRAY'] = '1.5; 2;;3'
+        self.assertEqual(envitro.ndarray('TEST_NDARRAY', dtype='float64', separator=';').tolist(), [1.5, 2.0, 3.0])
+        self.assertEqual(envitro.ndarray('TEST_NDARRAY', dtype='float64', separator=re.compile(r'\s*;+\s*')).tolist(),
+                         [1.5, 2.0, 3.0])
+
+    def test_ndarray_invalid(self):
+        os.environ['TEST_NDARRAY'] = '1,a'
+        with self.assertRaises(ValueError):
+            envitro.ndarray('TEST_NDARRAY')
+        os.environ['TEST_NDARRAY'] = ' , '
+        with self.assertRaises(ValueError):
+            envitro.ndarray('TEST_NDARRAY')
+
+    def test_ndarray_out_of_range(self):
+        os.environ['TEST_NDARRAY'] = '1,300,'
+        with self.assertRaises(ValueError):
+            envitro.ndarray('TEST_NDARRAY', dtype='uint8')
+        os.environ['TEST_NDARRAY'] = str(2 ** 64)
+        with self.assertRaises(ValueError):
+            envitro.ndarray('TEST_NDARRAY')
+
+
+class TestCoreDict(unittest.TestCase):
+
+    def test_dict(self):
+        os.environ['TEST_DICT'] = ' acme = 100, globex=250 ,,'
+        self.assertEqual(envitro.dict('TEST_DICT'), {'acme': '100', 'globex': '250'})
+        self.assertEqual(envitro.dict('TEST_DICT', value_cast=int), {'acme': 100, 'globex': 250})
+        self.assertEqual(envitro.dict('TEST_DICT', value_cast=envitro.int), {'acme': 100, 'globex': 250})
+        os.environ['TEST_DICT'] = 'debug:yes;cache:no'
+        self.assertEqual(envitro.dict('TEST_DICT', item_separator=';', kv_separator=':', value_cast=envitro.bool),
+                         {'debug': True, 'cache': False})
+
+    def test_dict_read_only(self):
+        os.environ['TEST_DICT'] = 'a=1'
+        with self.assertRaises(TypeError):
+            envitro.dict('TEST_DICT')['b'] = '2'
+        for method, args in (('update', ({'b': '2'}, )), ('pop', ('a', )), ('setdefault', ('b', '2')), ('clear', ())):
+            with self.assertRaises((TypeError, AttributeError)):
+                getattr(envitro.dict('TEST_DICT'), method)(*args)
+        self.assertEqual(envitro.dict('TEST_DICT'), {'a': '1'})
+
+    def test_dict_memoized(self):
+        os.environ['TEST_DICT'] = 'a=1,b=2'
+        self.assertIs(envitro.dict('TEST_DICT'), envitro.dict('TEST_DICT'))
+        self.assertIsNot(envitro.dict('TEST_DICT'), envitro.dict('TEST_DICT', value_cast=int))
+        os.environ['TEST_DICT'] = 'a=3'
+        self.assertEqual(envitro.dict('TEST_DICT'), {'a': '3'})
+
+    def test_dict_invalid(self):
+        for value in ('', 'a=1,b', '=1'):
+            os.environ['TEST_DICT'] = value
+            with self.assertRaises(ValueError):
+                envitro.dict('TEST_DICT')
+
+    def test_default_dict(self):
+        if 'DOES_NOT_EXIST' in os.environ:
+            del os.environ['DOES_NOT_EXIST']
+        self.assertEqual(envitro.dict('DOES_NOT_EXIST', {'a': 1}), {'a': 1})
+        self.assertEqual(envitro.dict('DOES_NOT_EXIST', 'a=1', value_cast=int), {'a': 1})
+        self.assertEqual(envitro.dict('DOES_NOT_EXIST', allow_none=True), None)
+        with self.assertRaises(KeyError):
+            envitro.dict('DOES_NOT_EXIST')
+
+
+class TestCoreJson(unittest.TestCase):
+
+    def test_json(self):
+        os.environ['TEST_JSON'] = ' {"retries": 3, "hosts": ["a", {"port": 80}], "debug": null} '
+        value = envitro.json('TEST_JSON')
+        self.assertEqual(value['retries'], 3)
+        self.assertEqual(value['hosts'], ('a', {'port': 80}))
+        self.assertIsNone(value['debug'])
+        os.environ['TEST_JSON'] = '[1, 2]'
+        self.assertEqual(envitro.json('TEST_JSON'), (1, 2))
+
+    def test_json_immutable(self):
+        os.environ['TEST_JSON'] = '{"nested": {"items": [1]}}'
+        value = envitro.json('TEST_JSON')
+        with self.assertRaises(TypeError):
+            value['nested']['items'] = []
+        with self.assertRaises(AttributeError):
+            value['nested']['items'].append(2)
+        for method, args in (('update', ({'b': 2}, )), ('pop', ('nested', )), ('setdefault', ('b', 2)), ('clear', ())):
+            with self.assertRaises((TypeError, AttributeError)):
+                getattr(value, method)(*args)
+        self.assertEqual(envitro.json('TEST_JSON')['nested']['items'], (1, ))
+        self.assertIs(envitro.json('DOES_NOT_EXIST', value), value)
+
+    def test_json_memoized(self):
+        os.environ['TEST_JSON'] = '{"a": 1}'
+        self.assertIs(envitro.json('TEST_JSON'), envitro.json('TEST_JSON'))
+
+    def test_json_invalid(self):
+        os.environ['TEST_JSON'] = '{"a": '
+        with self.assertRaises(ValueError):
+            envitro.json('TEST_JSON')
+
+    def test_json_standard_library(self):
+        os.environ['TEST_JSON'] = '[NaN, 18446744073709551617]'
+        value = envitro.json('TEST_JSON')
+        self.assertTrue(math.isnan(value[0]))
+        self.assertEqual(value[1], 2 ** 64 + 1)
+
+    def test_json_null_memoized(self):
+        calls = []
+
+        def loads(value):
+            calls.append(value)
+            return None
+
+        os.environ['TEST_JSON'] = 'null'
+        envitro.use_json_loads(loads)
+        try:
+            self.assertIsNone(envitro.json('TEST_JSON'))
+            self.assertIsNone(envitro.json('TEST_JSON'))
+        finally:
+            envitro.use_json_loads(None)
+        self.assertEqual(calls, ['null'])
+
+    def test_json_orjson(self):
+        try:
+            import orjson
+        except ImportError:
+            self.skipTest('orjson is not installed')
+
+        os.environ['TEST_JSON'] = '{"hosts": ["a", "b"]}'
+        envitro.use_json_loads(orjson.loads)
+        try:
+            self.assertEqual(envitro.json('TEST_JSON'), {'hosts': ('a', 'b')})
+            os.environ['TEST_JSON'] = '[NaN]'
+            with self.assertRaises(ValueError):
+                envitro.json('TEST_JSON')
+        finally:
+            envitro.use_json_loads(None)
+        self.assertTrue(math.isnan(envitro.json('TEST_JSON')[0]))
+
+    def test_default_json(self):
+        if 'DOES_NOT_EXIST' in os.environ:
+            del os.environ['DOES_NOT_EXIST']
+        self.assertEqual(envitro.json('DOES_NOT_EXIST', {'a': [1]}), {'a': (1, )})
+        self.assertEqual(envitro.json('DOES_NOT_EXIST', '{"a": 1}'), {'a': 1})
+        self.assertEqual(envitro.json('DOES_NOT_EXIST', allow_none=True), None)
+
+
+class TestCoreReadMany(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['MANY_A'] = ' 1 '
+        os.environ['MANY_B'] = '2'
+        os.environ['MANY_FALLBACK'] = 'yes'
+        for name in ('MANY_MISSING_1', 'MANY_MISSING_2', 'MANY_BOOL'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def test_read_many(self):
+        self.assertEqual(envitro.read_many(['MANY_A', 'MANY_B']), {'MANY_A': ' 1 ', 'MANY_B': '2'})
+        self.assertEqual(envitro.read_many({'MANY_A': None, 'MANY_MISSING_1': 'def'}),
+                         {'MANY_A': ' 1 ', 'MANY_MISSING_1': 'def'})
+        self.assertEqual(envitro.read_many(['MANY_MISSING_1'], allow_none=True), {'MANY_MISSING_1': None})
+
+    def test_read_many_missing(self):
+        with self.assertRaises(KeyError) as context:
+            envitro.read_many(['MANY_A', 'MANY_MISSING_1', 'MANY_MISSING_2'])
+        self.assertIn('MANY_MISSING_1', str(context.exception))
+        self.assertIn('MANY_MISSING_2', str(context.exception))
+
+    def test_typed(self):
+        self.assertEqual(envitro.ints(['MANY_A', 'MANY_B']), {'MANY_A': 1, 'MANY_B': 2})
+        self.assertEqual(envitro.floats({'MANY_A': None, 'MANY_MISSING_1': 0.5}), {'MANY_A': 1.0, 'MANY_MISSING_1': 0.5})
+        self.assertEqual(envitro.strs(['MANY_A']), {'MANY_A': '1'})
+        self.assertEqual(envitro.bools(['MANY_BOOL'], fallback={'MANY_BOOL': 'MANY_FALLBACK'}), {'MANY_BOOL': True})
+        self.assertEqual(envitro.lists(['MANY_A']), {'MANY_A': ['1']})
+        self.assertEqual(envitro.tuples({'MANY_MISSING_1': 'a;b'}, separator=';'), {'MANY_MISSING_1': ('a', 'b')})
+
+
+class TestCorePlan(unittest.TestCase):
+
+    def setUp(self):
+        for name in ('PLAN_PRIMARY', 'PLAN_FALLBACK_1', 'PLAN_FALLBACK_2'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def test_resolve(self):
+        plan = envitro.plan('PLAN_PRIMARY', ['PLAN_FALLBACK_1', 'PLAN_FALLBACK_2'])
+        self.assertIs(plan, envitro.plan('PLAN_PRIMARY', ('PLAN_FALLBACK_1', 'PLAN_FALLBACK_2')))
+        self.assertEqual(plan.read(allow_none=True), None)
+        self.assertEqual(plan.alias, None)
+        self.assertEqual(plan.int(5), 5)
+
+        os.environ['PLAN_FALLBACK_2'] = ' 2 '
+        self.assertEqual(plan.int(), 2)
+        self.assertEqual(plan.alias, 'PLAN_FALLBACK_2')
+        os.environ['PLAN_FALLBACK_2'] = '3'
+        self.assertEqual(plan.str(), '3')
+
+    def test_revalidate(self):
+        plan = envitro.Plan('PLAN_PRIMARY', 'PLAN_FALLBACK_2')
+        os.environ['PLAN_FALLBACK_2'] = 'a,b'
+        self.assertEqual(plan.list(), ['a', 'b'])
+
+        os.environ['PLAN_PRIMARY'] = 'c'
+        self.assertEqual(plan.tuple(), ('c', ))
+        self.assertEqual(plan.alias, 'PLAN_PRIMARY')
+
+        envitro.write('PLAN_PRIMARY', None)
+        self.assertEqual(plan.read(), 'a,b')
+
+        del os.environ['PLAN_FALLBACK_2']
+        with self.assertRaises(KeyError):
+            plan.read()
+
+    def test_same_size_change(self):
+        plan = envitro.plan('PLAN_PRIMARY', ['PLAN_FALLBACK_1'])
+        os.environ['PLAN_FALLBACK_1'] = 'fallback'
+        os.environ['PLAN_FALLBACK_2'] = 'other'
+        self.assertEqual(plan.read(), 'fallback')
+
+        del os.environ['PLAN_FALLBACK_2']
+        os.environ['PLAN_PRIMARY'] = 'primary'
+        self.assertEqual(plan.read(), 'primary')
+        self.assertEqual(plan.alias, 'PLAN_PRIMARY')
+
+
+class TestCoreOverride(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['OVERRIDE_SET'] = 'process'
+        if 'OVERRIDE_MISSING' in os.environ:
+            del os.environ['OVERRIDE_MISSING']
+
+    def tearDown(self):
+        del os.environ['OVERRIDE_SET']
+
+    def test_override(self):
+        with envitro.override({'OVERRIDE_SET': 'context'}, OVERRIDE_MISSING=5):
+            self.assertEqual(envitro.str('OVERRIDE_SET'), 'context')
+            self.assertEqual(envitro.int('OVERRIDE_MISSING'), 5)
+            self.assertEqual(os.environ['OVERRIDE_SET'], 'process')
+            self.assertNotIn('OVERRIDE_MISSING', os.environ)
+        self.assertEqual(envitro.str('OVERRIDE_SET'), 'process')
+        self.assertFalse(envitro.isset('OVERRIDE_MISSING'))
+
+    def test_override_hide_nested(self):
+        with envitro.override(OVERRIDE_SET=None):
+            self.assertFalse(envitro.isset('OVERRIDE_SET'))
+            self.assertEqual(envitro.read('OVERRIDE_MISSING', fallback='OVERRIDE_SET', allow_none=True), None)
+            with envitro.override(OVERRIDE_SET='inner'):
+                self.assertEqual(envitro.read('OVERRIDE_SET'), 'inner')
+            self.assertFalse(envitro.isset('OVERRIDE_SET'))
+        self.assertTrue(envitro.isset('OVERRIDE_SET'))
+
+    def test_override_plan(self):
+        plan = envitro.plan('OVERRIDE_MISSING', 'OVERRIDE_SET')
+        self.assertEqual(plan.read(), 'process')
+        with envitro.override(OVERRIDE_MISSING='context'):
+            self.assertEqual(plan.read(), 'context')
+        self.assertEqual(plan.read(), 'process')
+
+    def test_override_thread(self):
+        import threading
+        seen = []
+        with envitro.override(OVERRIDE_SET='context'):
+            thread = threading.Thread(target=lambda: seen.append(envitro.str('OVERRIDE_SET')))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, ['process'])
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=C0111
 import os
+import sys
 import unittest
 
 import envitro
@@ -98,3 +99,182 @@ class TestBoolDecorator(unittest.TestCase):
         def myfunc():
             return True
         self.assertEqual(myfunc(), None)
+
+
+class TestOnceDecorators(unittest.TestCase):
+
+    def tearDown(self):
+        if 'ENV_VAL' in os.environ:
+            del os.environ['ENV_VAL']
+
+    def test_isset_once(self):
+        os.environ['ENV_VAL'] = 'val'
+        @envitro.decorators.isset('ENV_VAL', once=True)
+        def myfunc(value):
+            return value
+        self.assertEqual(myfunc.__name__, 'myfunc')
+        self.assertEqual(myfunc(1), 1)
+
+        del os.environ['ENV_VAL']
+        self.assertEqual(myfunc(1), 1)
+        myfunc.refresh()
+        self.assertEqual(myfunc(1), None)
+
+    def test_bool_once_write(self):
+        envitro.write('ENV_VAL', 'false')
+        @envitro.decorators.bool('ENV_VAL', once=True)
+        def myfunc():
+            return 'returnval'
+        self.assertEqual(myfunc(), None)
+
+        envitro.write('ENV_VAL', 'true')
+        self.assertEqual(myfunc(), 'returnval')
+
+    def test_bool_once_default(self):
+        @envitro.decorators.bool('ENV_VAL', execute_bool=False, default=False, once=True)
+        def myfunc():
+            return True
+        self.assertTrue(myfunc())
+
+    def test_bool_once_invalid_write(self):
+        envitro.write('ENV_VAL', 'true')
+        snapshot = envitro.Snapshot()
+        self.assertEqual(snapshot.str('ENV_VAL'), 'true')
+
+        @envitro.decorators.bool('ENV_VAL', once=True)
+        def myfunc():
+            return 'returnval'
+        self.assertEqual(myfunc(), 'returnval')
+
+        envitro.write('ENV_VAL', 'maybe')
+        self.assertEqual(snapshot.str('ENV_VAL'), 'maybe')
+        with self.assertRaises(ValueError):
+            myfunc()
+        envitro.write('ENV_VAL', 'false')
+        self.assertEqual(myfunc(), None)
+
+    def test_refresh(self):
+        @envitro.decorators.bool('ENV_VAL', once=True)
+        def myfunc():
+            return 'returnval'
+        self.assertEqual(myfunc(), None)
+
+        os.environ['ENV_VAL'] = 'yes'
+        envitro.decorators.refresh('OTHER_VAL')
+        self.assertEqual(myfunc(), None)
+        envitro.decorators.refresh()
+        self.assertEqual(myfunc(), 'returnval')
+
+
+class TestWriteDecoratorRestore(unittest.TestCase):
+
+    def tearDown(self):
+        if 'ENV_VAL' in os.environ:
+            del os.environ['ENV_VAL']
+
+    def test_restore_on_error(self):
+        os.environ['ENV_VAL'] = 'val'
+        @envitro.decorators.write('ENV_VAL', 'newval')
+        def myfunc():
+            raise RuntimeError()
+
+        with self.assertRaises(RuntimeError):
+            myfunc()
+        self.assertEqual(os.environ['ENV_VAL'], 'val')
+
+    def test_generator(self):
+        os.environ['ENV_VAL'] = 'val'
+        @envitro.decorators.write('ENV_VAL', 'newval')
+        def mygen():
+            yield os.environ['ENV_VAL']
+            yield os.environ['ENV_VAL']
+
+        generator = mygen()
+        self.assertEqual(next(generator), 'newval')
+        self.assertEqual(os.environ['ENV_VAL'], 'val')
+        self.assertEqual(list(generator), ['newval'])
+        self.assertEqual(os.environ['ENV_VAL'], 'val')
+
+    def test_coroutine(self):
+        try:
+            import asyncio
+        except ImportError:
+            return
+
+        os.environ['ENV_VAL'] = 'val'
+        namespace = {'envitro': envitro, 'os': os, 'asyncio': asyncio}
+        exec('''
+@envitro.decorators.write('ENV_VAL', 'newval')
+async def mycoro():
+    await asyncio.sleep(0)
+    return os.environ['ENV_VAL']
+''', namespace)
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(namespace['mycoro']()), 'newval')
+        finally:
+            loop.close()
+        self.assertEqual(os.environ['ENV_VAL'], 'val')
+
+
+class TestOverrideDecorator(unittest.TestCase):
+
+    def tearDown(self):
+        if 'ENV_VAL' in os.environ:
+            del os.environ['ENV_VAL']
+
+    def test_override(self):
+        os.environ['ENV_VAL'] = 'val'
+        @envitro.decorators.override('ENV_VAL', 'newval')
+        def myfunc():
+            return envitro.str('ENV_VAL'), os.environ['ENV_VAL']
+
+        self.assertEqual(myfunc(), ('newval', 'val'))
+        self.assertEqual(envitro.str('ENV_VAL'), 'val')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'contextvars is only available from python 3.7')
+    def test_override_coroutines(self):
+        import asyncio
+
+        namespace = {'envitro': envitro, 'asyncio': asyncio}
+        exec('''
+def make(value):
+    @envitro.decorators.override('ENV_VAL', value)
+    async def mycoro():
+        await asyncio.sleep(0)
+        return envitro.str('ENV_VAL')
+    return mycoro
+
+async def main():
+    return await asyncio.gather(make('a')(), make('b')())
+''', namespace)
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(namespace['main']()), ['a', 'b'])
+        finally:
+            loop.close()
+        self.assertFalse(envitro.isset('ENV_VAL'))
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'coroutine functions need python 3.5')
+    def test_override_coroutines_without_contextvars(self):
+        namespace = {}
+        exec('''
+async def mycoro():
+    pass
+''', namespace)
+        contextvars = envitro.core._contextvars
+        envitro.core._contextvars = None
+        try:
+            with self.assertRaises(TypeError):
+                envitro.decorators.override('ENV_VAL', 'a')(namespace['mycoro'])
+        finally:
+            envitro.core._contextvars = contextvars
+
+    def test_override_generator(self):
+        @envitro.decorators.override('ENV_VAL', 'newval')
+        def mygen():
+            yield envitro.str('ENV_VAL')
+
+        generator = mygen()
+        self.assertFalse(envitro.isset('ENV_VAL'))
+        self.assertEqual(list(generator), ['newval'])
@@ -94,3 +94,78 @@ class TestDocker(unittest.TestCase):
         if envitro.isset('DB_DEFAULT_NONE_PORT'):
             del os.environ['DB_DEFAULT_NONE_PORT']
         self.assertEqual(envitro.docker.port('DB_DEFAULT_NONE', allow_none=True), None)
+
+
+class TestDockerLink(unittest.TestCase):
+
+    def tearDown(self):
+        envitro.write('LINKDB_PORT', None)
+
+    def test_link(self):
+        envitro.write('LINKDB_PORT', 'tcp://172.17.0.82:5432')
+        link = envitro.docker.link('LINKDB')
+        self.assertEqual((link.protocol, link.host, link.port), ('tcp', '172.17.0.82', 5432))
+        self.assertIs(envitro.docker.link('LINKDB'), link)
+        self.assertEqual(envitro.docker.link(' linkdb '), link)
+
+    def test_link_ipv6(self):
+        envitro.write('LINKDB_PORT', 'udp://[fd00::2]:53')
+        self.assertEqual(envitro.docker.link('LINKDB'), envitro.docker.DockerLink('udp', 'fd00::2', 53))
+        self.assertEqual(envitro.docker._split_docker_link('LINKDB'), ['udp', 'fd00::2', '53'])
+
+    def test_link_changed(self):
+        envitro.write('LINKDB_PORT', 'tcp://172.17.0.82:5432')
+        self.assertEqual(envitro.docker.link('LINKDB').port, 5432)
+        envitro.write('LINKDB_PORT', 'tcp://172.17.0.82:6543')
+        self.assertEqual(envitro.docker.link('LINKDB').port, 6543)
+        os.environ['LINKDB_PORT'] = 'tcp://172.17.0.83:6543'
+        self.assertEqual(envitro.docker.link('LINKDB').host, '172.17.0.83')
+
+    def test_link_default(self):
+        self.assertEqual(envitro.docker.link('LINKDB', allow_none=True), None)
+        self.assertEqual(envitro.docker.link('LINKDB', 'fallback'), 'fallback')
+        with self.assertRaises(KeyError):
+            envitro.docker.link('LINKDB')
+
+    def test_link_invalid(self):
+        envitro.write('LINKDB_PORT', 'tcp://172.17.0.82:notaport')
+        with self.assertRaises(ValueError):
+            envitro.docker.link('LINKDB')
+
+
+class TestDockerLinks(unittest.TestCase):
+
+    VARIABLES = {
+        'LINKSDB_PORT': 'tcp://172.17.0.5:5432',
+        'LINKSDB_PORT_5432_TCP': 'tcp://172.17.0.5:5432',
+        'LINKSDB_PORT_5432_TCP_ADDR': '172.17.0.5',
+        'LINKSDB_PORT_5432_TCP_PORT': '5432',
+        'LINKSDB_PORT_5432_TCP_PROTO': 'tcp',
+        'LINKSDB_PORT_53_UDP': 'udp://172.17.0.5:53',
+        'LINKSCACHE_PORT_6379_TCP_ADDR': '172.17.0.6',
+        'LINKSCACHE_PORT_6379_TCP_PORT': '6379',
+        'LINKSNOTALINK_PORT': 'nope',
+    }
+
+    def setUp(self):
+        for name, value in self.VARIABLES.items():
+            envitro.write(name, value)
+
+    def tearDown(self):
+        for name in self.VARIABLES:
+            envitro.write(name, None)
+
+    def test_links(self):
+        links = envitro.docker.links()
+        self.assertNotIn('LINKSNOTALINK', links)
+
+        database = links['LINKSDB']
+        self.assertEqual((database.protocol, database.host, database.port), ('tcp', '172.17.0.5', 5432))
+        self.assertEqual(database.ports, (
+            envitro.docker.DockerPort(53, 'udp', '172.17.0.5'),
+            envitro.docker.DockerPort(5432, 'tcp', '172.17.0.5'),
+        ))
+
+        cache = links['LINKSCACHE']
+        self.assertEqual((cache.protocol, cache.host, cache.port), ('tcp', '172.17.0.6', 6379))
+        self.assertEqual(cache.ports, (envitro.docker.DockerPort(6379, 'tcp', '172.17.0.6'), ))
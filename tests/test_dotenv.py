@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import shutil
+import tempfile
+import unittest
+
+import envitro
+import envitro.dotenv
+
+DOTENV = '''# a comment
+PLAIN=value
+export EXPORTED = spaced value  # trailing comment
+HASH=a#b
+EMPTY=
+SINGLE='literal \\n $HOME'
+DOUBLE="tab\\tquote\\" backslash\\\\"
+MULTILINE="line 1
+line 2"
+MULTILINE_SINGLE='a
+  b'
+'''
+
+
+class TestDotenvParse(unittest.TestCase):
+
+    def test_parse(self):
+        values = dict(envitro.dotenv.parse(DOTENV.splitlines(True)))
+        self.assertEqual(values, {
+            'PLAIN': 'value',
+            'EXPORTED': 'spaced value',
+            'HASH': 'a#b',
+            'EMPTY': '',
+            'SINGLE': 'literal \\n $HOME',
+            'DOUBLE': 'tab\tquote" backslash\\',
+            'MULTILINE': 'line 1\nline 2',
+            'MULTILINE_SINGLE': 'a\n  b',
+        })
+
+    def test_order(self):
+        self.assertEqual(list(envitro.dotenv.parse(['B=1', 'A=2', 'B=3'])), [('B', '1'), ('A', '2'), ('B', '3')])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(envitro.dotenv.parse(['NOT AN ASSIGNMENT']))
+        with self.assertRaises(ValueError):
+            list(envitro.dotenv.parse(['OPEN="never closed\n', 'still open\n']))
+
+
+class TestDotenvLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, '.env')
+        with open(self.path, 'w') as env_file:
+            env_file.write('DOTENV_NEW=new\nDOTENV_EXISTING=file\n')
+        os.environ['DOTENV_EXISTING'] = 'process'
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        for name in ('DOTENV_NEW', 'DOTENV_EXISTING'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def test_apply(self):
+        values = envitro.dotenv.load(self.path)
+        self.assertEqual(values, {'DOTENV_NEW': 'new', 'DOTENV_EXISTING': 'file'})
+        self.assertEqual(os.environ['DOTENV_NEW'], 'new')
+        self.assertEqual(os.environ['DOTENV_EXISTING'], 'process')
+
+    def test_apply_override(self):
+        envitro.dotenv.load(self.path, override=True)
+        self.assertEqual(os.environ['DOTENV_EXISTING'], 'file')
+
+    def test_source(self):
+        values = envitro.dotenv.load(self.path, apply=False)
+        try:
+            self.assertNotIn('DOTENV_NEW', os.environ)
+            self.assertEqual(envitro.str('DOTENV_NEW'), 'new')
+            self.assertTrue(envitro.isset('DOTENV_NEW'))
+            self.assertEqual(envitro.str('DOTENV_EXISTING'), 'process')
+        finally:
+            envitro.remove_source(values)
+        self.assertFalse(envitro.isset('DOTENV_NEW'))
+
+    def test_source_typed(self):
+        with open(self.path, 'w') as env_file:
+            env_file.write('DOTENV_NEW=x, y\nDOTENV_EXISTING=3\n')
+        del os.environ['DOTENV_EXISTING']
+        values = envitro.dotenv.load(self.path, apply=False)
+        try:
+            self.assertEqual(envitro.list('DOTENV_NEW'), ['x', 'y'])
+            self.assertEqual(envitro.tuple('DOTENV_NEW'), ('x', 'y'))
+            self.assertEqual(envitro.int('DOTENV_EXISTING'), 3)
+            self.assertEqual(envitro.str('DOTENV_EXISTING'), '3')
+        finally:
+            envitro.remove_source(values)
+
+    def test_mmap(self):
+        threshold = envitro.dotenv.MMAP_THRESHOLD
+        envitro.dotenv.MMAP_THRESHOLD = 0
+        try:
+            self.assertEqual(dict(envitro.dotenv.read(self.path)), {'DOTENV_NEW': 'new', 'DOTENV_EXISTING': 'file'})
+        finally:
+            envitro.dotenv.MMAP_THRESHOLD = threshold
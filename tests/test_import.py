@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+import unittest
+
+import envitro
+
+# ``import envitro`` may take this many times as long as an empty package of two modules (~0.1ms on a
+# typical machine, so the budget is ~0.5ms), measuring against it scales the budget to slower machines
+IMPORT_RATIO = float(os.environ.get('ENVITRO_IMPORT_RATIO', '5'))
+
+EMPTY_PACKAGE = 'envitro_empty_package'
+
+
+class TestImport(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache)
+
+    def python(self, *args):
+        environ = dict(os.environ, PYTHONPYCACHEPREFIX=self.cache)
+        environ.pop('PYTHONDONTWRITEBYTECODE', None)
+        environ.pop('ENVITRO_RECORD', None)
+        process = subprocess.Popen([sys.executable] + list(args), env=environ, stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE, cwd=os.path.dirname(os.path.dirname(envitro.__file__)))
+        stdout, stderr = process.communicate()
+        self.assertEqual(process.returncode, 0, stderr)
+        return stdout.decode('utf-8'), stderr.decode('utf-8')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires module __getattr__')
+    def test_lazy_submodules(self):
+        stdout, _ = self.python('-c', 'import envitro, sys; print(sorted(m for m in sys.modules if "envitro" in m))')
+        self.assertEqual(stdout.strip(), "['envitro', 'envitro.core']")
+
+        stdout, _ = self.python('-c', 'import envitro; print(envitro.Snapshot.__module__, envitro.schema.Field)')
+        self.assertIn('envitro.snapshot', stdout)
+        self.assertIn('envitro.schema.Field', stdout)
+
+        with self.assertRaises(AttributeError):
+            envitro.does_not_exist  # pylint: disable=W0104
+        self.assertIn('sources', dir(envitro))
+
+    def test_no_leaked_modules(self):
+        leaked = [name for name, value in vars(envitro).items() if isinstance(value, types.ModuleType) and
+                  not name.startswith('_') and name != 'core' and name not in envitro._SUBMODULES]
+        self.assertEqual(leaked, [])
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'requires -X importtime and PYTHONPYCACHEPREFIX')
+    def test_import_time(self):
+        package = os.path.join(self.cache, 'path', EMPTY_PACKAGE)
+        os.makedirs(package)
+        with open(os.path.join(package, '__init__.py'), 'w') as init_file:
+            init_file.write('from .core import *\n')
+        with open(os.path.join(package, 'core.py'), 'w') as core_file:
+            core_file.write('VALUE = 1\n')
+
+        code = 'import sys; sys.path.insert(0, {0!r}); import {1}; import envitro'.format(
+            os.path.dirname(package), EMPTY_PACKAGE)
+        self.python('-c', code)  # compile the bytecode cache
+
+        timings = {EMPTY_PACKAGE: [], 'envitro': []}
+        for _ in range(5):
+            _, stderr = self.python('-X', 'importtime', '-c', code)
+            for line in stderr.splitlines():
+                fields = [field.strip() for field in line.split('|')]
+                if len(fields) == 3 and fields[2] in timings:
+                    timings[fields[2]].append(int(fields[1]))
+        envitro_time = min(timings['envitro'])
+        budget = min(timings[EMPTY_PACKAGE]) * IMPORT_RATIO
+        self.assertLess(envitro_time, budget, '"import envitro" took {0}us, over the {1:.0f}us budget'.format(
+            envitro_time, budget))
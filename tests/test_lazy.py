@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import unittest
+
+import envitro
+
+
+class TestLazy(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['LAZY_INT'] = ' 30 '
+        os.environ['LAZY_LIST'] = 'a,b'
+        if 'LAZY_MISSING' in os.environ:
+            del os.environ['LAZY_MISSING']
+
+    def tearDown(self):
+        for name in ('LAZY_INT', 'LAZY_LIST'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def test_deferred(self):
+        value = envitro.lazy.int('LAZY_INT')
+        self.assertFalse(value.resolved)
+        os.environ['LAZY_INT'] = '40'
+        self.assertEqual(value, 40)
+        self.assertTrue(value.resolved)
+        os.environ['LAZY_INT'] = '50'
+        self.assertEqual(value.get(), 40)
+        value.reset()
+        self.assertEqual(value.get(), 50)
+
+    def test_missing_deferred(self):
+        value = envitro.lazy.int('LAZY_MISSING')
+        with self.assertRaises(KeyError):
+            value.get()
+        self.assertEqual(envitro.lazy.int('LAZY_MISSING', allow_none=True).get(), None)
+        self.assertEqual(envitro.lazy.str('LAZY_MISSING', fallback='LAZY_INT').get(), '30')
+        self.assertEqual(envitro.lazy.read('LAZY_MISSING', 'raw').get(), 'raw')
+
+    def test_proxy(self):
+        value = envitro.lazy.int('LAZY_INT')
+        self.assertEqual(value + 1, 31)
+        self.assertEqual(1 + value, 31)
+        self.assertEqual(value * 2, 60)
+        self.assertEqual(-value, -30)
+        self.assertTrue(value > 10)
+        self.assertEqual(int(value), 30)
+        self.assertEqual(float(value), 30.0)
+        self.assertEqual(str(value), '30')
+        self.assertEqual('{0:03d}'.format(value), '030')
+        self.assertEqual(list(range(value))[-1], 29)
+        self.assertEqual(value.bit_length(), 5)
+        self.assertEqual({30: 'hit'}[value], 'hit')
+
+    def test_proxy_container(self):
+        value = envitro.lazy.list('LAZY_LIST')
+        self.assertEqual(len(value), 2)
+        self.assertIn('a', value)
+        self.assertEqual(value[1], 'b')
+        self.assertEqual(list(value), ['a', 'b'])
+        self.assertEqual(envitro.lazy.tuple('LAZY_LIST', separator=';').get(), ('a,b', ))
+
+    def test_descriptor(self):
+        class Settings(object):
+            timeout = envitro.lazy.int('LAZY_INT')
+            debug = envitro.lazy.bool('LAZY_MISSING', False)
+            ratio = envitro.lazy.float('LAZY_INT')
+
+        self.assertEqual(Settings.timeout, 30)
+        self.assertIs(Settings().debug, False)
+        self.assertEqual(Settings.ratio, 30.0)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import unittest
+
+import envitro
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['METRICS_INT'] = '5'
+        os.environ['METRICS_BAD'] = 'nope'
+        if 'METRICS_MISSING' in os.environ:
+            del os.environ['METRICS_MISSING']
+        envitro.metrics.reset()
+        envitro.metrics.enable()
+
+    def tearDown(self):
+        envitro.metrics.disable()
+        envitro.metrics.reset()
+        for name in ('METRICS_INT', 'METRICS_BAD'):
+            del os.environ[name]
+
+    def test_counters(self):
+        self.assertEqual(envitro.int('METRICS_INT'), 5)
+        self.assertEqual(envitro.int('METRICS_MISSING', fallback='METRICS_INT'), 5)
+        self.assertEqual(envitro.str('METRICS_MISSING', 'default'), 'default')
+        self.assertEqual(envitro.read('METRICS_INT'), '5')
+        with self.assertRaises(KeyError):
+            envitro.list('METRICS_MISSING')
+        with self.assertRaises(ValueError):
+            envitro.bool('METRICS_BAD')
+
+        metrics = envitro.metrics.as_dict()
+        self.assertEqual(metrics['METRICS_INT']['reads'], 2)
+        self.assertEqual(metrics['METRICS_INT']['hits'], 2)
+        self.assertEqual(metrics['METRICS_MISSING']['reads'], 3)
+        self.assertEqual(metrics['METRICS_MISSING']['fallback_hits'], 1)
+        self.assertEqual(metrics['METRICS_MISSING']['default_hits'], 1)
+        self.assertEqual(metrics['METRICS_MISSING']['misses'], 1)
+        self.assertEqual(metrics['METRICS_MISSING']['parse_errors'], 0)
+        self.assertEqual(metrics['METRICS_BAD']['parse_errors'], 1)
+        self.assertTrue(metrics['METRICS_INT']['parse_seconds'] > 0)
+        self.assertEqual(envitro.metrics.most_read(1), [('METRICS_MISSING', 3)])
+
+    def test_disabled(self):
+        envitro.metrics.disable()
+        envitro.int('METRICS_INT')
+        self.assertEqual(envitro.metrics.as_dict(), {})
+
+    def test_casters(self):
+        envitro.casters.decimal('METRICS_INT')
+        self.assertEqual(envitro.metrics.as_dict()['METRICS_INT']['hits'], 1)
+
+    def test_batch_schema_and_plan(self):
+        self.assertEqual(envitro.ints({'METRICS_INT': None, 'METRICS_MISSING': 1}), {'METRICS_INT': 5,
+                                                                                      'METRICS_MISSING': 1})
+        with self.assertRaises(KeyError):
+            envitro.read_many(['METRICS_MISSING'])
+
+        class Settings(envitro.schema.Schema):
+            value = envitro.schema.Field(envitro.int, 'METRICS_INT')
+            alias = envitro.schema.Field(envitro.int, 'METRICS_MISSING', fallback='METRICS_INT')
+        Settings()
+
+        self.assertEqual(envitro.plan('METRICS_MISSING', ['METRICS_INT']).int(), 5)
+        with self.assertRaises(ValueError):
+            envitro.plan('METRICS_BAD').bool()
+
+        metrics = envitro.metrics.as_dict()
+        self.assertEqual(metrics['METRICS_INT']['reads'], 2)
+        self.assertEqual(metrics['METRICS_MISSING']['reads'], 4)
+        self.assertEqual(metrics['METRICS_MISSING']['default_hits'], 1)
+        self.assertEqual(metrics['METRICS_MISSING']['misses'], 1)
+        self.assertEqual(metrics['METRICS_MISSING']['fallback_hits'], 2)
+        self.assertEqual(metrics['METRICS_BAD']['parse_errors'], 1)
+
+    def test_prometheus(self):
+        envitro.int('METRICS_INT')
+        text = envitro.metrics.prometheus()
+        self.assertIn('# TYPE envitro_reads_total counter\n', text)
+        self.assertIn('envitro_reads_total{variable="METRICS_INT"} 1\n', text)
+        self.assertIn('envitro_misses_total{variable="METRICS_INT"} 0\n', text)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import unittest
+
+import envitro
+
+
+class TestPrefixed(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['PREFIX_CACHE_TTL'] = ' 60 '
+        os.environ['PREFIX_CACHE_SIZE'] = '512'
+        os.environ['PREFIX_CACHEX'] = 'other'
+        os.environ['PREFIX_OTHER'] = 'other'
+
+    def tearDown(self):
+        for name in list(os.environ):
+            if name.startswith('PREFIX_'):
+                del os.environ[name]
+
+    def test_prefixed(self):
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '60', 'SIZE': '512'})
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_', strip=False),
+                         {'PREFIX_CACHE_TTL': '60', 'PREFIX_CACHE_SIZE': '512'})
+        self.assertEqual(envitro.prefixed('PREFIX_NOPE_'), {})
+
+    def test_cast(self):
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_', cast=envitro.int), {'TTL': 60, 'SIZE': 512})
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_S', cast=len), {'IZE': 3})
+
+    def test_write(self):
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '60', 'SIZE': '512'})
+        envitro.write('PREFIX_CACHE_NEW', 'new')
+        envitro.write('PREFIX_CACHE_TTL', None)
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'NEW': 'new', 'SIZE': '512'})
+
+    def test_direct_environ(self):
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '60', 'SIZE': '512'})
+        os.environ['PREFIX_CACHE_DIRECT'] = 'direct'
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_')['DIRECT'], 'direct')
+
+    def test_direct_environ_then_write(self):
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '60', 'SIZE': '512'})
+        os.environ['PREFIX_CACHE_DIRECT'] = 'direct'
+        envitro.write('PREFIX_CACHE_TTL', '3')
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '3', 'SIZE': '512', 'DIRECT': 'direct'})
+        del os.environ['PREFIX_CACHE_DIRECT']
+        envitro.write('PREFIX_CACHE_NEW', 'new')
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '3', 'SIZE': '512', 'NEW': 'new'})
+
+    def test_same_size_change(self):
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '60', 'SIZE': '512'})
+        del os.environ['PREFIX_OTHER']
+        os.environ['PREFIX_CACHE_DIRECT'] = 'direct'
+        self.assertEqual(envitro.prefixed('PREFIX_CACHE_'), {'TTL': '60', 'SIZE': '512', 'DIRECT': 'direct'})
+
+    def test_overrides_and_sources(self):
+        source = {'PREFIX_CACHE_SOURCE': 'source', 'PREFIX_CACHE_SIZE': 'hidden'}
+        envitro.add_source(source)
+        try:
+            with envitro.override(PREFIX_CACHE_TTL=None, PREFIX_CACHE_CONTEXT='context'):
+                self.assertEqual(envitro.prefixed('PREFIX_CACHE_'),
+                                 {'SIZE': '512', 'SOURCE': 'source', 'CONTEXT': 'context'})
+        finally:
+            envitro.remove_source(source)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import envitro
+
+
+class TestRecorder(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['RECORDER_INT'] = '5'
+        if 'RECORDER_MISSING' in os.environ:
+            del os.environ['RECORDER_MISSING']
+
+    def tearDown(self):
+        del os.environ['RECORDER_INT']
+
+    def test_record(self):
+        with envitro.recorder.Recorder() as recorder:
+            envitro.int('RECORDER_INT')
+            envitro.str('RECORDER_MISSING', fallback='RECORDER_INT')
+            envitro.bool('RECORDER_MISSING', False)
+        envitro.int('RECORDER_INT')
+
+        self.assertEqual([(record.getter, record.name, record.source, record.alias) for record in recorder.records], [
+            ('int', 'RECORDER_INT', 'env', 'RECORDER_INT'),
+            ('str', 'RECORDER_MISSING', 'fallback', 'RECORDER_INT'),
+            ('bool', 'RECORDER_MISSING', 'default', None),
+        ])
+        self.assertIn('test_recorder.py', recorder.records[0].site)
+        self.assertIn('test_record', recorder.records[0].site)
+
+    def test_snapshot_plan_and_prefixed(self):
+        snapshot = envitro.Snapshot()
+        with envitro.recorder.Recorder() as recorder:
+            snapshot.int('RECORDER_INT')
+            snapshot.int('RECORDER_INT')
+            snapshot.read('RECORDER_MISSING', fallback='RECORDER_INT')
+            envitro.plan('RECORDER_INT').int()
+            envitro.prefixed('RECORDER_', cast=envitro.int)
+            envitro.ints(['RECORDER_INT'])
+
+        self.assertEqual([(record.getter, record.name, record.source) for record in recorder.records], [
+            ('int', 'RECORDER_INT', 'env'),
+            ('int', 'RECORDER_INT', 'env'),
+            ('read', 'RECORDER_MISSING', 'fallback'),
+            ('int', 'RECORDER_INT', 'env'),
+            ('prefixed', 'RECORDER_INT', 'env'),
+            ('ints', 'RECORDER_INT', 'env'),
+        ])
+        self.assertTrue(all('test_recorder.py' in record.site for record in recorder.records))
+
+    def test_limit(self):
+        with envitro.recorder.Recorder(limit=2) as recorder:
+            for _ in range(3):
+                envitro.int('RECORDER_INT')
+            self.assertNotIn(recorder, envitro.core._observers)
+        self.assertEqual(len(recorder.records), 2)
+
+    def test_report(self):
+        with envitro.recorder.Recorder() as recorder:
+            envitro.int('RECORDER_INT')
+            envitro.int('RECORDER_INT')
+
+        report = recorder.report()
+        self.assertIn('envitro: 2 reads of 1 variables', report)
+        self.assertIn('RECORDER_INT', report)
+        self.assertEqual(len(recorder.sites()), 2)
+
+        document = json.loads(recorder.as_json())
+        self.assertEqual(len(document['records']), 2)
+        self.assertEqual(document['records'][0]['name'], 'RECORDER_INT')
+
+    def test_environment_flag(self):
+        environ = dict(os.environ, ENVITRO_RECORD='json')
+        output = subprocess.check_output(
+            [sys.executable, '-c', 'import envitro; envitro.int("RECORDER_INT")'],
+            env=environ, stderr=subprocess.STDOUT)
+        document = json.loads(output.decode('utf-8'))
+        self.assertEqual(document['records'][0]['name'], 'RECORDER_INT')
+        self.assertIn('<string>', document['records'][0]['site'])
+
+    def test_environment_flag_disabled(self):
+        for value in ('0', 'false', ''):
+            environ = dict(os.environ, ENVITRO_RECORD=value)
+            output = subprocess.check_output(
+                [sys.executable, '-c', 'import envitro; envitro.int("RECORDER_INT")'],
+                env=environ, stderr=subprocess.STDOUT)
+            self.assertEqual(output, b'', value)
+
+    def test_stop_startup(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'report.json')
+            environ = dict(os.environ, ENVITRO_RECORD='json', ENVITRO_RECORD_FILE=path)
+            code = 'import envitro; envitro.int("RECORDER_INT"); {0} envitro.str("RECORDER_INT")'
+            environ.pop('ENVITRO_RECORD_LIMIT', None)
+            for stop, limit in (('envitro.recorder.stop_startup();', None), ('', '1')):
+                if limit is not None:
+                    environ['ENVITRO_RECORD_LIMIT'] = limit
+                subprocess.check_call([sys.executable, '-c', code.format(stop)], env=environ)
+                with open(path) as report_file:
+                    document = json.load(report_file)
+                self.assertEqual([record['getter'] for record in document['records']], ['int'])
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import unittest
+
+import envitro
+from envitro.schema import Field, Schema
+
+
+class Config(Schema):
+    debug = Field(envitro.bool, 'SCHEMA_DEBUG', default=False)
+    timeout = Field(envitro.int, 'SCHEMA_TIMEOUT', fallback=['SCHEMA_LEGACY_TIMEOUT'])
+    hosts = Field(envitro.list, 'SCHEMA_HOSTS', separator=';')
+    name = Field(envitro.str, 'SCHEMA_NAME', allow_none=True)
+
+
+class ExtendedConfig(Config):
+    ratio = Field(envitro.float, 'SCHEMA_RATIO', default='0.5')
+
+
+class TestSchema(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SCHEMA_LEGACY_TIMEOUT'] = ' 30 '
+        os.environ['SCHEMA_HOSTS'] = 'a; b'
+        for name in ('SCHEMA_DEBUG', 'SCHEMA_TIMEOUT', 'SCHEMA_NAME', 'SCHEMA_RATIO'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def test_resolve(self):
+        config = Config()
+        self.assertEqual(config.debug, False)
+        self.assertEqual(config.timeout, 30)
+        self.assertEqual(config.hosts, ['a', 'b'])
+        self.assertEqual(config.name, None)
+
+    def test_inheritance(self):
+        config = ExtendedConfig()
+        self.assertEqual(config.ratio, 0.5)
+        self.assertEqual(config.timeout, 30)
+        self.assertEqual(sorted(config.as_dict()), ['debug', 'hosts', 'name', 'ratio', 'timeout'])
+
+    def test_environ(self):
+        config = Config({'SCHEMA_TIMEOUT': '5', 'SCHEMA_HOSTS': 'x', 'SCHEMA_DEBUG': 'yes'})
+        self.assertEqual(config.timeout, 5)
+        self.assertEqual(config.hosts, ['x'])
+        self.assertTrue(config.debug)
+
+    def test_immutable(self):
+        config = Config()
+        with self.assertRaises(AttributeError):
+            config.timeout = 10
+        with self.assertRaises(AttributeError):
+            config.other = 10
+        self.assertFalse(hasattr(config, '__dict__'))
+
+    def test_missing(self):
+        with self.assertRaises(KeyError) as context:
+            Config({})
+        self.assertIn('SCHEMA_TIMEOUT', str(context.exception))
+        self.assertIn('SCHEMA_HOSTS', str(context.exception))
+
+    def test_invalid_getter(self):
+        with self.assertRaises(TypeError):
+            Field(envitro.read)
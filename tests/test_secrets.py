@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+import envitro
+import envitro.secrets
+
+
+class TestSecrets(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.names = []
+        for index in range(4):
+            name = 'SECRET_{0}'.format(index)
+            path = os.path.join(self.directory, name.lower())
+            with open(path, 'w') as secret_file:
+                secret_file.write('secret{0}\n'.format(index))
+            os.environ[name + '_FILE'] = path
+            self.names.append(name)
+        self.source = envitro.secrets.enable()
+
+    def tearDown(self):
+        envitro.secrets.disable()
+        shutil.rmtree(self.directory)
+        for name in self.names:
+            del os.environ[name + '_FILE']
+        if 'SECRET_0' in os.environ:
+            del os.environ['SECRET_0']
+
+    def test_read(self):
+        self.assertEqual(envitro.str('SECRET_0'), 'secret0')
+        self.assertEqual(envitro.read('SECRET_1'), 'secret1\n')
+        self.assertFalse(envitro.isset('SECRET_MISSING'))
+        os.environ['SECRET_0'] = 'environ'
+        self.assertEqual(envitro.str('SECRET_0'), 'environ')
+
+    def test_disable(self):
+        envitro.secrets.disable()
+        self.assertFalse(envitro.isset('SECRET_0'))
+
+    def test_enable_invalidates_snapshot(self):
+        envitro.secrets.disable()
+        snapshot = envitro.Snapshot()
+        self.assertIsNone(snapshot.str('SECRET_0', allow_none=True))
+        envitro.secrets.enable()
+        self.assertEqual(snapshot.str('SECRET_0'), 'secret0')
+
+    def test_unreadable_file(self):
+        os.environ['SECRET_GONE_FILE'] = os.path.join(self.directory, 'gone')
+        self.names.append('SECRET_GONE')
+        self.assertEqual(envitro.str('SECRET_GONE', 'default'), 'default')
+        self.assertFalse(envitro.isset('SECRET_GONE'))
+        with self.assertRaises(KeyError):
+            envitro.str('SECRET_GONE')
+        values = envitro.strs({'SECRET_0': None, 'SECRET_1': None, 'SECRET_GONE': 'default'})
+        self.assertEqual(values['SECRET_GONE'], 'default')
+
+    def test_cached(self):
+        self.assertEqual(envitro.str('SECRET_0'), 'secret0')
+        with mock.patch('io.open') as mock_open:
+            self.assertEqual(envitro.str('SECRET_0'), 'secret0')
+            self.assertFalse(mock_open.called)
+
+        with open(os.path.join(self.directory, 'secret_0'), 'w') as secret_file:
+            secret_file.write('rotated value')
+        self.assertEqual(envitro.str('SECRET_0'), 'rotated value')
+
+    def test_batch(self):
+        with mock.patch.object(self.source, 'read_file', wraps=self.source.read_file) as read_file:
+            values = envitro.strs(self.names)
+        self.assertEqual(values, dict((name, 'secret{0}'.format(index)) for index, name in enumerate(self.names)))
+        self.assertEqual(len(set(call[0][0] for call in read_file.call_args_list)), 4)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import shutil
+import tempfile
+import unittest
+
+import envitro
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SNAP_INT'] = ' 42 '
+        os.environ['SNAP_LIST'] = 'a;b;c'
+        os.environ['SNAP_FALLBACK'] = 'yes'
+        if 'SNAP_MISSING' in os.environ:
+            del os.environ['SNAP_MISSING']
+        self.snapshot = envitro.Snapshot()
+
+    def tearDown(self):
+        for name in ('SNAP_INT', 'SNAP_LIST', 'SNAP_FALLBACK', 'SNAP_MISSING'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def test_typed(self):
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 42)
+        self.assertEqual(self.snapshot.str('SNAP_INT'), '42')
+        self.assertEqual(self.snapshot.read('SNAP_INT'), ' 42 ')
+        self.assertEqual(self.snapshot.list('SNAP_LIST', separator=';'), ['a', 'b', 'c'])
+        self.assertEqual(self.snapshot.tuple('SNAP_LIST', separator=';'), ('a', 'b', 'c'))
+        self.assertTrue(self.snapshot.bool('SNAP_MISSING', fallback=['SNAP_FALLBACK']))
+
+    def test_default(self):
+        self.assertEqual(self.snapshot.int('SNAP_MISSING', '7'), 7)
+        self.assertEqual(self.snapshot.int('SNAP_MISSING', allow_none=True), None)
+        self.assertFalse(self.snapshot.isset('SNAP_MISSING'))
+        with self.assertRaises(KeyError):
+            self.snapshot.int('SNAP_MISSING')
+
+    def test_memoized(self):
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 42)
+        os.environ['SNAP_INT'] = '1'
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 42)
+        self.snapshot.reset()
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 1)
+
+    def test_list_copy(self):
+        self.snapshot.list('SNAP_LIST', separator=';').append('d')
+        self.assertEqual(self.snapshot.list('SNAP_LIST', separator=';'), ['a', 'b', 'c'])
+
+    def test_write_invalidates(self):
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 42)
+        envitro.write('SNAP_INT', 3)
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 3)
+
+    def test_write_invalidates_fallback(self):
+        self.assertTrue(self.snapshot.bool('SNAP_MISSING', fallback='SNAP_FALLBACK'))
+        envitro.write('SNAP_MISSING', 'no')
+        self.assertFalse(self.snapshot.bool('SNAP_MISSING', fallback='SNAP_FALLBACK'))
+        envitro.write('SNAP_MISSING', None)
+        self.assertTrue(self.snapshot.bool('SNAP_MISSING', fallback='SNAP_FALLBACK'))
+
+    def test_decorator_invalidates(self):
+        @envitro.decorators.write('SNAP_INT', '5')
+        def myfunc():
+            return self.snapshot.int('SNAP_INT')
+
+        self.assertEqual(myfunc(), 5)
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 42)
+
+    def test_override(self):
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 42)
+        with envitro.override(SNAP_INT='5', SNAP_MISSING='no', SNAP_FALLBACK=None):
+            self.assertEqual(self.snapshot.int('SNAP_INT'), 5)
+            self.assertEqual(self.snapshot.read('SNAP_INT'), '5')
+            self.assertFalse(self.snapshot.bool('SNAP_MISSING', fallback='SNAP_FALLBACK'))
+            self.assertFalse(self.snapshot.isset('SNAP_FALLBACK'))
+            with envitro.override(SNAP_MISSING=None):
+                self.assertIsNone(self.snapshot.bool('SNAP_MISSING', allow_none=True, fallback='SNAP_FALLBACK'))
+        self.assertEqual(self.snapshot.int('SNAP_INT'), 42)
+        self.assertTrue(self.snapshot.bool('SNAP_MISSING', fallback='SNAP_FALLBACK'))
+        self.assertTrue(self.snapshot.isset('SNAP_FALLBACK'))
+
+
+class TestFrozenSnapshot(unittest.TestCase):
+
+    class Config(envitro.schema.Schema):
+        number = envitro.schema.Field(envitro.int, 'FROZEN_INT')
+        hosts = envitro.schema.Field(envitro.list, 'FROZEN_MISSING', fallback='FROZEN_LIST', separator=';')
+        debug = envitro.schema.Field(envitro.bool, 'FROZEN_UNSET', default=False)
+        size = envitro.schema.Field(envitro.casters.decimal, 'FROZEN_INT')
+
+    def setUp(self):
+        os.environ['FROZEN_INT'] = '42'
+        os.environ['FROZEN_LIST'] = 'a;b'
+        for name in ('FROZEN_MISSING', 'FROZEN_UNSET'):
+            if name in os.environ:
+                del os.environ[name]
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'config.envf')
+
+        snapshot = envitro.Snapshot()
+        snapshot.prime(self.Config)
+        snapshot.save(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        for name in ('FROZEN_INT', 'FROZEN_LIST'):
+            del os.environ[name]
+
+    def test_load(self):
+        snapshot = envitro.Snapshot.load(self.path)
+        self.assertTrue(snapshot.frozen)
+        self.assertEqual(snapshot._values[('int', ('FROZEN_INT', ), None)], 42)
+        self.assertEqual(snapshot.int('FROZEN_INT'), 42)
+        self.assertEqual(snapshot.list('FROZEN_MISSING', fallback='FROZEN_LIST', separator=';'), ['a', 'b'])
+        self.assertFalse(snapshot.bool('FROZEN_UNSET', False))
+        self.assertEqual(snapshot.str('FROZEN_LIST'), 'a;b')
+
+    def test_unserializable_skipped(self):
+        snapshot = envitro.Snapshot.load(self.path)
+        self.assertNotIn(('decimal', ('FROZEN_INT', ), None), snapshot._values)
+
+    def test_changed_environment(self):
+        os.environ['FROZEN_LIST'] = 'c'
+        snapshot = envitro.Snapshot.load(self.path)
+        self.assertFalse(snapshot.frozen)
+        self.assertEqual(snapshot.list('FROZEN_MISSING', fallback='FROZEN_LIST', separator=';'), ['c'])
+
+        os.environ['FROZEN_UNSET'] = 'yes'
+        os.environ['FROZEN_LIST'] = 'a;b'
+        self.assertFalse(envitro.Snapshot.load(self.path).frozen)
+
+    def test_non_ascii(self):
+        os.environ['FROZEN_LIST'] = 'é;ü'
+        snapshot = envitro.Snapshot()
+        snapshot.prime(self.Config)
+        snapshot.save(self.path)
+
+        snapshot = envitro.Snapshot.load(self.path)
+        self.assertTrue(snapshot.frozen)
+        self.assertEqual(snapshot.list('FROZEN_MISSING', fallback='FROZEN_LIST', separator=';'), ['é', 'ü'])
+
+    def test_invalid_file(self):
+        with open(self.path, 'r+b') as frozen_file:
+            frozen_file.write(b'XXXX')
+        self.assertFalse(envitro.Snapshot.load(self.path).frozen)
+        self.assertFalse(envitro.Snapshot.load(os.path.join(self.directory, 'missing')).frozen)
+        self.assertEqual(envitro.Snapshot.load(self.path).int('FROZEN_INT'), 42)
+
+    def test_write_invalidates(self):
+        snapshot = envitro.Snapshot.load(self.path)
+        envitro.write('FROZEN_INT', '1')
+        self.assertEqual(snapshot.int('FROZEN_INT'), 1)
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import envitro
+from envitro import sources
+from envitro.sources import DirectorySource
+
+
+class TestDirectorySource(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.version = 0
+        self.publish({'DIR_HOST': 'db.local', 'DIR_PORT': '5432\n'})
+        self.source = DirectorySource(self.directory, poll_interval=None)
+        self.changes = []
+        self.source.subscribe(lambda source, names: self.changes.append(names))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def publish(self, values):
+        """Mimic the atomic ..data symlink swap of Kubernetes volumes."""
+        self.version += 1
+        version = '..{0}'.format(self.version)
+        os.mkdir(os.path.join(self.directory, version))
+        for name, value in values.items():
+            with open(os.path.join(self.directory, version, name), 'w') as value_file:
+                value_file.write(value)
+        os.symlink(version, os.path.join(self.directory, '..data_tmp'))
+        os.rename(os.path.join(self.directory, '..data_tmp'), os.path.join(self.directory, '..data'))
+        for name in values:
+            link = os.path.join(self.directory, name)
+            if not os.path.islink(link):
+                os.symlink(os.path.join('..data', name), link)
+
+    def test_get(self):
+        self.assertEqual(self.source.names(), ['DIR_HOST', 'DIR_PORT'])
+        self.assertEqual(self.source.get('DIR_HOST'), 'db.local')
+        self.assertEqual(self.source.get('DIR_MISSING', 'default'), 'default')
+
+    def test_core_getters(self):
+        envitro.add_source(self.source)
+        try:
+            self.assertEqual(envitro.int('DIR_PORT'), 5432)
+            self.assertEqual(envitro.str('DIR_MISSING', fallback='DIR_HOST'), 'db.local')
+        finally:
+            envitro.remove_source(self.source)
+
+    def test_reload(self):
+        self.assertEqual(self.source.get('DIR_HOST'), 'db.local')
+        self.assertEqual(self.source.get('DIR_PORT'), '5432\n')
+        self.assertEqual(self.source.refresh(), set())
+
+        self.publish({'DIR_HOST': 'db.local', 'DIR_PORT': '6543'})
+        self.assertEqual(self.source.get('DIR_PORT'), '5432\n')
+        self.assertEqual(self.source.refresh(), set(['DIR_PORT']))
+        self.assertEqual(self.source.get('DIR_PORT'), '6543')
+        self.assertEqual(self.changes, [set(['DIR_PORT'])])
+
+    def test_reload_file_removed(self):
+        self.assertEqual(self.source.get('DIR_PORT'), '5432\n')
+        self.publish({'DIR_HOST': 'db.local', 'DIR_PORT': '6543'})
+
+        def read_file(name):
+            raise IOError(2, 'No such file or directory', name)
+        self.source._read_file = read_file
+        self.assertIn('DIR_PORT', self.source.refresh())
+        self.assertIsNone(self.source.get('DIR_PORT'))
+        self.assertEqual(self.source.names(), ['DIR_HOST'])
+
+    def test_reload_invalidates_snapshot(self):
+        envitro.add_source(self.source)
+        try:
+            snapshot = envitro.Snapshot()
+            self.assertEqual(snapshot.int('DIR_PORT'), 5432)
+            self.publish({'DIR_HOST': 'db.local', 'DIR_PORT': '6543'})
+            self.source.refresh()
+            self.assertEqual(snapshot.int('DIR_PORT'), 6543)
+        finally:
+            envitro.remove_source(self.source)
+
+    def test_add_invalidates_snapshot(self):
+        snapshot = envitro.Snapshot()
+        self.assertIsNone(snapshot.str('DIR_HOST', allow_none=True))
+        envitro.add_source(self.source)
+        try:
+            self.assertEqual(snapshot.str('DIR_HOST'), 'db.local')
+        finally:
+            envitro.remove_source(self.source)
+        self.assertIsNone(snapshot.str('DIR_HOST', allow_none=True))
+
+    def test_plain_directory(self):
+        directory = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(directory, 'PLAIN'), 'w') as value_file:
+                value_file.write('1')
+            source = DirectorySource(directory, poll_interval=0)
+            self.assertEqual(source.get('PLAIN'), '1')
+            with open(os.path.join(directory, 'ADDED'), 'w') as value_file:
+                value_file.write('2')
+            self.assertEqual(source.get('ADDED'), '2')
+        finally:
+            shutil.rmtree(directory)
+
+
+class CountingProvider(sources.Provider):
+    name = 'counting'
+
+    def __init__(self, values, **kwargs):
+        super(CountingProvider, self).__init__(**kwargs)
+        self.values = values
+        self.lookups = 0
+
+    def lookup(self, name):
+        self.lookups += 1
+        return self.values.get(name)
+
+
+class TestProviders(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.environ['CHAIN_ENV'] = 'environment'
+        for name in ('CHAIN_DOTENV', 'CHAIN_MISSING'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def tearDown(self):
+        envitro.use_chain(None)
+        shutil.rmtree(self.directory)
+        del os.environ['CHAIN_ENV']
+
+    def path(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as content_file:
+            content_file.write(content)
+        return path
+
+    def test_cache(self):
+        provider = CountingProvider({'A': '1'}, maxsize=2)
+        self.assertEqual(provider.get('A'), '1')
+        self.assertEqual(provider.get('A'), '1')
+        self.assertEqual(provider.get('B', 'default'), 'default')
+        self.assertEqual(provider.get('B'), None)
+        self.assertEqual(provider.lookups, 2)
+
+        provider.get('C')
+        provider.get('A')
+        self.assertEqual(provider.lookups, 4)
+        provider.clear()
+        provider.get('C')
+        self.assertEqual(provider.lookups, 5)
+
+    def test_ttl(self):
+        provider = CountingProvider({'A': '1'}, ttl=0)
+        provider.get('A')
+        provider.get('A')
+        self.assertEqual(provider.lookups, 2)
+
+        provider = CountingProvider({'A': '1'}, ttl=60)
+        provider.get('A')
+        provider.values['A'] = '2'
+        self.assertEqual(provider.get('A'), '1')
+        provider._cache['A'] = ('1', provider._cache['A'][1] - 61)
+        self.assertEqual(provider.get('A'), '2')
+
+    def test_abstract(self):
+        class Incomplete(sources.Provider):
+            pass
+
+        class IncompleteFile(sources._FileProvider):  # pylint: disable=W0212
+            kind = 'incomplete'
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+        with self.assertRaises(TypeError):
+            IncompleteFile(self.path('.env', ''))
+
+    def test_files(self):
+        dotenv = sources.DotenvProvider(self.path('.env', 'A=dotenv\nB="two words"\n'), ttl=0)
+        self.assertEqual(dotenv.get('A'), 'dotenv')
+        self.assertEqual(dotenv.get('B'), 'two words')
+
+        config = self.path('config.json', json.dumps({'A': 'json', 'PORT': 80, 'DEBUG': True, 'NESTED': {'a': 1}}))
+        provider = sources.JsonFileProvider(config)
+        self.assertEqual(provider.get('A'), 'json')
+        self.assertEqual(provider.get('PORT'), '80')
+        self.assertEqual(provider.get('DEBUG'), 'true')
+        self.assertEqual(provider.get('NESTED'), '{"a": 1}')
+
+        ini = self.path('config.ini', '[DEFAULT]\nCamelCase = ini\n[app]\nA = section\n')
+        self.assertEqual(sources.IniFileProvider(ini).get('CamelCase'), 'ini')
+        self.assertEqual(sources.IniFileProvider(ini, 'app').get('A'), 'section')
+        self.assertEqual(sources.IniFileProvider(ini, 'other').get('A'), None)
+
+        self.assertEqual(sources.DotenvProvider(os.path.join(self.directory, 'missing')).get('A'), None)
+
+    def test_file_reloaded(self):
+        path = self.path('.env', 'A=1\n')
+        provider = sources.DotenvProvider(path, ttl=0)
+        self.assertEqual(provider.get('A'), '1')
+        self.path('.env', 'A=22\n')
+        self.assertEqual(provider.get('A'), '22')
+
+    def test_chain_not_memoized(self):
+        path = self.path('.env', 'CHAIN_OTHER=1\n')
+        envitro.use_chain(sources.Chain([sources.EnvironProvider(), sources.DotenvProvider(path, ttl=0)]))
+        snapshot = envitro.Snapshot()
+        self.assertIsNone(envitro.plan('CHAIN_DOTENV', ['CHAIN_MISSING']).read(allow_none=True))
+        self.assertIsNone(snapshot.str('CHAIN_DOTENV', allow_none=True))
+
+        self.path('.env', 'CHAIN_OTHER=1\nCHAIN_DOTENV=added\n')
+        self.assertEqual(envitro.plan('CHAIN_DOTENV', ['CHAIN_MISSING']).read(), 'added')
+        self.assertEqual(snapshot.str('CHAIN_DOTENV'), 'added')
+
+    def test_sqlite(self):
+        path = os.path.join(self.directory, 'config.db')
+        connection = sqlite3.connect(path)
+        connection.execute('CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT)')
+        connection.executemany('INSERT INTO settings VALUES (?, ?)', [('A', 'sqlite'), ('B', '2')])
+        connection.commit()
+        connection.close()
+
+        provider = sources.SqliteProvider(path, table='settings', key_column='key')
+        provider.prefetch(['A', 'B', 'C'])
+        self.assertEqual(set(provider._cache), set(['A', 'B', 'C']))
+        self.assertEqual(provider.get('A'), 'sqlite')
+        self.assertEqual(provider.get('C'), None)
+        provider.clear()
+        self.assertEqual(provider.get('B'), '2')
+        provider.close()
+
+        with self.assertRaises(ValueError):
+            sources.SqliteProvider(path, table='settings; DROP TABLE settings')
+
+    def test_chain(self):
+        dotenv = sources.DotenvProvider(self.path('.env', 'CHAIN_ENV=dotenv\nCHAIN_DOTENV=dotenv\n'))
+        chain = sources.Chain([sources.EnvironProvider(), dotenv])
+        envitro.use_chain(chain)
+
+        self.assertEqual(envitro.str('CHAIN_ENV'), 'environment')
+        self.assertEqual(chain.provider('CHAIN_ENV'), 'environ')
+        self.assertEqual(envitro.str('CHAIN_DOTENV'), 'dotenv')
+        self.assertEqual(chain.provider('CHAIN_DOTENV'), 'dotenv:' + dotenv.path)
+        self.assertEqual(envitro.str('CHAIN_MISSING', 'default'), 'default')
+        self.assertEqual(chain.provider('CHAIN_MISSING'), None)
+
+        chain.providers.reverse()
+        self.assertEqual(envitro.str('CHAIN_ENV'), 'dotenv')
+        self.assertEqual(envitro.Snapshot().str('CHAIN_DOTENV'), 'dotenv')
+
+        envitro.use_chain(None)
+        with self.assertRaises(KeyError):
+            envitro.str('CHAIN_DOTENV')
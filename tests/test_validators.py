@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=C0111
+import os
+import re
+import unittest
+
+import envitro
+from envitro.schema import Field, Schema
+from envitro.validators import (ValidationError, choices, length, maximum, minimum, predicate, regex,
+                                validated)
+
+
+class Config(Schema):
+    port = Field(envitro.int, 'RULES_PORT', rules=[minimum(1), maximum(65535)])
+    level = Field(envitro.str, 'RULES_LEVEL', default='info', rules=[choices(['debug', 'info'])])
+    hosts = Field(envitro.list, 'RULES_HOSTS', rules=[length(max=2), regex(r'[a-z.]+')])
+    workers = Field(envitro.int, 'RULES_WORKERS', default=1)
+
+
+class TestRules(unittest.TestCase):
+
+    def test_rules(self):
+        self.assertIsNone(minimum(1)(1))
+        self.assertEqual(minimum(1)(0), 'must be >= 1')
+        self.assertEqual(maximum(10)(11), 'must be <= 10')
+        self.assertIsNone(choices(['a', 'b'])('a'))
+        self.assertEqual(choices(['a', 'b'])('c'), "must be one of 'a', 'b'")
+        self.assertIsNone(length(1, 3)('ab'))
+        self.assertEqual(length(min=3)('ab'), 'must have a length >= 3')
+        self.assertIsNone(regex(r'\d+')('123'))
+        self.assertEqual(regex(r'\d+')('123a'), "must match '\\\\d+'")
+        self.assertIsNone(regex(re.compile('[a-z]+'))(['a', 'b']))
+        self.assertIsNotNone(regex('[a-z]+')(('a', '1')))
+        self.assertEqual(predicate(lambda value: value % 2 == 0, 'must be even')(3), 'must be even')
+        self.assertIsNone(choices(['a', 'b'])(['a', 'b']))
+        self.assertEqual(choices(['a', 'b'])(('a', 'c')), "must be one of 'a', 'b'")
+        self.assertIsNone(choices([1, 2])(frozenset([2])))
+
+    def test_compile(self):
+        check = envitro.validators.compile_rules([minimum(1), maximum(5), lambda value: None])
+        self.assertEqual(check(3), [])
+        self.assertEqual(check(None), [])
+        self.assertEqual(check(9), ['must be <= 5'])
+        self.assertEqual(envitro.validators.compile_rules([choices(['a'])])({'a': 1}), ["must be one of 'a', not dict"])
+        check = envitro.validators.compile_rules([minimum(1), maximum(5)])
+        self.assertEqual(check('3'), ['must be >= 1, not str', 'must be <= 5, not str'])
+        self.assertEqual(check([3]), ['must be >= 1, not list', 'must be <= 5, not list'])
+
+    def test_length_without_bounds(self):
+        with self.assertRaises(TypeError):
+            length()
+
+
+class TestValidated(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['RULES_PORT'] = '70000'
+
+    def tearDown(self):
+        del os.environ['RULES_PORT']
+
+    def test_validated(self):
+        port = validated(envitro.int, minimum(1), maximum(65535))
+        with self.assertRaises(ValidationError) as context:
+            port('RULES_PORT')
+        self.assertEqual(context.exception.errors, {'RULES_PORT': ['must be <= 65535']})
+        self.assertEqual(port('RULES_MISSING', 80), 80)
+        self.assertEqual(port('RULES_MISSING', allow_none=True), None)
+
+
+class TestValidateAll(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['RULES_PORT'] = '0'
+        os.environ['RULES_LEVEL'] = 'trace'
+        os.environ['RULES_HOSTS'] = 'a,b,C'
+        os.environ['RULES_RATIO'] = 'half'
+        for name in ('RULES_WORKERS', 'RULES_MISSING'):
+            if name in os.environ:
+                del os.environ[name]
+
+    def tearDown(self):
+        envitro.validators.undeclare()
+        for name in ('RULES_PORT', 'RULES_LEVEL', 'RULES_HOSTS', 'RULES_RATIO'):
+            del os.environ[name]
+
+    def test_schema(self):
+        with self.assertRaises(ValidationError) as context:
+            Config()
+        self.assertEqual(context.exception.errors, {
+            'RULES_PORT': ['must be >= 1'],
+            'RULES_LEVEL': ["must be one of 'debug', 'info'"],
+            'RULES_HOSTS': ['must have a length <= 2', "must match '[a-z.]+'"],
+        })
+        self.assertIn('"RULES_PORT" must be >= 1', str(context.exception))
+
+    def test_schema_valid(self):
+        os.environ['RULES_PORT'] = '80'
+        os.environ['RULES_LEVEL'] = 'debug'
+        os.environ['RULES_HOSTS'] = 'a.local'
+        self.assertEqual(Config().port, 80)
+        self.assertEqual(Config.validate(), {})
+
+    def test_schema_missing_and_invalid(self):
+        errors = Config.validate({'RULES_PORT': 'abc'})
+        self.assertEqual(sorted(errors), ['RULES_HOSTS', 'RULES_PORT'])
+        self.assertEqual(errors['RULES_HOSTS'], ['is not set'])
+        with self.assertRaises(ValidationError):
+            Config({'RULES_PORT': 'abc'})
+        with self.assertRaises(KeyError):
+            Config({'RULES_PORT': '80'})
+
+    def test_validate_all(self):
+        envitro.validators.declare(envitro.float, 'RULES_RATIO')
+        envitro.validators.declare(envitro.int, 'RULES_MISSING')
+        envitro.validators.declare(envitro.int, 'RULES_WORKERS', [minimum(1)], default=4)
+
+        errors = envitro.validators.check(Config)
+        self.assertEqual(sorted(errors), ['RULES_HOSTS', 'RULES_LEVEL', 'RULES_MISSING', 'RULES_PORT', 'RULES_RATIO'])
+        self.assertEqual(errors['RULES_MISSING'], ['is not set'])
+
+        with self.assertRaises(ValidationError) as context:
+            envitro.validators.validate_all(Config)
+        self.assertEqual(context.exception.errors, errors)
+
+        envitro.validators.undeclare('RULES_RATIO')
+        envitro.validators.undeclare('RULES_MISSING')
+        envitro.validators.validate_all()
+
+    def test_wrong_rule_type(self):
+        envitro.validators.declare(envitro.str, 'RULES_LEVEL', [minimum(1)])
+        envitro.validators.declare(envitro.list, 'RULES_HOSTS', [choices(['a', 'b'])])
+        errors = envitro.validators.check()
+        self.assertEqual(errors['RULES_HOSTS'], ["must be one of 'a', 'b'"])
+        self.assertEqual(errors['RULES_LEVEL'], ['must be >= 1, not str'])